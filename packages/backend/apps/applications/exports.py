@@ -0,0 +1,233 @@
+"""Streaming exports: payslip document archives and CSV extracts."""
+from __future__ import annotations
+
+import csv
+import io
+import logging
+import zipfile
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from .models import Payslip
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+PAYSLIP_ARCHIVE_KINDS = ("pdf", "aba")
+
+
+class _ArchiveSink(io.RawIOBase):
+    """Write-only, unseekable buffer that hands out what the ZIP writer produced so far."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def payslip_archive_name(payslip: Payslip, kind: str) -> str:
+    issued_on = timezone.localtime(payslip.created_at).date().isoformat()
+    return f"{issued_on}/payslip-{payslip.id}.{kind}"
+
+
+def stream_payslip_archive(
+    payslips: Iterable[Payslip], *, kinds: tuple[str, ...] = PAYSLIP_ARCHIVE_KINDS
+) -> Iterator[bytes]:
+    """Yield a ZIP archive of the payslips' files, copied from storage chunk by chunk.
+
+    The sink is unseekable, so ``zipfile`` writes each entry's sizes in a
+    trailing data descriptor instead of seeking back: only the current chunk
+    and the central directory (a few dozen bytes per file) are held in memory.
+    Files missing from storage are skipped and logged.
+    """
+
+    return (chunk for chunk in _archive_chunks(payslips, kinds) if chunk)
+
+
+def _archive_chunks(payslips: Iterable[Payslip], kinds: tuple[str, ...]) -> Iterator[bytes]:
+    sink = _ArchiveSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for payslip in payslips:
+            for kind in kinds:
+                field_file = getattr(payslip, f"{kind}_file")
+                if not field_file:
+                    continue
+                try:
+                    field_file.open("rb")
+                except OSError:
+                    logger.warning("Payslip %s %s file %s is missing from storage.", payslip.id, kind, field_file.name)
+                    continue
+                issued_at = timezone.localtime(payslip.created_at)
+                info = zipfile.ZipInfo(payslip_archive_name(payslip, kind), date_time=issued_at.timetuple()[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                try:
+                    with archive.open(info, mode="w", force_zip64=True) as entry:
+                        for chunk in field_file.chunks(EXPORT_CHUNK_SIZE):
+                            entry.write(chunk)
+                            yield sink.drain()
+                finally:
+                    field_file.close()
+                yield sink.drain()
+    yield sink.drain()
+
+
+class CsvColumn(NamedTuple):
+    lookup: str
+    convert: Callable | None = None
+
+
+def _local_iso(value):
+    return timezone.localtime(value).isoformat() if value else ""
+
+
+PAYSLIP_CSV_COLUMNS = {
+    "id": CsvColumn("id"),
+    "issued_at": CsvColumn("created_at", _local_iso),
+    "employer": CsvColumn("employer_name"),
+    "employer_abn": CsvColumn("employer_abn"),
+    "traveller": CsvColumn("traveller_name"),
+    "traveller_email": CsvColumn("traveller__email"),
+    "job_title": CsvColumn("offer__job__title"),
+    "pay_period_start": CsvColumn("pay_period_start"),
+    "pay_period_end": CsvColumn("pay_period_end"),
+    "hour_count": CsvColumn("hour_count"),
+    "rate_amount": CsvColumn("rate_amount"),
+    "rate_currency": CsvColumn("rate_currency"),
+    "gross_amount": CsvColumn("gross_amount"),
+    "commission_amount": CsvColumn("commission_amount"),
+    "net_before_tax": CsvColumn("net_before_tax"),
+    "tax_withheld": CsvColumn("tax_withheld"),
+    "super_amount": CsvColumn("super_amount"),
+    "net_payment": CsvColumn("net_payment"),
+    "status": CsvColumn("status"),
+    "instructions_status": CsvColumn("instructions_status"),
+}
+
+TIMESHEET_ENTRY_CSV_COLUMNS = {
+    "id": CsvColumn("id"),
+    "application_id": CsvColumn("timesheet__offer__application_id"),
+    "traveller_email": CsvColumn("timesheet__offer__traveller__email"),
+    "job_title": CsvColumn("timesheet__offer__job__title"),
+    "entry_date": CsvColumn("entry_date"),
+    "hours_worked": CsvColumn("hours_worked"),
+    "approved": CsvColumn("is_locked"),
+    "paid": CsvColumn("is_paid"),
+    "payment_status": CsvColumn("payment_status"),
+    "notes": CsvColumn("notes"),
+}
+
+HOURS_WORKED_CSV_COLUMNS = {
+    "id": CsvColumn("id"),
+    "application_id": CsvColumn("application_id"),
+    "worker_email": CsvColumn("worker__email"),
+    "job_title": CsvColumn("application__job__title"),
+    "date": CsvColumn("date"),
+    "hours": CsvColumn("hours"),
+    "approved": CsvColumn("approved"),
+    "note": CsvColumn("note"),
+}
+
+REGIONAL_WORK_CSV_COLUMNS = {
+    "work_date": CsvColumn("work_date"),
+    "hours": CsvColumn("hours"),
+    "counted": CsvColumn("counted"),
+    "employer": CsvColumn("employer__company_name"),
+    "employer_abn": CsvColumn("employer__abn"),
+    "job_title": CsvColumn("job__title"),
+    "job_location": CsvColumn("job__location"),
+    "postcode": CsvColumn("postcode"),
+    "approved_at": CsvColumn("approved_at", _local_iso),
+}
+
+CSV_EXPORT_CHUNK_SIZE = 2000
+CSV_ROWS_PER_WRITE = 500
+# Spreadsheets evaluate a cell starting with one of these as a formula.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def neutralise_formula(value):
+    """Prefix text that a spreadsheet would run as a formula with ``'`` so it is shown as typed."""
+
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the text instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv_rows(queryset, columns: dict[str, CsvColumn]) -> Iterator[str]:
+    """Yield the header, then the rows of ``queryset`` as CSV text in batches.
+
+    Rows come from ``values_list().iterator()``, which uses a server-side
+    cursor on PostgreSQL, so neither model instances nor the full result set
+    are ever materialised. Text read from the database (notes, names, titles)
+    goes through ``neutralise_formula`` so exported cells cannot run as
+    spreadsheet formulas.
+    """
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(list(columns))
+    converters = [(index, column.convert) for index, column in enumerate(columns.values()) if column.convert]
+    rows = queryset.values_list(*(column.lookup for column in columns.values())).iterator(
+        chunk_size=CSV_EXPORT_CHUNK_SIZE
+    )
+    batch = []
+    for row in rows:
+        row = [neutralise_formula(value) for value in row]
+        for index, convert in converters:
+            row[index] = convert(row[index])
+        batch.append(writer.writerow(row))
+        if len(batch) >= CSV_ROWS_PER_WRITE:
+            yield "".join(batch)
+            batch.clear()
+    if batch:
+        yield "".join(batch)
+
+
+def csv_export_response(
+    request, queryset, columns: dict[str, CsvColumn], *, date_lookup: str, ordering: tuple[str, ...], filename: str
+):
+    """Stream ``queryset`` as CSV, filtered by the request's ``start_date``/``end_date`` and ``columns``."""
+
+    params = request.query_params
+    for param, suffix in (("start_date", "gte"), ("end_date", "lte")):
+        raw_value = params.get(param)
+        if raw_value:
+            parsed = parse_date(raw_value)
+            if parsed is None:
+                raise ValidationError({param: "Use the YYYY-MM-DD format."})
+            queryset = queryset.filter(**{f"{date_lookup}__{suffix}": parsed})
+
+    requested = [name.strip() for name in params.get("columns", "").split(",") if name.strip()]
+    unknown = [name for name in requested if name not in columns]
+    if unknown:
+        raise ValidationError({"columns": f"Unknown columns: {', '.join(unknown)}. Choose from: {', '.join(columns)}."})
+    selected = {name: columns[name] for name in requested} if requested else columns
+
+    response = StreamingHttpResponse(
+        stream_csv_rows(queryset.order_by(*ordering), selected), content_type="text/csv; charset=utf-8"
+    )
+    stamp = timezone.localdate().isoformat()
+    response["Content-Disposition"] = f'attachment; filename="{filename}-{stamp}.csv"'
+    return response
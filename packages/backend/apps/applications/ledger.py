@@ -0,0 +1,215 @@
+"""Traveller earnings ledger, balance snapshots and snapshot-plus-delta reads.
+
+Approvals, payslips and payments append ``EarningsEntry`` rows; nothing is
+updated or deleted, a voided payslip is reversed with negated entries.
+``take_earnings_snapshots`` periodically folds the new entries of every
+traveller and employer into an ``EarningsSnapshot`` per financial year, so a
+balance is the latest snapshot plus the few entries appended since.
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import F, Max, Sum, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .models import EarningsEntry, EarningsSnapshot, Payslip
+from .tax import financial_year
+
+
+# Snapshot field for each entry kind; hours_approved sums ``hours``, the rest ``amount``.
+KIND_FIELDS = {
+    "hours_approved": "hours_approved",
+    "gross": "gross",
+    "tax_withheld": "tax_withheld",
+    "super": "super_amount",
+    "commission": "commission",
+    "net_paid": "net_paid",
+}
+SNAPSHOT_FIELDS = tuple(KIND_FIELDS.values())
+SCOPE_FIELDS = {"traveller": "traveller_id", "employer": "employer_id"}
+
+# Entries younger than this are left for the next snapshot, so rows from
+# transactions still in flight (lower ids committed late) are never skipped.
+SNAPSHOT_SETTLE_TIME = timedelta(minutes=5)
+
+
+def _payslip_year(payslip: Payslip) -> int:
+    return payslip.metadata.get("financial_year") or financial_year(timezone.localtime(payslip.created_at).date())
+
+
+def record_hours_approved(items: Iterable[tuple], *, on: date | None = None) -> None:
+    """Append ``hours_approved`` entries for ``(timesheet, offer, hours)`` triples."""
+
+    on = on or timezone.localdate()
+    year = financial_year(on)
+    EarningsEntry.objects.bulk_create(
+        [
+            EarningsEntry(
+                traveller_id=offer.traveller_id,
+                employer_id=offer.employer_id,
+                timesheet=timesheet,
+                kind="hours_approved",
+                hours=hours,
+                financial_year=year,
+                occurred_on=on,
+            )
+            for timesheet, offer, hours in items
+            if hours
+        ]
+    )
+
+
+def record_payslip_issued(payslip: Payslip, *, sign: int = 1) -> None:
+    """Append the gross, tax, super and commission of ``payslip``; ``sign=-1`` reverses them."""
+
+    year = _payslip_year(payslip)
+    on = timezone.localdate()
+    EarningsEntry.objects.bulk_create(
+        [
+            EarningsEntry(
+                traveller_id=payslip.traveller_id,
+                employer_id=payslip.employer_id,
+                timesheet_id=payslip.timesheet_id,
+                payslip=payslip if sign > 0 else None,
+                kind=kind,
+                amount=sign * amount,
+                financial_year=year,
+                occurred_on=on,
+            )
+            for kind, amount in (
+                ("gross", payslip.gross_amount),
+                ("tax_withheld", payslip.tax_withheld),
+                ("super", payslip.super_amount),
+                ("commission", payslip.commission_amount),
+            )
+        ]
+    )
+
+
+def record_payslips_paid(payslips: Iterable[Payslip]) -> None:
+    on = timezone.localdate()
+    EarningsEntry.objects.bulk_create(
+        [
+            EarningsEntry(
+                traveller_id=payslip.traveller_id,
+                employer_id=payslip.employer_id,
+                timesheet_id=payslip.timesheet_id,
+                payslip=payslip,
+                kind="net_paid",
+                amount=payslip.net_payment,
+                financial_year=_payslip_year(payslip),
+                occurred_on=on,
+            )
+            for payslip in payslips
+        ]
+    )
+
+
+def _empty_totals() -> dict[str, Decimal]:
+    return dict.fromkeys(SNAPSHOT_FIELDS, Decimal("0"))
+
+
+def _add_delta(totals: dict[str, Decimal], row: dict) -> None:
+    field = KIND_FIELDS[row["kind"]]
+    totals[field] += row["hours"] if row["kind"] == "hours_approved" else row["amount"]
+
+
+def earnings_balance(scope: str, subject_id: int, year: int) -> dict:
+    """Totals of one traveller or employer for ``year``: latest snapshot plus later entries (two queries)."""
+
+    snapshot = (
+        EarningsSnapshot.objects.filter(scope=scope, subject_id=subject_id, financial_year=year)
+        .order_by("-through_entry_id")
+        .first()
+    )
+    totals = {field: getattr(snapshot, field) for field in SNAPSHOT_FIELDS} if snapshot else _empty_totals()
+    through = snapshot.through_entry_id if snapshot else 0
+    entries = EarningsEntry.objects.filter(**{SCOPE_FIELDS[scope]: subject_id}, financial_year=year, id__gt=through)
+    for row in entries.order_by().values("kind").annotate(hours=Sum("hours"), amount=Sum("amount")):
+        _add_delta(totals, row)
+    net_earned = totals["gross"] - totals["commission"] - totals["tax_withheld"]
+    return {
+        **totals,
+        "net_earned": net_earned,
+        "outstanding": net_earned - totals["net_paid"],
+        "snapshot_through_entry_id": through or None,
+        "snapshot_at": snapshot.created_at if snapshot else None,
+    }
+
+
+@transaction.atomic
+def take_earnings_snapshots(*, settle: timedelta = SNAPSHOT_SETTLE_TIME) -> dict[str, int]:
+    """Snapshot every traveller and employer with entries since the previous run; returns counts per scope.
+
+    Each run snapshots *every* subject that gained entries after the scope's
+    previous high-water mark, so a subject's latest snapshot always covers
+    all of its entries up to that mark and the delta can be read from there.
+    """
+
+    through = (
+        EarningsEntry.objects.filter(created_at__lte=timezone.now() - settle).aggregate(last=Max("id"))["last"] or 0
+    )
+    created = {}
+    for scope, subject_field in SCOPE_FIELDS.items():
+        # Serialise runs on the scope's newest snapshot so two runs cannot interleave.
+        previous = (
+            EarningsSnapshot.objects.select_for_update()
+            .filter(scope=scope)
+            .order_by("-through_entry_id")
+            .values_list("through_entry_id", flat=True)
+            .first()
+            or 0
+        )
+        created[scope] = 0
+        if through <= previous:
+            continue
+        rows = (
+            EarningsEntry.objects.filter(id__gt=previous, id__lte=through)
+            .order_by()
+            .values(subject_field, "financial_year", "kind")
+            .annotate(hours=Sum("hours"), amount=Sum("amount"))
+        )
+        totals: dict[tuple[int, int], dict] = {}
+        for row in rows:
+            key = (row[subject_field], row["financial_year"])
+            _add_delta(totals.setdefault(key, _empty_totals()), row)
+        if not totals:
+            continue
+
+        latest = {
+            (snapshot.subject_id, snapshot.financial_year): snapshot
+            for snapshot in EarningsSnapshot.objects.filter(
+                scope=scope,
+                subject_id__in={subject_id for subject_id, _year in totals},
+                financial_year__in={year for _subject_id, year in totals},
+            )
+            .annotate(
+                recency=Window(
+                    RowNumber(),
+                    partition_by=[F("subject_id"), F("financial_year")],
+                    order_by=F("through_entry_id").desc(),
+                )
+            )
+            .filter(recency=1)
+        }
+
+        snapshots = []
+        for (subject_id, year), delta in totals.items():
+            base = latest.get((subject_id, year))
+            snapshots.append(
+                EarningsSnapshot(
+                    scope=scope,
+                    subject_id=subject_id,
+                    financial_year=year,
+                    through_entry_id=through,
+                    **{field: (getattr(base, field) if base else 0) + delta[field] for field in SNAPSHOT_FIELDS},
+                )
+            )
+        EarningsSnapshot.objects.bulk_create(snapshots, batch_size=500)
+        created[scope] = len(snapshots)
+    return created
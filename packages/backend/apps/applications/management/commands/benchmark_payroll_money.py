@@ -0,0 +1,53 @@
+"""Time the integer-cent payslip engine against the ``Decimal`` reference."""
+from __future__ import annotations
+
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.applications.money import (
+    PAYROLL_RATES,
+    PayslipComponents,
+    decimal_payslip_components,
+    from_cents,
+    payslip_components_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark batch payslip calculations in integer cents versus Decimal and check they agree."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--timesheets", type=int, default=100_000, help="Simulated timesheets in the pay run.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated rates and hours.")
+
+    def handle(self, *args, **options):
+        count = max(1, options.get("timesheets") or 1)
+        rng = random.Random(options.get("seed", 0))
+        # Rates between $20 and $60, up to 120 hours in quarter-hour steps.
+        pairs = [(rng.randint(2000, 6000), rng.randint(1, 480) * 25) for _ in range(count)]
+        decimal_pairs = [(from_cents(rate), from_cents(hours)) for rate, hours in pairs]
+
+        started = time.perf_counter()
+        expected = [decimal_payslip_components(rate, hours) for rate, hours in decimal_pairs]
+        decimal_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        components = payslip_components_batch(pairs, PAYROLL_RATES)
+        integer_seconds = time.perf_counter() - started
+
+        mismatches = sum(
+            1
+            for row, reference in zip(components, expected)
+            if PayslipComponents._make(row).as_payslip_fields() != reference
+        )
+        if mismatches:
+            raise CommandError(f"{mismatches} of {count} payslips differ from the Decimal reference.")
+
+        self.stdout.write(f"Decimal:       {decimal_seconds * 1000:9.1f} ms for {count} payslips")
+        self.stdout.write(f"Integer cents: {integer_seconds * 1000:9.1f} ms for {count} payslips")
+        self.stdout.write(
+            self.style.SUCCESS(f"Results identical; integer engine is {decimal_seconds / integer_seconds:.1f}x faster.")
+        )
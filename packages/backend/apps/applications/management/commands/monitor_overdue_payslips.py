@@ -1,13 +1,15 @@
 """Mark overdue payslips and suspend delinquent employers."""
 from __future__ import annotations
 
-from datetime import timedelta
+import time
+from datetime import datetime, time as day_start, timedelta
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
-from apps.applications.models import Payslip
+from apps.applications.overdue import OVERDUE_AFTER_DAYS, mark_overdue_payslips, overdue_candidates
+from apps.users.models import Employer
 
 
 class Command(BaseCommand):
@@ -19,60 +21,70 @@ class Command(BaseCommand):
             action="store_true",
             help="Only report what would change without writing to the database.",
         )
+        parser.add_argument(
+            "--since",
+            help=(
+                "Start of the previous run (the printed watermark, or a YYYY-MM-DD date): only consider payslips "
+                "that became overdue candidates after it."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Payslips flagged per UPDATE statement.",
+        )
 
     def handle(self, *args, **options):
+        started = time.monotonic()
+        run_at = timezone.now()
         dry_run = options.get("dry_run", False)
-        cutoff = timezone.now().date() - timedelta(days=7)
+        chunk_size = max(1, options.get("chunk_size") or 1000)
+        cutoff = timezone.localdate(run_at) - timedelta(days=OVERDUE_AFTER_DAYS)
+        since = self._parse_since(options.get("since"))
 
-        overdue_qs = (
-            Payslip.objects.select_related("employer", "employer__user")
-            .filter(
-                status__in=["processing", "failed"],
-                instructions_status__in=["instructions_generated", "awaiting_bank_import"],
-                pay_period_end__lt=cutoff,
+        if dry_run:
+            candidates = overdue_candidates(cutoff, since)
+            processed = candidates.count()
+            employer_ids = set(candidates.values_list("employer_id", flat=True).distinct())
+            suspended = set(
+                Employer.objects.filter(id__in=employer_ids, is_suspended=False).values_list("id", flat=True)
             )
-            .order_by("pay_period_end")
-        )
-
-        processed = 0
-        suspended_employers = set()
-
-        for payslip in overdue_qs:
-            with transaction.atomic():
-                if not dry_run:
-                    payslip.status = "overdue"
-                    payslip.save(update_fields=["status", "updated_at"])
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"Payslip #{payslip.id} marked overdue (employer={payslip.employer_id}, traveller={payslip.traveller_id})."
-                    )
-                processed += 1
-
-                employer = payslip.employer
-                if employer.is_suspended:
-                    continue
-                if dry_run:
-                    suspended_employers.add(employer.pk)
-                    continue
-                employer.is_suspended = True
-                employer.save(update_fields=["is_suspended", "updated_at"] if hasattr(employer, "updated_at") else ["is_suspended"])
-                suspended_employers.add(employer.pk)
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"Employer #{employer.pk} suspended due to overdue payslip #{payslip.id}."
-                    )
-                )
+            chunks = 0
+        else:
+            processed, employer_ids, suspended, chunks = mark_overdue_payslips(cutoff, since, chunk_size=chunk_size)
+        suspended_employers = sorted(suspended)
 
+        elapsed = time.monotonic() - started
         if not processed:
             self.stdout.write(self.style.SUCCESS("No overdue payslips detected."))
         else:
-            msg = f"Identified {processed} overdue payslips."
+            msg = f"Identified {processed} overdue payslips across {len(employer_ids)} employers"
             if dry_run:
-                msg += " (dry-run: no changes applied)"
+                msg += ". (dry-run: no changes applied)"
+            else:
+                msg += f", marked in {chunks} chunk(s) in {elapsed:.2f}s."
             self.stdout.write(self.style.SUCCESS(msg))
 
         if suspended_employers:
-            employers = ", ".join(str(pk) for pk in sorted(suspended_employers))
+            employers = ", ".join(str(pk) for pk in suspended_employers)
             self.stdout.write(self.style.WARNING(f"Suspended employers: {employers}"))
         elif processed:
             self.stdout.write(self.style.SUCCESS("No new employer suspensions needed."))
+
+        self.stdout.write(f"Next watermark: --since {run_at.isoformat()}")
+
+    @staticmethod
+    def _parse_since(value):
+        if not value:
+            return None
+        try:
+            since = parse_datetime(value)
+            if since is None:
+                day = parse_date(value)
+                since = datetime.combine(day, day_start()) if day else None
+        except ValueError:
+            since = None
+        if since is None:
+            raise CommandError("--since must be an ISO timestamp or a YYYY-MM-DD date.")
+        return timezone.make_aware(since) if timezone.is_naive(since) else since
@@ -0,0 +1,27 @@
+"""Recompute the payroll rollups from the payslips they summarise."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.rollups import rebuild_payroll_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild PayrollRollup rows (employer, job, month) from payslips and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--employer", type=int, action="append", help="Only rebuild the given employer id(s).")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted rollups without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get("dry_run", False)
+        checked, drifted = rebuild_payroll_rollups(options.get("employer") or None, dry_run=dry_run)
+
+        msg = f"Checked {checked} rollups, {drifted} had drifted."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
@@ -0,0 +1,26 @@
+"""Recompute regional work days and counters from approved timesheet entries."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.regional import rebuild_regional_work
+
+
+class Command(BaseCommand):
+    help = "Rebuild RegionalWorkDay evidence and RegionalWorkProgress counters and report drifted travellers."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted travellers without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get("dry_run", False)
+        checked, drifted = rebuild_regional_work(dry_run=dry_run)
+
+        msg = f"Checked {checked} travellers, {drifted} had drifted regional work days."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
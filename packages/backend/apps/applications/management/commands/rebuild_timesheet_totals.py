@@ -0,0 +1,35 @@
+"""Recompute the denormalised hour totals stored on timesheets."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.models import Timesheet
+from apps.applications.timesheets import rebuild_timesheet_totals
+
+
+class Command(BaseCommand):
+    help = "Rebuild Timesheet running totals from their entries and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--timesheet", type=int, action="append", help="Only rebuild the given timesheet id(s).")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Timesheets aggregated per query.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted timesheets without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Timesheet.objects.all()
+        if options.get("timesheet"):
+            queryset = queryset.filter(pk__in=options["timesheet"])
+        dry_run = options.get("dry_run", False)
+
+        checked, drifted = rebuild_timesheet_totals(
+            queryset, chunk_size=max(1, options.get("chunk_size") or 500), dry_run=dry_run
+        )
+
+        msg = f"Checked {checked} timesheets, {drifted} had drifted totals."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
@@ -0,0 +1,26 @@
+"""Recompute the worker summaries behind the employer roster."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.roster import rebuild_worker_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild WorkerSummary rows from accepted offers, timesheets and payslips and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted summaries without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get("dry_run", False)
+        checked, drifted = rebuild_worker_summaries(dry_run=dry_run)
+
+        msg = f"Checked {checked} worker summaries, {drifted} had drifted."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
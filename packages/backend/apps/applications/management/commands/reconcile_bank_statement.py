@@ -0,0 +1,50 @@
+"""Import a bank statement file and settle the payslips it confirms."""
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.applications.reconciliation import detect_format, reconcile_statement
+from apps.users.models import Employer
+
+
+class Command(BaseCommand):
+    help = "Match a CSV or ABA bank statement against outstanding payslips and mark them paid."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("path", help="Path to the statement file.")
+        parser.add_argument("--format", choices=["csv", "aba"], help="Override format detection.")
+        parser.add_argument("--employer", type=int, help="Restrict matching to one employer id.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report matches and exceptions without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        statement_format = options.get("format") or detect_format(path)
+        dry_run = options.get("dry_run", False)
+
+        employer = None
+        if options.get("employer"):
+            employer = Employer.objects.filter(pk=options["employer"]).first()
+            if employer is None:
+                raise CommandError(f"Employer #{options['employer']} not found.")
+
+        try:
+            with open(path, "rb") as stream:
+                result = reconcile_statement(
+                    stream, statement_format=statement_format, employer=employer, dry_run=dry_run
+                )
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        msg = f"Read {result.lines_read} statement lines, matched {len(result.matched_payslip_ids)} payslips."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.SUCCESS(msg))
+        if result.exceptions:
+            self.stdout.write(self.style.WARNING(f"{len(result.exceptions)} exceptions:"))
+            self.stdout.write(json.dumps(result.exceptions, indent=2))
@@ -0,0 +1,28 @@
+"""Fold new earnings ledger entries into per-traveller and per-employer snapshots."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.ledger import SNAPSHOT_SETTLE_TIME, take_earnings_snapshots
+
+
+class Command(BaseCommand):
+    help = "Snapshot earnings ledger balances so balance reads only replay recent entries. Run periodically."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument(
+            "--settle-seconds",
+            type=int,
+            default=int(SNAPSHOT_SETTLE_TIME.total_seconds()),
+            help="Leave entries younger than this for the next run.",
+        )
+
+    def handle(self, *args, **options):
+        created = take_earnings_snapshots(settle=timedelta(seconds=max(0, options.get("settle_seconds") or 0)))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {created['traveller']} traveller and {created['employer']} employer snapshots."
+            )
+        )
@@ -0,0 +1,154 @@
+"""System messages posted to conversations about applications, offers, timesheets and payslips.
+
+Each builder returns a ``SystemMessage``; queue it with
+``apps.messaging.events.queue_system_message`` so it is posted once the write
+commits.
+"""
+from __future__ import annotations
+
+from apps.messaging.service import SystemMessage
+
+from .models import Application, JobOffer, Payslip, Timesheet
+
+
+def application_card_message(application: Application) -> SystemMessage:
+    applicant = application.applicant
+    traveller_name = applicant.get_full_name() or applicant.email
+    return SystemMessage(
+        employer_id=application.job.employer.user_id,
+        traveller_id=applicant.id,
+        job_id=application.job_id,
+        sender_id=applicant.id,
+        body=f"{traveller_name} applied for {application.job.title}.",
+        message_type="application_card",
+        metadata={
+            "kind": "application_card",
+            "application_id": application.id,
+            "job_id": application.job_id,
+            "job_title": application.job.title,
+            "traveller_name": traveller_name,
+            "status": application.status,
+            "cover_letter_preview": (application.cover_letter or "")[:200],
+            "submitted_at": application.submitted_at.isoformat() if application.submitted_at else None,
+        },
+    )
+
+
+def application_status_message(
+    job, application_id: int, applicant_id: int, previous: str, status: str, label: str, sender
+) -> SystemMessage:
+    return SystemMessage(
+        employer_id=job.employer.user_id,
+        traveller_id=applicant_id,
+        job_id=job.id,
+        sender_id=sender.id,
+        body=f"Your application for {job.title} is now: {label}.",
+        message_type="application_status",
+        metadata={
+            "kind": "application_status",
+            "application_id": application_id,
+            "job_id": job.id,
+            "job_title": job.title,
+            "previous_status": previous,
+            "status": status,
+        },
+    )
+
+
+def offer_message(offer: JobOffer, sender, body: str | None = None) -> SystemMessage:
+    employer_user = offer.job.employer.user
+    employer_user_name = employer_user.get_full_name() or employer_user.email
+    return SystemMessage(
+        employer_id=employer_user.id,
+        traveller_id=offer.traveller_id,
+        job_id=offer.job_id,
+        sender_id=sender.id,
+        body=body or f"{employer_user_name} sent a contract offer.",
+        message_type="job_offer",
+        metadata={
+            "kind": "job_offer",
+            "offer_id": offer.id,
+            "application_id": offer.application_id,
+            "job_id": offer.job_id,
+            "job_title": offer.job.title,
+            "employer_name": offer.employer.company_name or employer_user_name,
+            "status": offer.status,
+            "contract_type": offer.contract_type,
+            "rate_type": offer.rate_type,
+            "rate_amount": str(offer.rate_amount),
+            "rate_currency": offer.rate_currency,
+            "start_date": offer.start_date.isoformat(),
+            "end_date": offer.end_date.isoformat() if offer.end_date else None,
+            "accommodation_details": offer.accommodation_details,
+        },
+    )
+
+
+def timesheet_message(
+    offer: JobOffer, timesheet: Timesheet, sender, body: str, *, employer_id: int | None = None, coalesce: bool = False
+) -> SystemMessage:
+    """A timesheet card; with ``coalesce``, repeats for the same offer merge into the latest one."""
+
+    return SystemMessage(
+        employer_id=employer_id or offer.job.employer.user_id,
+        traveller_id=offer.traveller_id,
+        job_id=offer.job_id,
+        sender_id=sender.id,
+        body=body,
+        message_type="timesheet",
+        metadata={
+            "kind": "timesheet",
+            "offer_id": offer.id,
+            "application_id": offer.application_id,
+            "status": timesheet.status,
+            "entry_count": timesheet.entry_count,
+            "total_hours": str(timesheet.total_hours),
+        },
+        coalesce_key=f"timesheet-updated:{offer.id}" if coalesce else "",
+    )
+
+
+def payslip_message(payslip: Payslip, sender, body: str | None = None) -> SystemMessage:
+    return SystemMessage(
+        employer_id=payslip.offer.job.employer.user_id,
+        traveller_id=payslip.traveller_id,
+        job_id=payslip.offer.job_id,
+        sender_id=sender.id,
+        body=body or "Employer initiated a payout for approved hours.",
+        message_type="payslip",
+        metadata={
+            "kind": "payslip",
+            "payslip_id": payslip.id,
+            "hour_count": str(payslip.hour_count),
+            "gross_amount": str(payslip.gross_amount),
+            "commission_amount": str(payslip.commission_amount),
+            "tax_withheld": str(payslip.tax_withheld),
+            "net_payment": str(payslip.net_payment),
+            "rate_amount": str(payslip.rate_amount),
+            "rate_currency": payslip.rate_currency,
+        },
+    )
+
+
+def payslip_reconciled_message(payslip: Payslip, sender=None) -> SystemMessage:
+    employer_id = payslip.employer.user_id
+    return SystemMessage(
+        employer_id=employer_id,
+        traveller_id=payslip.traveller_id,
+        job_id=payslip.offer.job_id,
+        sender_id=sender.id if sender else employer_id,
+        body=(
+            "✅ Votre paie pour la période "
+            f"{payslip.pay_period_start or ''} - {payslip.pay_period_end or ''} a été rapprochée "
+            "avec le relevé bancaire de votre employeur."
+        ),
+        message_type="payslip",
+        metadata={
+            "kind": "payslip",
+            "payslip_id": payslip.id,
+            "status": "completed",
+            "net_payment": str(payslip.net_payment),
+            "rate_currency": payslip.rate_currency,
+            "reconciled": True,
+        },
+    )
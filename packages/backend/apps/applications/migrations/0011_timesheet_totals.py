@@ -0,0 +1,79 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:29
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q, Sum
+
+
+def backfill_timesheet_totals(apps, schema_editor):
+    Timesheet = apps.get_model("applications", "Timesheet")
+    TimesheetEntry = apps.get_model("applications", "TimesheetEntry")
+    rows = TimesheetEntry.objects.values("timesheet_id").annotate(
+        total=Sum("hours_worked"),
+        approved=Sum("hours_worked", filter=Q(is_locked=True)),
+        unpaid=Sum("hours_worked", filter=Q(is_locked=True, is_paid=False)),
+        paid=Sum("hours_worked", filter=Q(is_paid=True)),
+        count=Count("id"),
+        first=Min("entry_date"),
+        last=Max("entry_date"),
+    )
+    for row in rows.iterator():
+        Timesheet.objects.filter(pk=row["timesheet_id"]).update(
+            total_hours=row["total"] or 0,
+            approved_hours=row["approved"] or 0,
+            unpaid_hours=row["unpaid"] or 0,
+            paid_hours=row["paid"] or 0,
+            entry_count=row["count"],
+            first_entry_date=row["first"],
+            last_entry_date=row["last"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_application_last_paid_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timesheet',
+            name='approved_hours',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=9),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='entry_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='first_entry_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='last_entry_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='paid_hours',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=9),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='total_hours',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=9),
+        ),
+        migrations.AddField(
+            model_name='timesheet',
+            name='unpaid_hours',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=9),
+        ),
+        migrations.AlterField(
+            model_name='payslip',
+            name='status',
+            field=models.CharField(choices=[('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed'), ('overdue', 'Overdue')], default='processing', max_length=20),
+        ),
+        migrations.RunPython(backfill_timesheet_totals, migrations.RunPython.noop),
+    ]
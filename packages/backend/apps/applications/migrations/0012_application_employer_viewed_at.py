@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:43
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_triaged_applications_viewed(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    # Anything the employer already moved past "submitted" has been seen.
+    Application.objects.exclude(status="submitted").update(employer_viewed_at=F("updated_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_timesheet_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='employer_viewed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_triaged_applications_viewed, migrations.RunPython.noop),
+    ]
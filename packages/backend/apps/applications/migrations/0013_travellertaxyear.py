@@ -0,0 +1,62 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_tax_years(apps, schema_editor):
+    Payslip = apps.get_model("applications", "Payslip")
+    TravellerTaxYear = apps.get_model("applications", "TravellerTaxYear")
+    totals = {}
+    rows = Payslip.objects.values_list("traveller_id", "created_at", "net_before_tax", "tax_withheld")
+    for traveller_id, created_at, net_before_tax, tax_withheld in rows.iterator():
+        paid_on = timezone.localtime(created_at).date() if timezone.is_aware(created_at) else created_at.date()
+        year = paid_on.year if paid_on.month >= 7 else paid_on.year - 1
+        taxable, withheld, count = totals.get((traveller_id, year), (0, 0, 0))
+        totals[(traveller_id, year)] = (taxable + net_before_tax, withheld + tax_withheld, count + 1)
+    TravellerTaxYear.objects.bulk_create(
+        [
+            TravellerTaxYear(
+                traveller_id=traveller_id,
+                financial_year=year,
+                taxable_income=taxable,
+                tax_withheld=withheld,
+                payslip_count=count,
+            )
+            for (traveller_id, year), (taxable, withheld, count) in totals.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_application_employer_viewed_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TravellerTaxYear',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('financial_year', models.PositiveSmallIntegerField()),
+                ('taxable_income', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('tax_withheld', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('payslip_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('traveller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tax_years', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-financial_year'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='travellertaxyear',
+            constraint=models.UniqueConstraint(fields=('traveller', 'financial_year'), name='unique_traveller_tax_year'),
+        ),
+        migrations.RunPython(backfill_tax_years, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,115 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def _local_date(value):
+    return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+
+
+def _financial_year(day):
+    return day.year if day.month >= 7 else day.year - 1
+
+
+def backfill_earnings_ledger(apps, schema_editor):
+    Timesheet = apps.get_model("applications", "Timesheet")
+    Payslip = apps.get_model("applications", "Payslip")
+    EarningsEntry = apps.get_model("applications", "EarningsEntry")
+
+    entries = []
+    timesheets = Timesheet.objects.filter(approved_hours__gt=0).select_related("offer")
+    for timesheet in timesheets.iterator():
+        on = _local_date(timesheet.approved_at or timesheet.updated_at)
+        entries.append(
+            EarningsEntry(
+                traveller_id=timesheet.offer.traveller_id,
+                employer_id=timesheet.offer.employer_id,
+                timesheet_id=timesheet.id,
+                kind="hours_approved",
+                hours=timesheet.approved_hours,
+                financial_year=_financial_year(on),
+                occurred_on=on,
+            )
+        )
+    for payslip in Payslip.objects.order_by("id").iterator():
+        on = _local_date(payslip.created_at)
+        year = payslip.metadata.get("financial_year") or _financial_year(on)
+        amounts = [
+            ("gross", payslip.gross_amount, on),
+            ("tax_withheld", payslip.tax_withheld, on),
+            ("super", payslip.super_amount, on),
+            ("commission", payslip.commission_amount, on),
+        ]
+        if payslip.status == "completed":
+            amounts.append(("net_paid", payslip.net_payment, _local_date(payslip.updated_at)))
+        entries.extend(
+            EarningsEntry(
+                traveller_id=payslip.traveller_id,
+                employer_id=payslip.employer_id,
+                timesheet_id=payslip.timesheet_id,
+                payslip_id=payslip.id,
+                kind=kind,
+                amount=amount,
+                financial_year=year,
+                occurred_on=occurred_on,
+            )
+            for kind, amount, occurred_on in amounts
+        )
+    EarningsEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_travellertaxyear'),
+        ('users', '0009_idempotencykey'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EarningsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('traveller', 'Traveller'), ('employer', 'Employer')], max_length=10)),
+                ('subject_id', models.PositiveBigIntegerField()),
+                ('financial_year', models.PositiveSmallIntegerField()),
+                ('through_entry_id', models.PositiveBigIntegerField()),
+                ('hours_approved', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('gross', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('tax_withheld', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('super_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('commission', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('net_paid', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-through_entry_id'],
+                'indexes': [models.Index(fields=['scope', 'subject_id', 'financial_year', '-through_entry_id'], name='earnings_snapshot_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='EarningsEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('hours_approved', 'Hours approved'), ('gross', 'Gross earnings'), ('tax_withheld', 'Tax withheld'), ('super', 'Superannuation'), ('commission', 'Commission'), ('net_paid', 'Net paid')], max_length=20)),
+                ('hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('financial_year', models.PositiveSmallIntegerField()),
+                ('occurred_on', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='earnings_entries', to='users.employer')),
+                ('payslip', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='applications.payslip')),
+                ('timesheet', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='applications.timesheet')),
+                ('traveller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='earnings_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['traveller', 'financial_year', 'id'], name='earnings_traveller_year_idx'), models.Index(fields=['employer', 'financial_year', 'id'], name='earnings_employer_year_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_earnings_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.0.2 on 2026-10-19 07:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+ROLLUP_SUMS = ("hour_count", "gross_amount", "commission_amount", "tax_withheld", "super_amount", "net_payment")
+
+
+def _month(value):
+    day = timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    return day.replace(day=1)
+
+
+def backfill_payroll_rollups(apps, schema_editor):
+    Payslip = apps.get_model("applications", "Payslip")
+    PayrollRollup = apps.get_model("applications", "PayrollRollup")
+
+    rollups = {}
+    for payslip in Payslip.objects.select_related("offer").order_by("id").iterator():
+        key = (payslip.employer_id, payslip.offer.job_id, _month(payslip.created_at))
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = rollups[key] = PayrollRollup(employer_id=key[0], job_id=key[1], month=key[2])
+        rollup.payslip_count += 1
+        for name in ROLLUP_SUMS:
+            setattr(rollup, name, getattr(rollup, name) + getattr(payslip, name))
+        if payslip.status == "completed":
+            rollup.completed_count += 1
+            rollup.paid_amount += payslip.net_payment
+    PayrollRollup.objects.bulk_create(rollups.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0014_earnings_ledger'),
+        ('jobs', '0005_job_counters'),
+        ('users', '0009_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('payslip_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('hour_count', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('gross_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('commission_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('tax_withheld', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('super_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('net_payment', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('paid_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payroll_rollups', to='users.employer')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payroll_rollups', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['-month', 'job_id'],
+                'indexes': [models.Index(fields=['month'], name='payroll_rollup_month_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='payrollrollup',
+            constraint=models.UniqueConstraint(fields=('employer', 'job', 'month'), name='unique_payroll_rollup'),
+        ),
+        migrations.RunPython(backfill_payroll_rollups, migrations.RunPython.noop),
+    ]
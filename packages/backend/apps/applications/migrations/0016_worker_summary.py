@@ -0,0 +1,78 @@
+# Generated by Django 5.0.2 on 2026-10-19 07:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_worker_summaries(apps, schema_editor):
+    JobOffer = apps.get_model("applications", "JobOffer")
+    Timesheet = apps.get_model("applications", "Timesheet")
+    Payslip = apps.get_model("applications", "Payslip")
+    WorkerSummary = apps.get_model("applications", "WorkerSummary")
+
+    offers = JobOffer.objects.filter(status="accepted").select_related("application")
+    timesheets = {timesheet.offer_id: timesheet for timesheet in Timesheet.objects.filter(offer__status="accepted")}
+    latest_payslips = {}
+    payslips = Payslip.objects.filter(offer__status="accepted").only("id", "offer_id", "status", "created_at")
+    for payslip in payslips.order_by("created_at", "id").iterator():
+        latest_payslips[payslip.offer_id] = payslip
+
+    summaries = []
+    for offer in offers.iterator():
+        summary = WorkerSummary(
+            offer_id=offer.id,
+            employer_id=offer.employer_id,
+            job_id=offer.job_id,
+            last_paid_at=offer.application.last_paid_at,
+        )
+        timesheet = timesheets.get(offer.id)
+        if timesheet is not None:
+            summary.timesheet_status = timesheet.status
+            summary.total_hours = timesheet.total_hours
+            summary.approved_unpaid_hours = timesheet.unpaid_hours
+            summary.pending_hours = timesheet.total_hours - timesheet.approved_hours
+            summary.paid_hours = timesheet.paid_hours
+            summary.last_entry_date = timesheet.last_entry_date
+        payslip = latest_payslips.get(offer.id)
+        if payslip is not None:
+            summary.last_payslip_id = payslip.id
+            summary.last_payslip_status = payslip.status
+            summary.last_payslip_at = payslip.created_at
+        summaries.append(summary)
+    WorkerSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0015_payrollrollup'),
+        ('jobs', '0005_job_counters'),
+        ('users', '0009_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerSummary',
+            fields=[
+                ('offer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='worker_summary', serialize=False, to='applications.joboffer')),
+                ('timesheet_status', models.CharField(default='draft', max_length=20)),
+                ('total_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('approved_unpaid_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('pending_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('paid_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('last_entry_date', models.DateField(blank=True, null=True)),
+                ('last_payslip_status', models.CharField(blank=True, default='', max_length=20)),
+                ('last_payslip_at', models.DateTimeField(blank=True, null=True)),
+                ('last_paid_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='worker_summaries', to='users.employer')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+                ('last_payslip', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='applications.payslip')),
+            ],
+            options={
+                'ordering': ['-offer_id'],
+                'indexes': [models.Index(fields=['employer', 'offer'], name='worker_summary_roster_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_worker_summaries, migrations.RunPython.noop),
+    ]
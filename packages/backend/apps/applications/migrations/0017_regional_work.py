@@ -0,0 +1,53 @@
+# Generated by Django 5.0.2 on 2026-10-19 07:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0016_worker_summary'),
+        ('jobs', '0005_job_counters'),
+        ('users', '0009_idempotencykey'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegionalWorkProgress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day_count', models.PositiveIntegerField(default=0)),
+                ('hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('first_day', models.DateField(blank=True, null=True)),
+                ('last_day', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('traveller', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='regional_work_progress', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RegionalWorkDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_date', models.DateField()),
+                ('hours', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('postcode', models.CharField(max_length=4)),
+                ('counted', models.BooleanField(default=True)),
+                ('approved_at', models.DateTimeField(auto_now_add=True)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='users.employer')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='applications.joboffer')),
+                ('traveller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='regional_work_days', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['work_date', 'id'],
+                'indexes': [models.Index(fields=['traveller', 'work_date'], name='regional_work_traveller_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='regionalworkday',
+            constraint=models.UniqueConstraint(fields=('traveller', 'offer', 'work_date'), name='unique_regional_work_day'),
+        ),
+    ]
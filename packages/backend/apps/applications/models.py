@@ -1,11 +1,75 @@
 """Application domain models."""
 import uuid
 
-from django.db import models
+from django.db import models, router, transaction
 from django.conf import settings
 
 
-class Application(models.Model):
+class LoadedStateMixin:
+    """Remember the stored values of ``tracked_fields`` so ``save`` can maintain counters.
+
+    After a save that wrote any tracked field, ``tracked_state_changed`` runs
+    in the same transaction with the previous state (``None`` for a new row)
+    and the new one. For an existing row the previous state is re-read under
+    a row lock, so concurrent saves of the same row apply each transition
+    once rather than each applying it from the same in-memory snapshot.
+    """
+
+    tracked_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_state = instance._tracked_values(instance.tracked_fields)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        refreshed = [name for name in self.tracked_fields if fields is None or self._names_field(fields, name)]
+        self._loaded_state = {**getattr(self, "_loaded_state", {}), **self._tracked_values(refreshed)}
+
+    @staticmethod
+    def _names_field(field_names, name: str) -> bool:
+        # ``update_fields`` may name a foreign key either way ("job" or "job_id").
+        return name in field_names or name.removesuffix("_id") in field_names
+
+    def _tracked_values(self, names) -> dict:
+        # ``__dict__`` so deferred fields are not loaded one query at a time.
+        return {name: self.__dict__.get(name) for name in names}
+
+    def _locked_state(self, using) -> dict | None:
+        stored = (
+            type(self)._base_manager.using(using)
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values(*self.tracked_fields)
+            .first()
+        )
+        return stored if stored is not None else getattr(self, "_loaded_state", None)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        saved_fields = [
+            name for name in self.tracked_fields if update_fields is None or self._names_field(update_fields, name)
+        ]
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        adding = self._state.adding
+        previous = None
+        with transaction.atomic(using=using):
+            if saved_fields and not adding:
+                previous = self._locked_state(using)
+            super().save(*args, **kwargs)
+            if saved_fields:
+                current = {**(previous or {}), **self._tracked_values(saved_fields)}
+                self.tracked_state_changed(previous, current)
+        if saved_fields:
+            self._loaded_state = current
+
+    def tracked_state_changed(self, previous: dict | None, current: dict) -> None:
+        """Hook for subclasses; called with the tracked values before and after a save. Does nothing by default."""
+
+
+class Application(LoadedStateMixin, models.Model):
     """Represents a traveller applying for a job."""
 
     STATUS_CHOICES = [
@@ -29,6 +93,10 @@ class Application(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     last_paid_at = models.DateTimeField(null=True, blank=True)
+    # First time the job owner opened or triaged the application; ``None`` means unread.
+    employer_viewed_at = models.DateTimeField(null=True, blank=True)
+
+    tracked_fields = ("job_id", "status", "employer_viewed_at")
 
     class Meta:
         constraints = [
@@ -38,8 +106,27 @@ class Application(models.Model):
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return f"{self.applicant} -> {self.job}"
 
+    @staticmethod
+    def job_counter_contribution(state: dict | None) -> dict[int, dict[str, int]]:
+        if state is None:
+            return {}
+        return {
+            state["job_id"]: {
+                "application_count": 1,
+                "new_application_count": int(state["status"] == "submitted"),
+                "unread_application_count": int(state["employer_viewed_at"] is None),
+            }
+        }
+
+    def tracked_state_changed(self, previous, current) -> None:
+        from apps.jobs.counters import adjust_job_counters, counter_deltas  # avoid circular import
 
-class JobOffer(models.Model):
+        adjust_job_counters(
+            counter_deltas(self.job_counter_contribution(previous), self.job_counter_contribution(current))
+        )
+
+
+class JobOffer(LoadedStateMixin, models.Model):
     """Formal contract offer tied to an application."""
 
     CONTRACT_TYPE_CHOICES = [("casual", "Casual")]
@@ -76,12 +163,29 @@ class JobOffer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ("job_id", "status")
+
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return f"Offer {self.pk} for application {self.application_id}"
 
+    @staticmethod
+    def job_counter_contribution(state: dict | None) -> dict[int, dict[str, int]]:
+        if state is None:
+            return {}
+        return {state["job_id"]: {"pending_offer_count": int(state["status"] == "pending")}}
+
+    def tracked_state_changed(self, previous, current) -> None:
+        from apps.jobs.counters import adjust_job_counters, counter_deltas  # avoid circular import
+        from .roster import sync_worker_summary  # avoid circular import
+
+        adjust_job_counters(
+            counter_deltas(self.job_counter_contribution(previous), self.job_counter_contribution(current))
+        )
+        sync_worker_summary(self, previous, current)
+
 
 class Timesheet(models.Model):
     STATUS_CHOICES = [
@@ -96,15 +200,38 @@ class Timesheet(models.Model):
     employer_notes = models.TextField(blank=True, default="")
     submitted_at = models.DateTimeField(null=True, blank=True)
     approved_at = models.DateTimeField(null=True, blank=True)
+    # Running totals maintained by the timesheet write paths; approved hours
+    # are locked entries and unpaid hours are approved entries not yet paid.
+    total_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    approved_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    unpaid_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    paid_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    entry_count = models.PositiveIntegerField(default=0)
+    first_entry_date = models.DateField(null=True, blank=True)
+    last_entry_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TOTAL_FIELDS = [
+        "total_hours",
+        "approved_hours",
+        "unpaid_hours",
+        "paid_hours",
+        "entry_count",
+        "first_entry_date",
+        "last_entry_date",
+    ]
+
     class Meta:
         ordering = ["-updated_at"]
 
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return f"Timesheet for offer {self.offer_id}"
 
+    def apply_totals(self, totals: dict) -> None:
+        for field_name in self.TOTAL_FIELDS:
+            setattr(self, field_name, totals[field_name])
+
 
 class TimesheetEntry(models.Model):
     timesheet = models.ForeignKey(Timesheet, on_delete=models.CASCADE, related_name="entries")
@@ -139,7 +266,7 @@ def payslip_aba_upload_to(instance, filename: str) -> str:
     return f"payslips/{instance.traveller_id}/aba/{uuid.uuid4()}.{extension}"
 
 
-class Payslip(models.Model):
+class Payslip(LoadedStateMixin, models.Model):
     STATUS_CHOICES = [
         ("processing", "Processing"),
         ("completed", "Completed"),
@@ -189,8 +316,238 @@ class Payslip(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ("employer_id", "status")
+
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return f"Payslip {self.id} for offer {self.offer_id}"
+
+    def tracked_state_changed(self, previous, current) -> None:
+        from apps.users.utils import adjust_overdue_payslip_counts  # avoid circular import
+
+        deltas: dict[int, int] = {}
+        if previous is not None:
+            deltas[previous["employer_id"]] = -int(previous["status"] == "overdue")
+        deltas[current["employer_id"]] = deltas.get(current["employer_id"], 0) + int(current["status"] == "overdue")
+        adjust_overdue_payslip_counts(deltas)
+
+
+class TravellerTaxYear(models.Model):
+    """Year-to-date taxable income and withholding of a traveller, maintained as payslips are issued."""
+
+    traveller = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="tax_years")
+    # Calendar year in which the financial year starts (1 July).
+    financial_year = models.PositiveSmallIntegerField()
+    taxable_income = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tax_withheld = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    payslip_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-financial_year"]
+        constraints = [
+            models.UniqueConstraint(fields=["traveller", "financial_year"], name="unique_traveller_tax_year"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"FY{self.financial_year} for traveller {self.traveller_id}"
+
+
+class EarningsEntry(models.Model):
+    """Append-only record of what a traveller earned and was paid; corrections are new, negated entries."""
+
+    KIND_CHOICES = [
+        ("hours_approved", "Hours approved"),
+        ("gross", "Gross earnings"),
+        ("tax_withheld", "Tax withheld"),
+        ("super", "Superannuation"),
+        ("commission", "Commission"),
+        ("net_paid", "Net paid"),
+    ]
+
+    traveller = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="earnings_entries")
+    employer = models.ForeignKey("users.Employer", on_delete=models.CASCADE, related_name="earnings_entries")
+    timesheet = models.ForeignKey(Timesheet, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    payslip = models.ForeignKey(Payslip, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    financial_year = models.PositiveSmallIntegerField()
+    occurred_on = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["traveller", "financial_year", "id"], name="earnings_traveller_year_idx"),
+            models.Index(fields=["employer", "financial_year", "id"], name="earnings_employer_year_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.kind} for traveller {self.traveller_id}"
+
+
+class EarningsSnapshot(models.Model):
+    """Ledger totals of one traveller or employer for a financial year, up to ``through_entry_id``."""
+
+    SCOPE_CHOICES = [
+        ("traveller", "Traveller"),
+        ("employer", "Employer"),
+    ]
+
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    # User id for traveller snapshots, Employer id for employer snapshots.
+    subject_id = models.PositiveBigIntegerField()
+    financial_year = models.PositiveSmallIntegerField()
+    through_entry_id = models.PositiveBigIntegerField()
+    hours_approved = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    gross = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    tax_withheld = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    super_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    commission = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    net_paid = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-through_entry_id"]
+        indexes = [
+            models.Index(
+                fields=["scope", "subject_id", "financial_year", "-through_entry_id"], name="earnings_snapshot_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.scope} {self.subject_id} FY{self.financial_year} through {self.through_entry_id}"
+
+
+class PayrollRollup(models.Model):
+    """Payslip totals per employer, job and month, kept up to date as payslips are issued and completed."""
+
+    employer = models.ForeignKey("users.Employer", on_delete=models.CASCADE, related_name="payroll_rollups")
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, related_name="payroll_rollups")
+    # First day of the month the payslips were issued in.
+    month = models.DateField()
+    payslip_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    hour_count = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    gross_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    commission_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    tax_withheld = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    super_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    net_payment = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    paid_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    ROLLUP_FIELDS = (
+        "payslip_count",
+        "completed_count",
+        "hour_count",
+        "gross_amount",
+        "commission_amount",
+        "tax_withheld",
+        "super_amount",
+        "net_payment",
+        "paid_amount",
+    )
+
+    class Meta:
+        ordering = ["-month", "job_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["employer", "job", "month"], name="unique_payroll_rollup"),
+        ]
+        indexes = [models.Index(fields=["month"], name="payroll_rollup_month_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"Payroll for job {self.job_id} in {self.month:%Y-%m}"
+
+
+class WorkerSummary(models.Model):
+    """Hours and pay position of one accepted offer, kept up to date for the employer roster."""
+
+    offer = models.OneToOneField(
+        "applications.JobOffer", on_delete=models.CASCADE, primary_key=True, related_name="worker_summary"
+    )
+    employer = models.ForeignKey("users.Employer", on_delete=models.CASCADE, related_name="worker_summaries")
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, related_name="+")
+    timesheet_status = models.CharField(max_length=20, default="draft")
+    total_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    # Approved (locked) hours not yet claimed by a payslip.
+    approved_unpaid_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    # Logged hours the employer has not approved yet.
+    pending_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    paid_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    last_entry_date = models.DateField(null=True, blank=True)
+    last_payslip = models.ForeignKey(
+        "applications.Payslip", on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    last_payslip_status = models.CharField(max_length=20, blank=True, default="")
+    last_payslip_at = models.DateTimeField(null=True, blank=True)
+    last_paid_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    SUMMARY_FIELDS = (
+        "timesheet_status",
+        "total_hours",
+        "approved_unpaid_hours",
+        "pending_hours",
+        "paid_hours",
+        "last_entry_date",
+        "last_payslip_id",
+        "last_payslip_status",
+        "last_payslip_at",
+        "last_paid_at",
+    )
+
+    class Meta:
+        ordering = ["-offer_id"]
+        indexes = [models.Index(fields=["employer", "offer"], name="worker_summary_roster_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"Worker summary for offer {self.offer_id}"
+
+
+class RegionalWorkDay(models.Model):
+    """An approved day of specified work in regional Australia, kept as second-visa evidence."""
+
+    traveller = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="regional_work_days"
+    )
+    offer = models.ForeignKey("applications.JobOffer", on_delete=models.CASCADE, related_name="+")
+    employer = models.ForeignKey("users.Employer", on_delete=models.CASCADE, related_name="+")
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, related_name="+")
+    work_date = models.DateField()
+    hours = models.DecimalField(max_digits=5, decimal_places=2)
+    postcode = models.CharField(max_length=4)
+    # Whether this row added the date to the traveller's day count (the first job approved that day did).
+    counted = models.BooleanField(default=True)
+    approved_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["work_date", "id"]
+        constraints = [
+            models.UniqueConstraint(fields=["traveller", "offer", "work_date"], name="unique_regional_work_day"),
+        ]
+        indexes = [models.Index(fields=["traveller", "work_date"], name="regional_work_traveller_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"Regional work on {self.work_date} for traveller {self.traveller_id}"
+
+
+class RegionalWorkProgress(models.Model):
+    """Running count of a traveller's distinct regional work days."""
+
+    traveller = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="regional_work_progress"
+    )
+    day_count = models.PositiveIntegerField(default=0)
+    hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    first_day = models.DateField(null=True, blank=True)
+    last_day = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    PROGRESS_FIELDS = ("day_count", "hours", "first_day", "last_day")
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.day_count} regional days for traveller {self.traveller_id}"
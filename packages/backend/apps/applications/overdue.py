@@ -0,0 +1,93 @@
+"""Overdue payslip detection, shared by ``monitor_overdue_payslips`` and its periodic task."""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.users.models import Employer
+from apps.users.utils import adjust_overdue_payslip_counts
+
+from .models import Payslip
+from .roster import refresh_worker_summaries
+
+
+OVERDUE_AFTER_DAYS = 7
+
+
+def overdue_candidates(cutoff, since=None):
+    """Unpaid payslips whose pay period ended before ``cutoff``.
+
+    ``since`` is the start of the previous run: a payslip can only have
+    become a candidate after it if its pay period crossed that run's cutoff
+    since, or if it was issued or changed since (payouts often lag the end of
+    the period).
+    """
+
+    queryset = Payslip.objects.filter(
+        status__in=["processing", "failed"],
+        instructions_status__in=["instructions_generated", "awaiting_bank_import"],
+        pay_period_end__lt=cutoff,
+    )
+    if since:
+        previous_cutoff = timezone.localdate(since) - timedelta(days=OVERDUE_AFTER_DAYS)
+        queryset = queryset.filter(
+            Q(pay_period_end__gte=previous_cutoff) | Q(aba_generated_at__gte=since) | Q(updated_at__gte=since)
+        )
+    return queryset
+
+
+def mark_overdue_chunk(cutoff, since, chunk_size: int) -> tuple[list[tuple[int, int]], set[int]]:
+    """Flag up to ``chunk_size`` candidates with one ``UPDATE ... RETURNING``.
+
+    Returns the ``(payslip_id, employer_id)`` rows and the employers this chunk suspended.
+    """
+
+    subquery, params = (
+        overdue_candidates(cutoff, since).order_by("id").values("id")[:chunk_size].query.sql_with_params()
+    )
+    qn = connection.ops.quote_name
+    sql = (
+        f"UPDATE {qn(Payslip._meta.db_table)} SET {qn('status')} = %s, {qn('updated_at')} = %s "
+        f"WHERE {qn('id')} IN ({subquery}) RETURNING {qn('id')}, {qn('employer_id')}, {qn('offer_id')}"
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, ["overdue", timezone.now(), *params])
+            rows = cursor.fetchall()
+        deltas = Counter(employer_id for _payslip_id, employer_id, _offer_id in rows)
+        # Locked, so the employers read as active here are exactly the ones the counter update suspends.
+        suspended = set(
+            Employer.objects.select_for_update()
+            .filter(pk__in=deltas.keys(), is_suspended=False)
+            .values_list("pk", flat=True)
+        )
+        # Suspension follows the counter, in the same transaction as the flags.
+        adjust_overdue_payslip_counts(deltas)
+        refresh_worker_summaries({offer_id for _payslip_id, _employer_id, offer_id in rows}, payslips=True)
+    return [(payslip_id, employer_id) for payslip_id, employer_id, _offer_id in rows], suspended
+
+
+def mark_overdue_payslips(cutoff, since=None, *, chunk_size: int = 1000) -> tuple[int, set[int], set[int], int]:
+    """Flag every overdue candidate chunk by chunk.
+
+    Returns ``(processed, employer_ids, suspended_employer_ids, chunks)``.
+    """
+
+    processed = chunks = 0
+    employer_ids: set[int] = set()
+    suspended: set[int] = set()
+    while True:
+        rows, newly_suspended = mark_overdue_chunk(cutoff, since, chunk_size)
+        if not rows:
+            break
+        chunks += 1
+        processed += len(rows)
+        employer_ids.update(employer_id for _payslip_id, employer_id in rows)
+        suspended |= newly_suspended
+        if len(rows) < chunk_size:
+            break
+    return processed, employer_ids, suspended, chunks
@@ -0,0 +1,108 @@
+"""Per-job applicant pipeline: status counts, board columns and bulk transitions."""
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Count, DateTimeField, F, Value, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.utils import timezone
+
+from apps.jobs.counters import adjust_job_counters
+from apps.messaging.events import queue_system_message
+
+from .messages import application_status_message
+from .models import Application
+
+
+# Statuses an employer moves applications between while triaging; offer
+# statuses are driven by the offer flow and cannot be set from the board.
+TRIAGE_STATUSES = ("submitted", "review", "interview", "rejected")
+STATUS_LABELS = dict(Application.STATUS_CHOICES)
+
+
+def pipeline_counts(job) -> dict[str, int]:
+    """Application count for every status of ``job`` from one grouped query."""
+
+    counts = {value: 0 for value, _label in Application.STATUS_CHOICES}
+    rows = Application.objects.filter(job=job).order_by().values_list("status").annotate(total=Count("id"))
+    counts.update(dict(rows))
+    return counts
+
+
+def pipeline_first_pages(job, page_size: int) -> dict[str, list[Application]]:
+    """The newest ``page_size`` applications of each status column, in one windowed query."""
+
+    ranked = (
+        Application.objects.filter(job=job)
+        .select_related("applicant")
+        .annotate(column_rank=Window(RowNumber(), partition_by=[F("status")], order_by=F("id").desc()))
+        .filter(column_rank__lte=page_size)
+        .order_by("status", "-id")
+    )
+    columns: dict[str, list[Application]] = {value: [] for value, _label in Application.STATUS_CHOICES}
+    for application in ranked:
+        columns.setdefault(application.status, []).append(application)
+    return columns
+
+
+@transaction.atomic
+def bulk_transition_applications(job, sender, application_ids: list[int], target_status: str) -> dict:
+    """Move many applications of ``job`` to ``target_status`` with one ``UPDATE``.
+
+    Applications outside the triage statuses (e.g. with an offer) are
+    reported as skipped. Moved applications count as viewed by the employer;
+    the job counters are adjusted in the same transaction and the applicants
+    are notified with one batch of system messages.
+    """
+
+    rows = list(
+        Application.objects.select_for_update()
+        .filter(job=job, id__in=application_ids)
+        .values_list("id", "status", "applicant_id", "employer_viewed_at")
+    )
+    found = {row[0]: row[1:] for row in rows}
+
+    moved: list[tuple] = []
+    skipped = []
+    for application_id in application_ids:
+        if application_id not in found:
+            skipped.append({"application_id": application_id, "detail": "Application not found for this job."})
+            continue
+        current, applicant_id, viewed_at = found[application_id]
+        if current == target_status:
+            skipped.append({"application_id": application_id, "detail": "Application already has this status."})
+        elif current not in TRIAGE_STATUSES:
+            skipped.append(
+                {"application_id": application_id, "detail": f"Applications in '{current}' cannot be moved."}
+            )
+        else:
+            moved.append((application_id, current, applicant_id, viewed_at))
+
+    if moved:
+        now = timezone.now()
+        Application.objects.filter(id__in=[item[0] for item in moved]).update(
+            status=target_status,
+            updated_at=now,
+            employer_viewed_at=Coalesce(F("employer_viewed_at"), Value(now), output_field=DateTimeField()),
+        )
+        adjust_job_counters(
+            {
+                job.id: {
+                    "new_application_count": sum(
+                        int(target_status == "submitted") - int(previous == "submitted")
+                        for _, previous, _, _ in moved
+                    ),
+                    "unread_application_count": -sum(1 for *_, viewed_at in moved if viewed_at is None),
+                }
+            }
+        )
+        label = STATUS_LABELS.get(target_status, target_status)
+        for application_id, previous, applicant_id, _viewed_at in moved:
+            queue_system_message(
+                application_status_message(job, application_id, applicant_id, previous, target_status, label, sender)
+            )
+
+    return {
+        "status": target_status,
+        "updated": [item[0] for item in moved],
+        "skipped": skipped,
+    }
@@ -0,0 +1,275 @@
+"""Bank statement import and bulk reconciliation of payslips."""
+from __future__ import annotations
+
+import codecs
+import csv
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Iterator
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.messaging.events import queue_system_message
+from apps.users.utils import adjust_overdue_payslip_counts
+
+from .ledger import record_payslips_paid
+from .messages import payslip_reconciled_message
+from .models import Application, Payslip, TimesheetEntry
+from .roster import refresh_worker_summaries
+from .rollups import rollup_payslips_completed
+
+
+REFERENCE_PATTERN = re.compile(r"PAYS(\d+)", re.IGNORECASE)
+RECONCILABLE_INSTRUCTION_STATUSES = ("instructions_generated", "awaiting_bank_import")
+
+CSV_REFERENCE_COLUMNS = ("lodgement_reference", "reference", "description", "narrative", "details")
+CSV_AMOUNT_COLUMNS = ("amount", "debit", "credit")
+
+# Fixed-width offsets of an ABA detail (type 1) record, 0-indexed.
+ABA_AMOUNT_SLICE = slice(20, 30)
+ABA_REFERENCE_SLICE = slice(62, 80)
+
+
+@dataclass
+class StatementLine:
+    line_number: int
+    reference: str
+    amount_cents: int | None
+
+
+@dataclass
+class ReferenceTotal:
+    amount_cents: int = 0
+    line_numbers: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ReconciliationResult:
+    lines_read: int = 0
+    matched_payslip_ids: list[int] = field(default_factory=list)
+    exceptions: list[dict] = field(default_factory=list)
+
+    def add_exception(self, reason: str, *, line_numbers=None, reference: str = "", **extra) -> None:
+        self.exceptions.append(
+            {"reason": reason, "reference": reference, "lines": list(line_numbers or []), **extra}
+        )
+
+    def as_report(self) -> dict:
+        return {
+            "lines_read": self.lines_read,
+            "matched_count": len(self.matched_payslip_ids),
+            "matched_payslip_ids": self.matched_payslip_ids,
+            "exception_count": len(self.exceptions),
+            "exceptions": self.exceptions,
+        }
+
+
+def amount_to_cents(raw_value) -> int | None:
+    """Parse a statement amount ("-1,234.50", "$80") into absolute cents."""
+
+    cleaned = re.sub(r"[^\d.\-]", "", str(raw_value or ""))
+    if not cleaned:
+        return None
+    try:
+        amount = Decimal(cleaned)
+    except InvalidOperation:
+        return None
+    return abs(int((amount * 100).to_integral_value()))
+
+
+def _decode_lines(stream: Iterable, encoding: str = "utf-8-sig") -> Iterator[str]:
+    """Yield text lines from a binary or text stream without buffering the file."""
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for raw_line in stream:
+        line = decoder.decode(raw_line) if isinstance(raw_line, bytes) else raw_line
+        yield line.rstrip("\r\n")
+
+
+def _find_column(header: list[str], candidates: tuple[str, ...]) -> int | None:
+    normalized = [name.strip().lower().replace(" ", "_") for name in header]
+    for candidate in candidates:
+        if candidate in normalized:
+            return normalized.index(candidate)
+    return None
+
+
+def iter_csv_statement(lines: Iterable[str]) -> Iterator[StatementLine]:
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return
+    reference_index = _find_column(header, CSV_REFERENCE_COLUMNS)
+    amount_index = _find_column(header, CSV_AMOUNT_COLUMNS)
+    if reference_index is None or amount_index is None:
+        raise ValueError("CSV statements need a reference/description column and an amount column.")
+    for line_number, row in enumerate(reader, start=2):
+        if not any(cell.strip() for cell in row):
+            continue
+        reference = row[reference_index] if reference_index < len(row) else ""
+        amount = row[amount_index] if amount_index < len(row) else ""
+        yield StatementLine(line_number, reference.strip(), amount_to_cents(amount))
+
+
+def iter_aba_statement(lines: Iterable[str]) -> Iterator[StatementLine]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.startswith("1"):
+            continue
+        amount_field = line[ABA_AMOUNT_SLICE].strip()
+        amount_cents = int(amount_field) if amount_field.isdigit() else None
+        yield StatementLine(line_number, line[ABA_REFERENCE_SLICE].strip(), amount_cents)
+
+
+def detect_format(filename: str) -> str:
+    return "aba" if (filename or "").lower().endswith(".aba") else "csv"
+
+
+def expected_payout_cents(payslip: Payslip) -> int:
+    """Total debited from the employer for a payslip's ABA instructions."""
+
+    components = (payslip.commission_amount, payslip.net_payment, payslip.tax_withheld)
+    return sum(amount_to_cents(amount) for amount in components if amount and amount > 0)
+
+
+def _aggregate_references(
+    statement_lines: Iterable[StatementLine], result: ReconciliationResult
+) -> dict[int, ReferenceTotal]:
+    totals: dict[int, ReferenceTotal] = {}
+    for statement_line in statement_lines:
+        result.lines_read += 1
+        match = REFERENCE_PATTERN.search(statement_line.reference)
+        if not match:
+            result.add_exception(
+                "missing_reference",
+                line_numbers=[statement_line.line_number],
+                reference=statement_line.reference,
+            )
+            continue
+        if statement_line.amount_cents is None:
+            result.add_exception(
+                "invalid_amount",
+                line_numbers=[statement_line.line_number],
+                reference=match.group(0).upper(),
+            )
+            continue
+        bucket = totals.setdefault(int(match.group(1)), ReferenceTotal())
+        bucket.amount_cents += statement_line.amount_cents
+        bucket.line_numbers.append(statement_line.line_number)
+    return totals
+
+
+def reconcile_statement(
+    stream: Iterable,
+    *,
+    statement_format: str,
+    employer=None,
+    sender=None,
+    dry_run: bool = False,
+) -> ReconciliationResult:
+    """Match statement lines to payslips and bulk-complete the matched ones.
+
+    The file is read once and folded into per-reference totals; payslips are
+    then loaded with a single ``id__in`` query and indexed by id.
+    """
+
+    parser = iter_aba_statement if statement_format == "aba" else iter_csv_statement
+    result = ReconciliationResult()
+    totals = _aggregate_references(parser(_decode_lines(stream)), result)
+    if not totals:
+        return result
+
+    payslips = Payslip.objects.filter(id__in=totals.keys())
+    if employer is not None:
+        payslips = payslips.filter(employer=employer)
+    index = {
+        payslip.id: payslip
+        for payslip in payslips.only(
+            "id",
+            "status",
+            "instructions_status",
+            "employer_id",
+            "timesheet_id",
+            "offer_id",
+            "commission_amount",
+            "net_payment",
+            "tax_withheld",
+        )
+    }
+
+    matched: list[Payslip] = []
+    for payslip_id, bucket in sorted(totals.items()):
+        reference = f"PAYS{payslip_id}"
+        payslip = index.get(payslip_id)
+        if payslip is None:
+            result.add_exception("unknown_payslip", line_numbers=bucket.line_numbers, reference=reference)
+            continue
+        if payslip.instructions_status not in RECONCILABLE_INSTRUCTION_STATUSES:
+            result.add_exception(
+                "already_reconciled" if payslip.instructions_status == "completed" else "not_awaiting_payment",
+                line_numbers=bucket.line_numbers,
+                reference=reference,
+            )
+            continue
+        expected = expected_payout_cents(payslip)
+        if bucket.amount_cents != expected:
+            result.add_exception(
+                "amount_mismatch",
+                line_numbers=bucket.line_numbers,
+                reference=reference,
+                expected_cents=expected,
+                received_cents=bucket.amount_cents,
+            )
+            continue
+        matched.append(payslip)
+
+    result.matched_payslip_ids = [payslip.id for payslip in matched]
+    if matched and not dry_run:
+        settled = set(apply_reconciliation(result.matched_payslip_ids, sender=sender))
+        # Payslips completed by someone else between the read above and the lock.
+        for payslip_id in result.matched_payslip_ids:
+            if payslip_id not in settled:
+                result.add_exception(
+                    "already_reconciled", line_numbers=totals[payslip_id].line_numbers, reference=f"PAYS{payslip_id}"
+                )
+        result.matched_payslip_ids = [payslip_id for payslip_id in result.matched_payslip_ids if payslip_id in settled]
+    return result
+
+
+@transaction.atomic
+def apply_reconciliation(payslip_ids: list[int], *, sender=None) -> list[int]:
+    """Transition matched payslips, their entries and applications in bulk; returns the ids it completed.
+
+    Payslips no longer awaiting payment once locked are left alone and not returned.
+    """
+
+    now = timezone.now()
+    payslips = list(
+        Payslip.objects.select_related("offer", "offer__job", "employer")
+        .select_for_update(of=("self",))
+        .filter(id__in=payslip_ids, instructions_status__in=RECONCILABLE_INSTRUCTION_STATUSES)
+    )
+    if not payslips:
+        return []
+    Payslip.objects.filter(id__in=[payslip.id for payslip in payslips]).update(
+        status="completed", instructions_status="completed", updated_at=now
+    )
+    TimesheetEntry.objects.filter(
+        timesheet_id__in={payslip.timesheet_id for payslip in payslips},
+        payment_status__in=RECONCILABLE_INSTRUCTION_STATUSES,
+    ).update(payment_status="paid")
+    Application.objects.filter(offer__id__in={payslip.offer_id for payslip in payslips}).update(
+        last_paid_at=now, updated_at=now
+    )
+    record_payslips_paid(payslips)
+    rollup_payslips_completed(payslips)
+    refresh_worker_summaries({payslip.offer_id for payslip in payslips}, payslips=True)
+
+    settled_overdue = Counter(payslip.employer_id for payslip in payslips if payslip.status == "overdue")
+    adjust_overdue_payslip_counts({employer_id: -count for employer_id, count in settled_overdue.items()})
+
+    for payslip in payslips:
+        queue_system_message(payslip_reconciled_message(payslip, sender))
+    return [payslip.id for payslip in payslips]
@@ -0,0 +1,277 @@
+"""Regional work days towards a second or third working holiday visa.
+
+When timesheet entries are approved, the entries of jobs doing specified
+work in a regional postcode (the ``postcode``/``location_class`` columns
+classified on save by ``apps.jobs.regions``) are recorded as
+``RegionalWorkDay`` evidence rows, and each traveller's
+``RegionalWorkProgress`` counter is advanced by the rows actually inserted
+and the dates not seen before. A calendar date worked for two employers
+counts once. Reads never scan timesheets.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Case, DateField, DecimalField, F, IntegerField, Value, When
+from django.db.models.functions import Coalesce, Greatest, Least
+from django.utils import timezone
+
+from apps.jobs.regions import regional_work_filter, regional_work_postcode
+
+from .models import JobOffer, RegionalWorkDay, RegionalWorkProgress, TimesheetEntry
+
+
+SECOND_VISA_DAYS = 88
+THIRD_VISA_DAYS = 179
+REBUILD_CHUNK_SIZE = 200
+
+
+def record_regional_days(items: Iterable[tuple]) -> int:
+    """Record ``(offer, job, entries)`` approvals, ``entries`` being ``(entry_date, hours)`` pairs.
+
+    Returns the number of new days counted. Jobs outside regional Australia
+    or outside the specified-work categories are skipped without a query.
+    """
+
+    rows = []
+    for offer, job, entries in items:
+        postcode = regional_work_postcode(job)
+        if not postcode:
+            continue
+        rows.extend(
+            RegionalWorkDay(
+                traveller_id=offer.traveller_id,
+                offer_id=offer.id,
+                employer_id=offer.employer_id,
+                job_id=job.id,
+                work_date=entry_date,
+                hours=hours,
+                postcode=postcode,
+            )
+            for entry_date, hours in entries
+            if hours > 0
+        )
+    if not rows:
+        return 0
+
+    traveller_ids = sorted({row.traveller_id for row in rows})
+    with transaction.atomic():
+        # Each traveller's counter row is locked before their evidence is read,
+        # so concurrent approvals for the same traveller are serialised.
+        RegionalWorkProgress.objects.bulk_create(
+            [RegionalWorkProgress(traveller_id=traveller_id) for traveller_id in traveller_ids], ignore_conflicts=True
+        )
+        list(
+            RegionalWorkProgress.objects.select_for_update()
+            .filter(traveller_id__in=traveller_ids)
+            .order_by("traveller_id")
+            .values_list("pk", flat=True)
+        )
+        existing = set(
+            RegionalWorkDay.objects.filter(
+                traveller_id__in=traveller_ids, work_date__in={row.work_date for row in rows}
+            ).values_list("traveller_id", "offer_id", "work_date")
+        )
+        known = {(traveller_id, work_date) for traveller_id, _offer_id, work_date in existing}
+        inserted = []
+        deltas: dict[int, dict] = {}
+        for row in rows:
+            # Rows already stored would be ignored by the insert and must not advance the counter.
+            if (row.traveller_id, row.offer_id, row.work_date) in existing:
+                continue
+            existing.add((row.traveller_id, row.offer_id, row.work_date))
+            key = (row.traveller_id, row.work_date)
+            row.counted = key not in known
+            known.add(key)
+            inserted.append(row)
+            delta = deltas.setdefault(
+                row.traveller_id,
+                {"day_count": 0, "hours": Decimal("0"), "first_day": row.work_date, "last_day": row.work_date},
+            )
+            delta["day_count"] += int(row.counted)
+            delta["hours"] += row.hours
+            delta["first_day"] = min(delta["first_day"], row.work_date)
+            delta["last_day"] = max(delta["last_day"], row.work_date)
+        if not inserted:
+            return 0
+        RegionalWorkDay.objects.bulk_create(inserted, ignore_conflicts=True)
+        _advance_progress(deltas)
+    return sum(delta["day_count"] for delta in deltas.values())
+
+
+def pending_regional_entries(items: Iterable[tuple]) -> dict[int, list[tuple[date, Decimal]]]:
+    """Unlocked ``(entry_date, hours)`` per timesheet for ``(timesheet, job)`` pairs about to be approved.
+
+    Only timesheets of regional specified-work jobs are read; with none the
+    query is skipped.
+    """
+
+    timesheet_ids = [timesheet.id for timesheet, job in items if regional_work_postcode(job)]
+    entries: dict[int, list[tuple[date, Decimal]]] = {}
+    if not timesheet_ids:
+        return entries
+    rows = TimesheetEntry.objects.filter(timesheet_id__in=timesheet_ids, is_locked=False).values_list(
+        "timesheet_id", "entry_date", "hours_worked"
+    )
+    for timesheet_id, entry_date, hours in rows:
+        entries.setdefault(timesheet_id, []).append((entry_date, hours))
+    return entries
+
+
+def _advance_progress(deltas: dict[int, dict]) -> None:
+    """Add day and hour deltas and widen the date span of each traveller's (locked) counter in one ``UPDATE``."""
+
+    def case(field: str, output_field, combine):
+        whens = [
+            When(traveller_id=traveller_id, then=combine(F(field), Value(delta[field], output_field=output_field)))
+            for traveller_id, delta in deltas.items()
+        ]
+        return Case(*whens, default=F(field), output_field=output_field)
+
+    def add(current, value):
+        return current + value
+
+    def earliest(current, value):
+        return Least(Coalesce(current, value), value)
+
+    def latest(current, value):
+        return Greatest(Coalesce(current, value), value)
+
+    RegionalWorkProgress.objects.filter(traveller_id__in=deltas.keys()).update(
+        day_count=case("day_count", IntegerField(), add),
+        hours=case("hours", DecimalField(max_digits=9, decimal_places=2), add),
+        first_day=case("first_day", DateField(), earliest),
+        last_day=case("last_day", DateField(), latest),
+        updated_at=timezone.now(),
+    )
+
+
+def regional_work_progress(traveller, *, target_days: int = SECOND_VISA_DAYS) -> dict:
+    progress = RegionalWorkProgress.objects.filter(traveller=traveller).first()
+    day_count = progress.day_count if progress else 0
+    return {
+        "day_count": day_count,
+        "target_days": target_days,
+        "remaining_days": max(target_days - day_count, 0),
+        "completed": day_count >= target_days,
+        "hours": progress.hours if progress else Decimal("0"),
+        "first_day": progress.first_day if progress else None,
+        "last_day": progress.last_day if progress else None,
+        "updated_at": progress.updated_at if progress else None,
+    }
+
+
+def _expected_days(traveller_ids) -> dict[tuple[int, int, date], dict]:
+    postcodes = dict(
+        JobOffer.objects.filter(regional_work_filter("job__"), traveller_id__in=traveller_ids).values_list(
+            "id", "job__postcode"
+        )
+    )
+    rows = TimesheetEntry.objects.filter(
+        timesheet__offer_id__in=postcodes, is_locked=True, hours_worked__gt=0
+    ).values_list(
+        "timesheet__offer__traveller_id",
+        "timesheet__offer_id",
+        "timesheet__offer__employer_id",
+        "timesheet__offer__job_id",
+        "entry_date",
+        "hours_worked",
+    )
+    return {
+        (traveller_id, offer_id, entry_date): {
+            "employer_id": employer_id,
+            "job_id": job_id,
+            "hours": hours,
+            "postcode": postcodes[offer_id],
+        }
+        for traveller_id, offer_id, employer_id, job_id, entry_date, hours in rows
+    }
+
+
+def rebuild_regional_work(*, dry_run: bool = False) -> tuple[int, int]:
+    """Recompute evidence rows and counters from approved entries; returns ``(checked, drifted)`` travellers.
+
+    Travellers are processed in chunks; a traveller has drifted when any of
+    their rows or their counter differs from the recomputed state.
+    """
+
+    traveller_ids = sorted(
+        set(
+            JobOffer.objects.filter(timesheet__entries__is_locked=True)
+            .values_list("traveller_id", flat=True)
+            .distinct()
+        )
+        | set(RegionalWorkDay.objects.values_list("traveller_id", flat=True))
+        | set(RegionalWorkProgress.objects.values_list("traveller_id", flat=True))
+    )
+    drifted = 0
+    for start in range(0, len(traveller_ids), REBUILD_CHUNK_SIZE):
+        chunk = traveller_ids[start : start + REBUILD_CHUNK_SIZE]
+        expected = _expected_days(chunk)
+        existing = {
+            (row.traveller_id, row.offer_id, row.work_date): row
+            for row in RegionalWorkDay.objects.filter(traveller_id__in=chunk)
+        }
+
+        counted = set()
+        totals: dict[int, dict] = {}
+        for traveller_id, offer_id, work_date in sorted(expected, key=lambda key: (key[0], key[2], key[1])):
+            values = expected[(traveller_id, offer_id, work_date)]
+            values["counted"] = (traveller_id, work_date) not in counted
+            counted.add((traveller_id, work_date))
+            total = totals.setdefault(
+                traveller_id, {"day_count": 0, "hours": Decimal("0"), "first_day": work_date, "last_day": work_date}
+            )
+            total["day_count"] += int(values["counted"])
+            total["hours"] += values["hours"]
+            total["last_day"] = max(total["last_day"], work_date)
+
+        changed = set()
+        missing, stale = [], []
+        for key, values in expected.items():
+            row = existing.get(key)
+            if row is None:
+                missing.append(RegionalWorkDay(traveller_id=key[0], offer_id=key[1], work_date=key[2], **values))
+                changed.add(key[0])
+            elif any(getattr(row, name) != value for name, value in values.items()):
+                for name, value in values.items():
+                    setattr(row, name, value)
+                stale.append(row)
+                changed.add(key[0])
+        obsolete = [row.pk for key, row in existing.items() if key not in expected]
+        changed.update(key[0] for key in existing.keys() - expected.keys())
+
+        progress = {row.traveller_id: row for row in RegionalWorkProgress.objects.filter(traveller_id__in=chunk)}
+        empty = {"day_count": 0, "hours": Decimal("0"), "first_day": None, "last_day": None}
+        progress_stale, progress_missing = [], []
+        for traveller_id in chunk:
+            values = totals.get(traveller_id, empty)
+            row = progress.get(traveller_id)
+            if row is None:
+                if values is not empty:
+                    progress_missing.append(RegionalWorkProgress(traveller_id=traveller_id, **values))
+                    changed.add(traveller_id)
+            elif any(getattr(row, name) != value for name, value in values.items()):
+                for name, value in values.items():
+                    setattr(row, name, value)
+                progress_stale.append(row)
+                changed.add(traveller_id)
+
+        drifted += len(changed)
+        if dry_run:
+            continue
+        if obsolete:
+            RegionalWorkDay.objects.filter(pk__in=obsolete).delete()
+        if stale:
+            RegionalWorkDay.objects.bulk_update(stale, ["employer_id", "job_id", "hours", "postcode", "counted"])
+        if missing:
+            RegionalWorkDay.objects.bulk_create(missing, batch_size=500)
+        if progress_stale:
+            RegionalWorkProgress.objects.bulk_update(progress_stale, RegionalWorkProgress.PROGRESS_FIELDS)
+        if progress_missing:
+            RegionalWorkProgress.objects.bulk_create(progress_missing)
+    return len(traveller_ids), drifted
+
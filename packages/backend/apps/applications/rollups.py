@@ -0,0 +1,197 @@
+"""Materialised payroll totals per employer, job and month."""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from django.db.models import Case, Count, DecimalField, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import Payslip, PayrollRollup
+
+
+RollupKey = tuple[int, int, date]
+
+INTEGER_ROLLUP_FIELDS = ("payslip_count", "completed_count")
+
+
+def rollup_month(moment) -> date:
+    return timezone.localtime(moment).date().replace(day=1)
+
+
+def _rollup_key(payslip: Payslip) -> RollupKey:
+    return (payslip.employer_id, payslip.offer.job_id, rollup_month(payslip.created_at))
+
+
+def _add(deltas: dict[RollupKey, dict], key: RollupKey, values: dict) -> None:
+    row = deltas.setdefault(key, {})
+    for name, value in values.items():
+        row[name] = row.get(name, 0) + value
+
+
+def adjust_payroll_rollups(deltas: dict[RollupKey, dict]) -> None:
+    """Add per-field deltas to the rollup rows of each key, creating missing rows first.
+
+    Three queries however many keys: an ``INSERT … ON CONFLICT DO NOTHING``,
+    the id lookup and a single ``UPDATE`` with one ``CASE`` per field.
+    """
+
+    deltas = {key: values for key, values in deltas.items() if any(values.values())}
+    if not deltas:
+        return
+    PayrollRollup.objects.bulk_create(
+        [PayrollRollup(employer_id=employer_id, job_id=job_id, month=month) for employer_id, job_id, month in deltas],
+        ignore_conflicts=True,
+    )
+    query = Q()
+    for employer_id, job_id, month in deltas:
+        query |= Q(employer_id=employer_id, job_id=job_id, month=month)
+    ids = {
+        (employer_id, job_id, month): pk
+        for pk, employer_id, job_id, month in PayrollRollup.objects.filter(query).values_list(
+            "pk", "employer_id", "job_id", "month"
+        )
+    }
+
+    updates = {}
+    for name in PayrollRollup.ROLLUP_FIELDS:
+        output_field = IntegerField() if name in INTEGER_ROLLUP_FIELDS else DecimalField(max_digits=14, decimal_places=2)
+        whens = [When(pk=ids[key], then=Value(values[name])) for key, values in deltas.items() if values.get(name)]
+        if whens:
+            updates[name] = F(name) + Case(*whens, default=Value(0), output_field=output_field)
+    PayrollRollup.objects.filter(pk__in=ids.values()).update(**updates, updated_at=timezone.now())
+
+
+def rollup_payslips_issued(payslips: Iterable[Payslip], *, sign: int = 1) -> None:
+    """Count newly issued payslips in their month; ``sign=-1`` takes a voided payslip back out."""
+
+    deltas: dict[RollupKey, dict] = {}
+    for payslip in payslips:
+        _add(
+            deltas,
+            _rollup_key(payslip),
+            {
+                "payslip_count": sign,
+                "hour_count": sign * payslip.hour_count,
+                "gross_amount": sign * payslip.gross_amount,
+                "commission_amount": sign * payslip.commission_amount,
+                "tax_withheld": sign * payslip.tax_withheld,
+                "super_amount": sign * payslip.super_amount,
+                "net_payment": sign * payslip.net_payment,
+            },
+        )
+    adjust_payroll_rollups(deltas)
+
+
+def rollup_payslips_completed(payslips: Iterable[Payslip]) -> None:
+    """Count payslips that just became completed; callers pass each payslip once, on the transition."""
+
+    deltas: dict[RollupKey, dict] = {}
+    for payslip in payslips:
+        _add(deltas, _rollup_key(payslip), {"completed_count": 1, "paid_amount": payslip.net_payment})
+    adjust_payroll_rollups(deltas)
+
+
+def _aggregate_rollups(payslips) -> dict[RollupKey, dict]:
+    rows = (
+        payslips.order_by()
+        .annotate(month=TruncMonth("created_at"))
+        .values("employer_id", "offer__job_id", "month")
+        # Aliased: an annotation may not share its name with a field another aggregate reads.
+        .annotate(
+            total_payslip_count=Count("id"),
+            total_completed_count=Count("id", filter=Q(status="completed")),
+            total_hour_count=Sum("hour_count"),
+            total_gross_amount=Sum("gross_amount"),
+            total_commission_amount=Sum("commission_amount"),
+            total_tax_withheld=Sum("tax_withheld"),
+            total_super_amount=Sum("super_amount"),
+            total_net_payment=Sum("net_payment"),
+            total_paid_amount=Sum("net_payment", filter=Q(status="completed")),
+        )
+    )
+    aggregated = {}
+    for row in rows:
+        month = row["month"]
+        month = month.date() if hasattr(month, "date") else month
+        key = (row["employer_id"], row["offer__job_id"], month)
+        aggregated[key] = {name: row[f"total_{name}"] or 0 for name in PayrollRollup.ROLLUP_FIELDS}
+    return aggregated
+
+
+def _quantized(values: dict) -> dict:
+    return {
+        name: value if name in INTEGER_ROLLUP_FIELDS else Decimal(value).quantize(Decimal("0.01"))
+        for name, value in values.items()
+    }
+
+
+def rebuild_payroll_rollups(employer_ids=None, *, dry_run: bool = False) -> tuple[int, int]:
+    """Recompute rollups from payslips, one employer at a time; returns ``(checked, drifted)`` row counts.
+
+    Rows that differ are rewritten, missing rows created and rows without
+    payslips any more deleted.
+    """
+
+    payslips = Payslip.objects.all()
+    if employer_ids is None:
+        employer_ids = sorted(
+            set(payslips.values_list("employer_id", flat=True).distinct())
+            | set(PayrollRollup.objects.values_list("employer_id", flat=True).distinct())
+        )
+    checked = drifted = 0
+    for employer_id in employer_ids:
+        expected = {
+            key: _quantized(values)
+            for key, values in _aggregate_rollups(payslips.filter(employer_id=employer_id)).items()
+        }
+        existing = {
+            (row.employer_id, row.job_id, row.month): row for row in PayrollRollup.objects.filter(employer_id=employer_id)
+        }
+        stale, missing = [], []
+        for key, values in expected.items():
+            row = existing.get(key)
+            if row is None:
+                missing.append(PayrollRollup(employer_id=key[0], job_id=key[1], month=key[2], **values))
+            elif any(getattr(row, name) != value for name, value in values.items()):
+                for name, value in values.items():
+                    setattr(row, name, value)
+                row.updated_at = timezone.now()
+                stale.append(row)
+        obsolete = [row.pk for key, row in existing.items() if key not in expected]
+        checked += len(expected.keys() | existing.keys())
+        drifted += len(stale) + len(missing) + len(obsolete)
+        if dry_run:
+            continue
+        if stale:
+            PayrollRollup.objects.bulk_update(stale, [*PayrollRollup.ROLLUP_FIELDS, "updated_at"])
+        if missing:
+            PayrollRollup.objects.bulk_create(missing)
+        if obsolete:
+            PayrollRollup.objects.filter(pk__in=obsolete).delete()
+    return checked, drifted
+
+
+DASHBOARD_GROUPS = {
+    "month": ("month",),
+    "job": ("job_id", "job__title"),
+    "employer": ("employer_id", "employer__company_name"),
+}
+
+
+def payroll_dashboard(rollups, *, group_by: str = "month") -> dict:
+    """Sum rollup rows by ``group_by``, plus a grand total, in one query that never touches payslips."""
+
+    group_fields = DASHBOARD_GROUPS[group_by]
+    rows = list(
+        rollups.order_by()
+        .values(*group_fields)
+        .annotate(**{name: Sum(name) for name in PayrollRollup.ROLLUP_FIELDS})
+        .order_by(*group_fields)
+    )
+    totals = {name: sum((row[name] for row in rows), Decimal("0")) for name in PayrollRollup.ROLLUP_FIELDS}
+    for name in INTEGER_ROLLUP_FIELDS:
+        totals[name] = int(totals[name])
+    return {"group_by": group_by, "rows": rows, "totals": totals}
@@ -0,0 +1,132 @@
+"""Per-offer worker summaries behind the employer roster.
+
+A ``WorkerSummary`` row exists for every accepted offer. Hour columns are
+copied from the timesheet's running totals and payslip columns from the
+offer's latest payslip, each with one ``UPDATE ... SET col = (SELECT ...)``
+over the affected offers, so callers never have to pass fresh values in.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.db.models import CharField, DateField, DateTimeField, DecimalField, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Application, JobOffer, Payslip, Timesheet, WorkerSummary
+
+
+HOUR_FIELDS = (
+    "timesheet_status",
+    "total_hours",
+    "approved_unpaid_hours",
+    "pending_hours",
+    "paid_hours",
+    "last_entry_date",
+)
+PAYSLIP_FIELDS = ("last_payslip_id", "last_payslip_status", "last_payslip_at", "last_paid_at")
+REBUILD_CHUNK_SIZE = 500
+
+
+def _summary_expressions(*, payslips: bool) -> dict:
+    timesheet = Timesheet.objects.filter(offer_id=OuterRef("offer_id"))
+
+    def hours(expression):
+        return Coalesce(
+            Subquery(timesheet.annotate(value=expression).values("value")[:1]),
+            Value(0),
+            output_field=DecimalField(max_digits=9, decimal_places=2),
+        )
+
+    expressions = {
+        "timesheet_status": Coalesce(
+            Subquery(timesheet.values("status")[:1]), Value("draft"), output_field=CharField()
+        ),
+        "total_hours": hours(F("total_hours")),
+        "approved_unpaid_hours": hours(F("unpaid_hours")),
+        "pending_hours": hours(F("total_hours") - F("approved_hours")),
+        "paid_hours": hours(F("paid_hours")),
+        "last_entry_date": Subquery(timesheet.values("last_entry_date")[:1], output_field=DateField()),
+    }
+    if payslips:
+        latest = Payslip.objects.filter(offer_id=OuterRef("offer_id")).order_by("-created_at", "-id")
+        expressions.update(
+            last_payslip_id=Subquery(latest.values("id")[:1]),
+            last_payslip_status=Coalesce(Subquery(latest.values("status")[:1]), Value(""), output_field=CharField()),
+            last_payslip_at=Subquery(latest.values("created_at")[:1], output_field=DateTimeField()),
+            last_paid_at=Subquery(
+                Application.objects.filter(offer=OuterRef("offer_id")).values("last_paid_at")[:1],
+                output_field=DateTimeField(),
+            ),
+        )
+    return expressions
+
+
+def refresh_worker_summaries(offer_ids: Iterable[int], *, payslips: bool = False) -> None:
+    """Re-read the hour columns (and with ``payslips`` the payslip columns) of the offers' summaries."""
+
+    offer_ids = list(offer_ids)
+    if offer_ids:
+        WorkerSummary.objects.filter(offer_id__in=offer_ids).update(
+            **_summary_expressions(payslips=payslips), updated_at=timezone.now()
+        )
+
+
+def sync_worker_summary(offer: JobOffer, previous: dict | None, current: dict) -> None:
+    """Create, move or drop an offer's summary as it enters, changes job in, or leaves ``accepted``."""
+
+    was_accepted = previous is not None and previous["status"] == "accepted"
+    if current["status"] == "accepted" and not was_accepted:
+        WorkerSummary.objects.bulk_create(
+            [WorkerSummary(offer_id=offer.pk, employer_id=offer.employer_id, job_id=current["job_id"])],
+            ignore_conflicts=True,
+        )
+        refresh_worker_summaries([offer.pk], payslips=True)
+    elif current["status"] != "accepted" and was_accepted:
+        WorkerSummary.objects.filter(offer_id=offer.pk).delete()
+    elif was_accepted and previous["job_id"] != current["job_id"]:
+        WorkerSummary.objects.filter(offer_id=offer.pk).update(job_id=current["job_id"], updated_at=timezone.now())
+
+
+def rebuild_worker_summaries(*, dry_run: bool = False) -> tuple[int, int]:
+    """Reconcile summaries with accepted offers and recompute every column; returns ``(checked, drifted)``."""
+
+    accepted = dict(JobOffer.objects.filter(status="accepted").values_list("id", "job_id"))
+    existing = dict(WorkerSummary.objects.values_list("offer_id", "job_id"))
+    missing = accepted.keys() - existing.keys()
+    obsolete = existing.keys() - accepted.keys()
+    moved = {offer_id for offer_id in accepted.keys() & existing.keys() if accepted[offer_id] != existing[offer_id]}
+
+    expressions = _summary_expressions(payslips=True)
+    fields = HOUR_FIELDS + PAYSLIP_FIELDS
+    stale = set()
+    rows = (
+        WorkerSummary.objects.exclude(offer_id__in=obsolete)
+        .annotate(**{f"expected_{name}": expression for name, expression in expressions.items()})
+        .values("offer_id", *fields, *(f"expected_{name}" for name in fields))
+    )
+    for row in rows.iterator(chunk_size=2000):
+        if any(row[name] != row[f"expected_{name}"] for name in fields):
+            stale.add(row["offer_id"])
+
+    drifted = len(missing) + len(obsolete) + len(moved | stale)
+    if dry_run:
+        return len(accepted.keys() | existing.keys()), drifted
+    if obsolete:
+        WorkerSummary.objects.filter(offer_id__in=obsolete).delete()
+    for offer_id in moved:
+        WorkerSummary.objects.filter(offer_id=offer_id).update(job_id=accepted[offer_id])
+    if missing:
+        employers = dict(JobOffer.objects.filter(id__in=missing).values_list("id", "employer_id"))
+        WorkerSummary.objects.bulk_create(
+            [
+                WorkerSummary(offer_id=offer_id, employer_id=employers[offer_id], job_id=accepted[offer_id])
+                for offer_id in missing
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+    refresh_ids = sorted(missing | stale)
+    for start in range(0, len(refresh_ids), REBUILD_CHUNK_SIZE):
+        refresh_worker_summaries(refresh_ids[start : start + REBUILD_CHUNK_SIZE], payslips=True)
+    return len(accepted.keys() | existing.keys()), drifted
@@ -1,6 +1,6 @@
 """Serializers for applications."""
 from rest_framework import serializers
-from .models import Application, JobOffer, Timesheet, TimesheetEntry, Payslip
+from .models import Application, JobOffer, Timesheet, TimesheetEntry, Payslip, WorkerSummary
 
 
 class TimesheetEntrySerializer(serializers.ModelSerializer):
@@ -9,8 +9,8 @@ class TimesheetEntrySerializer(serializers.ModelSerializer):
         fields = ["entry_date", "hours_worked", "notes", "is_locked", "is_paid", "payment_status"]
 
 
-class TimesheetSerializer(serializers.ModelSerializer):
-    entries = TimesheetEntrySerializer(many=True, read_only=True)
+class TimesheetSummarySerializer(serializers.ModelSerializer):
+    """Timesheet header and running totals, without entries (used in list views)."""
 
     class Meta:
         model = Timesheet
@@ -20,10 +20,31 @@ class TimesheetSerializer(serializers.ModelSerializer):
             "employer_notes",
             "submitted_at",
             "approved_at",
-            "entries",
+            "total_hours",
+            "approved_hours",
+            "unpaid_hours",
+            "paid_hours",
+            "entry_count",
+            "first_entry_date",
+            "last_entry_date",
         ]
 
 
+class TimesheetSerializer(TimesheetSummarySerializer):
+    """Timesheet with its entries; pass ``entries`` in the context to serialize a window."""
+
+    entries = serializers.SerializerMethodField()
+
+    class Meta(TimesheetSummarySerializer.Meta):
+        fields = TimesheetSummarySerializer.Meta.fields + ["entries"]
+
+    def get_entries(self, obj: Timesheet):
+        entries = self.context.get("entries")
+        if entries is None:
+            entries = obj.entries.all()
+        return TimesheetEntrySerializer(entries, many=True).data
+
+
 class PayslipSerializer(serializers.ModelSerializer):
     traveller_name = serializers.CharField(read_only=True)
     pdf_url = serializers.SerializerMethodField()
@@ -79,6 +100,76 @@ class PayslipSerializer(serializers.ModelSerializer):
         return ""
 
 
+class IncomeStatementSerializer(serializers.Serializer):
+    """Financial-year totals read from the earnings ledger."""
+
+    scope = serializers.CharField()
+    financial_year = serializers.IntegerField()
+    hours_approved = serializers.DecimalField(max_digits=12, decimal_places=2)
+    gross = serializers.DecimalField(max_digits=14, decimal_places=2)
+    commission = serializers.DecimalField(max_digits=14, decimal_places=2)
+    tax_withheld = serializers.DecimalField(max_digits=14, decimal_places=2)
+    super_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    net_earned = serializers.DecimalField(max_digits=14, decimal_places=2)
+    net_paid = serializers.DecimalField(max_digits=14, decimal_places=2)
+    outstanding = serializers.DecimalField(max_digits=14, decimal_places=2)
+    snapshot_through_entry_id = serializers.IntegerField(allow_null=True)
+    snapshot_at = serializers.DateTimeField(allow_null=True)
+
+
+class RegionalWorkProgressSerializer(serializers.Serializer):
+    """A traveller's regional work days against a visa target."""
+
+    day_count = serializers.IntegerField()
+    target_days = serializers.IntegerField()
+    remaining_days = serializers.IntegerField()
+    completed = serializers.BooleanField()
+    hours = serializers.DecimalField(max_digits=9, decimal_places=2)
+    first_day = serializers.DateField(allow_null=True)
+    last_day = serializers.DateField(allow_null=True)
+    updated_at = serializers.DateTimeField(allow_null=True)
+
+
+class WorkerSummarySerializer(serializers.ModelSerializer):
+    """Roster row: the offer's maintained hours and pay position plus who and what it is for."""
+
+    application = serializers.IntegerField(source="offer.application_id", read_only=True)
+    traveller = serializers.IntegerField(source="offer.traveller_id", read_only=True)
+    traveller_name = serializers.SerializerMethodField()
+    job_title = serializers.CharField(source="job.title", read_only=True)
+    start_date = serializers.DateField(source="offer.start_date", read_only=True)
+    end_date = serializers.DateField(source="offer.end_date", read_only=True)
+
+    class Meta:
+        model = WorkerSummary
+        fields = [
+            "offer",
+            "application",
+            "traveller",
+            "traveller_name",
+            "job",
+            "job_title",
+            "start_date",
+            "end_date",
+            "timesheet_status",
+            "total_hours",
+            "approved_unpaid_hours",
+            "pending_hours",
+            "paid_hours",
+            "last_entry_date",
+            "last_payslip",
+            "last_payslip_status",
+            "last_payslip_at",
+            "last_paid_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def get_traveller_name(self, obj: WorkerSummary) -> str:
+        traveller = obj.offer.traveller
+        return traveller.get_full_name() or traveller.email
+
+
 class JobOfferSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source="job.title", read_only=True)
     employer_name = serializers.SerializerMethodField()
@@ -174,6 +265,43 @@ class JobOfferSerializer(serializers.ModelSerializer):
         return instance
 
 
+class JobOfferListSerializer(JobOfferSerializer):
+    """Offer rows for list views: the timesheet is summarised, entries are not embedded."""
+
+    def get_timesheet(self, obj: JobOffer):
+        timesheet = getattr(obj, "timesheet", None)
+        if not timesheet:
+            return None
+        return TimesheetSummarySerializer(timesheet).data
+
+
+class ApplicationPipelineCardSerializer(serializers.ModelSerializer):
+    """Compact application card for the employer pipeline board."""
+
+    applicant_name = serializers.SerializerMethodField()
+    applicant_profile_picture_url = serializers.CharField(
+        source="applicant.profile_picture_url", read_only=True
+    )
+
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "applicant",
+            "applicant_name",
+            "applicant_profile_picture_url",
+            "status",
+            "employer_viewed_at",
+            "submitted_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def get_applicant_name(self, obj: Application) -> str:
+        applicant = obj.applicant
+        return applicant.get_full_name() or applicant.username or applicant.email
+
+
 class ApplicationSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source="job.title", read_only=True)
     applicant_username = serializers.CharField(source="applicant.username", read_only=True)
@@ -206,10 +334,12 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "cover_letter",
             "status",
             "offer",
+            "employer_viewed_at",
             "submitted_at",
             "updated_at",
         ]
         read_only_fields = (
+            "employer_viewed_at",
             "submitted_at",
             "updated_at",
             "job_title",
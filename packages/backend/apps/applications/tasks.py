@@ -0,0 +1,48 @@
+"""Background tasks for applications and payroll."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.tasks.models import Task, TaskStatus
+from apps.tasks.queue import task
+
+from .overdue import OVERDUE_AFTER_DAYS, mark_overdue_payslips
+
+
+logger = logging.getLogger(__name__)
+
+MONITOR_OVERDUE_TASK = "applications.monitor_overdue_payslips"
+
+
+def _previous_run_watermark(name: str):
+    """When the last successful run of task ``name`` became due, or ``None`` without one.
+
+    A run is claimed no earlier than its ``run_at``, so this never skips what
+    the previous run could not have seen.
+    """
+
+    return (
+        Task.objects.filter(name=name, status=TaskStatus.SUCCEEDED)
+        .order_by("-finished_at")
+        .values_list("run_at", flat=True)
+        .first()
+    )
+
+
+@task(MONITOR_OVERDUE_TASK, queue="maintenance", every=timedelta(hours=1), max_attempts=3)
+def monitor_overdue_payslips() -> None:
+    """Hourly replacement for the ``monitor_overdue_payslips`` cron entry, using the previous run as watermark."""
+
+    cutoff = timezone.localdate() - timedelta(days=OVERDUE_AFTER_DAYS)
+    since = _previous_run_watermark(MONITOR_OVERDUE_TASK)
+    processed, employer_ids, suspended, _chunks = mark_overdue_payslips(cutoff, since)
+    if processed:
+        logger.info(
+            "Marked %s overdue payslips across %s employers, %s newly suspended.",
+            processed,
+            len(employer_ids),
+            len(suspended),
+        )
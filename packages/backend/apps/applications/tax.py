@@ -0,0 +1,241 @@
+"""PAYG withholding for working holiday makers from versioned rate tables.
+
+Each ``TaxTable`` lists the marginal brackets and the super guarantee rate in
+force from a date. Tables are compiled once into integer thresholds, basis
+point rates and the cumulative tax at every threshold, so the tax on a
+year-to-date income is a bracket lookup plus one multiplication. The
+withholding for a payslip is the tax on the traveller's year-to-date income
+after the payslip minus the tax before it, read from the maintained
+``TravellerTaxYear`` row instead of summing earlier payslips.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import TravellerTaxYear
+from .money import (
+    BASIS_POINTS,
+    COMMISSION_RATE,
+    PayrollRates,
+    PayslipComponents,
+    divide_half_even,
+    from_cents,
+    payslip_components_batch,
+    to_basis_points,
+    to_cents,
+)
+
+
+@dataclass(frozen=True)
+class TaxTable:
+    version: str
+    effective_from: date
+    # (income from, marginal rate) pairs in ascending order, starting at 0.
+    brackets: tuple[tuple[Decimal, Decimal], ...]
+    super_rate: Decimal
+
+
+WHM_TAX_TABLES = (
+    TaxTable(
+        version="whm-2023-24",
+        effective_from=date(2023, 7, 1),
+        brackets=(
+            (Decimal("0"), Decimal("0.15")),
+            (Decimal("45000"), Decimal("0.325")),
+            (Decimal("120000"), Decimal("0.37")),
+            (Decimal("180000"), Decimal("0.45")),
+        ),
+        super_rate=Decimal("0.11"),
+    ),
+    TaxTable(
+        version="whm-2024-25",
+        effective_from=date(2024, 7, 1),
+        brackets=(
+            (Decimal("0"), Decimal("0.15")),
+            (Decimal("45000"), Decimal("0.30")),
+            (Decimal("135000"), Decimal("0.37")),
+            (Decimal("190000"), Decimal("0.45")),
+        ),
+        super_rate=Decimal("0.115"),
+    ),
+    TaxTable(
+        version="whm-2025-26",
+        effective_from=date(2025, 7, 1),
+        brackets=(
+            (Decimal("0"), Decimal("0.15")),
+            (Decimal("45000"), Decimal("0.30")),
+            (Decimal("135000"), Decimal("0.37")),
+            (Decimal("190000"), Decimal("0.45")),
+        ),
+        super_rate=Decimal("0.12"),
+    ),
+)
+
+
+class CompiledTaxTable:
+    """Integer bracket lookup for one ``TaxTable``; tax is kept in cent-basis-points until rounded."""
+
+    def __init__(self, table: TaxTable):
+        self.version = table.version
+        self.effective_from = table.effective_from
+        self.thresholds = [to_cents(start) for start, _rate in table.brackets]
+        self.rates = [to_basis_points(rate) for _start, rate in table.brackets]
+        if not self.thresholds or self.thresholds[0] != 0 or self.thresholds != sorted(self.thresholds):
+            raise ValueError(f"Tax table {table.version} brackets must start at 0 and ascend.")
+        self.base_tax = [0]
+        for index in range(1, len(self.thresholds)):
+            width = self.thresholds[index] - self.thresholds[index - 1]
+            self.base_tax.append(self.base_tax[-1] + width * self.rates[index - 1])
+        self.payroll_rates = PayrollRates(to_basis_points(COMMISSION_RATE), 0, to_basis_points(table.super_rate))
+
+    def tax_units(self, income_cents: int) -> int:
+        if income_cents <= 0:
+            return 0
+        index = bisect_right(self.thresholds, income_cents) - 1
+        return self.base_tax[index] + (income_cents - self.thresholds[index]) * self.rates[index]
+
+    def withholding(self, ytd_cents: int, taxable_cents: int) -> int:
+        """Cents to withhold from ``taxable_cents`` earned on top of ``ytd_cents``."""
+
+        units = self.tax_units(ytd_cents + taxable_cents) - self.tax_units(ytd_cents)
+        return divide_half_even(units, BASIS_POINTS)
+
+
+COMPILED_TABLES = [CompiledTaxTable(table) for table in sorted(WHM_TAX_TABLES, key=lambda table: table.effective_from)]
+_EFFECTIVE_DATES = [table.effective_from for table in COMPILED_TABLES]
+
+
+def table_for(pay_date: date) -> CompiledTaxTable:
+    index = bisect_right(_EFFECTIVE_DATES, pay_date) - 1
+    if index < 0:
+        raise ValueError(f"No tax table in force on {pay_date}.")
+    return COMPILED_TABLES[index]
+
+
+def financial_year(pay_date: date) -> int:
+    return pay_date.year if pay_date.month >= 7 else pay_date.year - 1
+
+
+class PayrollItem(NamedTuple):
+    traveller_id: int
+    pay_date: date
+    rate_cents: int
+    hour_hundredths: int
+
+
+class PayrollResult(NamedTuple):
+    components: PayslipComponents
+    table_version: str
+    financial_year: int
+    ytd_taxable_cents: int
+
+    def payslip_metadata(self) -> dict:
+        return {"tax_table": self.table_version, "financial_year": self.financial_year}
+
+
+def _lock_tax_years(keys: set[tuple[int, int]]) -> dict[tuple[int, int], TravellerTaxYear]:
+    traveller_ids = {traveller_id for traveller_id, _year in keys}
+    years = {year for _traveller_id, year in keys}
+
+    def locked():
+        # A stable order keeps concurrent pay runs from deadlocking on each other's rows.
+        rows = (
+            TravellerTaxYear.objects.select_for_update()
+            .filter(traveller_id__in=traveller_ids, financial_year__in=years)
+            .order_by("traveller_id", "financial_year")
+        )
+        return {(row.traveller_id, row.financial_year): row for row in rows}
+
+    tax_years = locked()
+    missing = keys - tax_years.keys()
+    if missing:
+        TravellerTaxYear.objects.bulk_create(
+            [TravellerTaxYear(traveller_id=traveller_id, financial_year=year) for traveller_id, year in missing],
+            ignore_conflicts=True,
+        )
+        tax_years = locked()
+    return tax_years
+
+
+def compute_payroll_batch(items: Iterable[PayrollItem]) -> list[PayrollResult]:
+    """Payslip components with PAYG withholding for a pay run, recording each payslip in the YTD totals.
+
+    Must run inside the transaction that creates the payslips: the involved
+    ``TravellerTaxYear`` rows are locked, advanced in memory item by item (a
+    traveller may appear several times) and written back with one
+    ``bulk_update``.
+    """
+
+    items = list(items)
+    if not items:
+        return []
+    tax_years = _lock_tax_years({(item.traveller_id, financial_year(item.pay_date)) for item in items})
+    ytd = {
+        key: (to_cents(row.taxable_income), to_cents(row.tax_withheld), row.payslip_count)
+        for key, row in tax_years.items()
+    }
+
+    by_table: dict[CompiledTaxTable, list[int]] = defaultdict(list)
+    for index, item in enumerate(items):
+        by_table[table_for(item.pay_date)].append(index)
+    components: list = [None] * len(items)
+    tables: list = [None] * len(items)
+    for table, indexes in by_table.items():
+        rows = payslip_components_batch(
+            ((items[index].rate_cents, items[index].hour_hundredths) for index in indexes), table.payroll_rates
+        )
+        for index, row in zip(indexes, rows):
+            components[index] = row
+            tables[index] = table
+
+    results = []
+    for item, row, table in zip(items, components, tables):
+        key = (item.traveller_id, financial_year(item.pay_date))
+        taxable, withheld, count = ytd[key]
+        gross, commission, net_before_tax, _tax, _net, super_amount = row
+        tax_withheld = table.withholding(taxable, net_before_tax)
+        ytd[key] = (taxable + net_before_tax, withheld + tax_withheld, count + 1)
+        results.append(
+            PayrollResult(
+                PayslipComponents(
+                    gross, commission, net_before_tax, tax_withheld, net_before_tax - tax_withheld, super_amount
+                ),
+                table.version,
+                key[1],
+                taxable + net_before_tax,
+            )
+        )
+
+    now = timezone.now()
+    for key, row in tax_years.items():
+        taxable, withheld, count = ytd[key]
+        row.taxable_income = from_cents(taxable)
+        row.tax_withheld = from_cents(withheld)
+        row.payslip_count = count
+        row.updated_at = now
+    TravellerTaxYear.objects.bulk_update(
+        tax_years.values(), ["taxable_income", "tax_withheld", "payslip_count", "updated_at"]
+    )
+    return results
+
+
+def release_payslip_tax(payslip) -> None:
+    """Take a payslip that is being voided back out of its traveller's year-to-date totals."""
+
+    year = payslip.metadata.get("financial_year")
+    if year is None:
+        return
+    TravellerTaxYear.objects.filter(traveller_id=payslip.traveller_id, financial_year=year).update(
+        taxable_income=F("taxable_income") - payslip.net_before_tax,
+        tax_withheld=F("tax_withheld") - payslip.tax_withheld,
+        payslip_count=F("payslip_count") - 1,
+        updated_at=timezone.now(),
+    )
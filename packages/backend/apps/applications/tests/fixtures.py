@@ -0,0 +1,50 @@
+"""Shared fixtures for the applications tests: an employer, a job, a traveller and an accepted offer."""
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.applications.models import Application, JobOffer
+from apps.jobs.models import Job
+from apps.users.models import Employer
+
+
+def create_employer(email="boss@example.com", *, company_name="Farm Co", abn="", **user_fields) -> Employer:
+    """An employer profile; its user is ``employer.user``."""
+
+    user = get_user_model().objects.create_user(
+        email=email, username=email, password="pass", is_employer=True, **user_fields
+    )
+    return Employer.objects.create(user=user, company_name=company_name, abn=abn)
+
+
+def create_traveller(email="traveller@example.com", **user_fields):
+    return get_user_model().objects.create_user(
+        email=email, username=email, password="pass", is_traveller=True, **user_fields
+    )
+
+
+def create_job(employer: Employer, **fields) -> Job:
+    return Job.objects.create(
+        employer=employer, **{"title": "Picker", "description": "Pick", "location": "Mildura", **fields}
+    )
+
+
+def accept_offer(job: Job, traveller, **fields) -> JobOffer:
+    """An ``offer_accepted`` application for ``traveller`` and its accepted offer at 30.00 an hour."""
+
+    application = Application.objects.create(job=job, applicant=traveller, status="offer_accepted")
+    return JobOffer.objects.create(
+        application=application,
+        job=job,
+        employer=job.employer,
+        traveller=traveller,
+        **{"start_date": date(2025, 1, 1), "rate_amount": Decimal("30.00"), "status": "accepted", **fields},
+    )
+
+
+def authenticate(client, user) -> None:
+    """Send ``user``'s bearer token with every request of ``client``."""
+
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
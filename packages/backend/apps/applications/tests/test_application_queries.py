@@ -0,0 +1,77 @@
+"""Query budget for the application list and detail endpoints."""
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Timesheet, TimesheetEntry
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+# Auth user, employer suspension check, applications (joined) and timesheet entries.
+LIST_QUERY_BUDGET = 4
+
+
+class ApplicationQueryBudgetTests(APITestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.job = create_job(self.employer)
+        self.applications = []
+        authenticate(self.client, self.employer.user)
+
+    def _add_applicants(self, count):
+        start = len(self.applications)
+        for index in range(start, start + count):
+            offer = accept_offer(self.job, create_traveller(f"traveller{index}@example.com"))
+            timesheet = Timesheet.objects.create(offer=offer)
+            TimesheetEntry.objects.bulk_create(
+                [
+                    TimesheetEntry(timesheet=timesheet, entry_date=date(2025, 1, day), hours_worked=Decimal("8"))
+                    for day in range(1, 4)
+                ]
+            )
+            self.applications.append(offer.application)
+
+    def _list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("applications-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(self.applications))
+        return len(queries)
+
+    def test_list_query_count_is_constant(self):
+        self._add_applicants(2)
+        small = self._list_queries()
+        self._add_applicants(10)
+        large = self._list_queries()
+
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, LIST_QUERY_BUDGET)
+
+    def test_list_embeds_offer_and_timesheet_entries(self):
+        self._add_applicants(2)
+
+        response = self.client.get(reverse("applications-list"))
+
+        offer = response.data[0]["offer"]
+        self.assertEqual(offer["employer_name"], "Farm Co")
+        self.assertEqual(len(offer["timesheet"]["entries"]), 3)
+
+    def test_detail_query_budget(self):
+        self._add_applicants(1)
+        url = reverse("applications-detail", args=[self.applications[0].id])
+        # The employer's first visit also marks the application as read.
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["offer"]["timesheet"]["entries"]), 3)
+        # Auth user, application (joined) and timesheet entries.
+        self.assertLessEqual(len(queries), 3)
@@ -0,0 +1,98 @@
+"""Tests for the streaming CSV exports."""
+import csv
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Payslip, Timesheet, TimesheetEntry
+from apps.hours.models import HoursWorked
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class CsvExportTests(APITestCase):
+    def setUp(self):
+        employer = create_employer()
+        self.traveller = create_traveller()
+        offer = accept_offer(create_job(employer), self.traveller)
+        self.application = offer.application
+        timesheet = Timesheet.objects.create(offer=offer)
+        TimesheetEntry.objects.bulk_create(
+            [
+                TimesheetEntry(timesheet=timesheet, entry_date=date(2025, 1, day), hours_worked=Decimal("7.5"))
+                for day in range(1, 32)
+            ]
+        )
+        Payslip.objects.create(
+            timesheet=timesheet,
+            offer=offer,
+            employer=employer,
+            traveller=self.traveller,
+            hour_count=Decimal("10"),
+            rate_amount=Decimal("30.00"),
+            gross_amount=Decimal("300.00"),
+            commission_amount=Decimal("3.00"),
+            net_before_tax=Decimal("297.00"),
+            tax_withheld=Decimal("44.55"),
+            net_payment=Decimal("252.45"),
+            traveller_name="Tess Traveller",
+        )
+        HoursWorked.objects.bulk_create(
+            [
+                HoursWorked(application=self.application, worker=self.traveller, date=date(2025, 2, day), hours=8)
+                for day in range(1, 25)
+            ]
+        )
+        authenticate(self.client, employer.user)
+
+    def _rows(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        return list(csv.reader(StringIO(b"".join(response.streaming_content).decode())))
+
+    def test_timesheet_entries_with_columns_and_date_range(self):
+        url = reverse("applications-timesheet-entries-export-csv")
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self._rows(url, {"columns": "entry_date,hours_worked", "start_date": "2025-01-10"})
+
+        self.assertEqual(rows[0], ["entry_date", "hours_worked"])
+        self.assertEqual(rows[1], ["2025-01-10", "7.50"])
+        self.assertEqual(len(rows), 1 + 22)
+        # Auth user and the single streamed SELECT.
+        self.assertLessEqual(len(queries), 2)
+
+    def test_payslip_export_and_unknown_columns(self):
+        rows = self._rows(reverse("applications-payslips-export-csv"), {"columns": "traveller,net_payment"})
+        self.assertEqual(rows, [["traveller", "net_payment"], ["Tess Traveller", "252.45"]])
+
+        response = self.client.get(reverse("applications-payslips-export-csv"), {"columns": "password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_hours_export_is_scoped_to_the_traveller(self):
+        authenticate(self.client, self.traveller)
+
+        rows = self._rows(reverse("hours-export-csv"), {"end_date": "2025-02-10"})
+
+        self.assertEqual(rows[0][:3], ["id", "application_id", "worker_email"])
+        self.assertEqual(len(rows), 1 + 10)
+        self.assertEqual(rows[1][2], "traveller@example.com")
+
+    def test_formula_cells_are_neutralised(self):
+        TimesheetEntry.objects.filter(entry_date=date(2025, 1, 1)).update(notes='=HYPERLINK("http://evil","x")')
+        Payslip.objects.update(traveller_name="-Tess")
+
+        rows = self._rows(
+            reverse("applications-timesheet-entries-export-csv"), {"columns": "notes", "end_date": "2025-01-01"}
+        )
+        self.assertEqual(rows[1], ['\'=HYPERLINK("http://evil","x")'])
+        rows = self._rows(reverse("applications-payslips-export-csv"), {"columns": "traveller,net_payment"})
+        self.assertEqual(rows[1], ["'-Tess", "252.45"])
@@ -0,0 +1,98 @@
+"""Tests for the earnings ledger and its balance snapshots."""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.ledger import (
+    earnings_balance,
+    record_hours_approved,
+    record_payslip_issued,
+    record_payslips_paid,
+    take_earnings_snapshots,
+)
+from apps.applications.models import EarningsSnapshot, Payslip, Timesheet
+from apps.applications.tax import financial_year
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class EarningsLedgerTests(APITestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.traveller = create_traveller()
+        self.offer = accept_offer(create_job(self.employer), self.traveller)
+        self.timesheet = Timesheet.objects.create(offer=self.offer, status="approved")
+        self.year = financial_year(timezone.localdate())
+
+    def _issue_payslip(self, gross):
+        commission = (gross * Decimal("0.01")).quantize(Decimal("0.01"))
+        tax = ((gross - commission) * Decimal("0.15")).quantize(Decimal("0.01"))
+        payslip = Payslip.objects.create(
+            timesheet=self.timesheet,
+            offer=self.offer,
+            employer=self.employer,
+            traveller=self.traveller,
+            hour_count=gross / 30,
+            rate_amount=Decimal("30.00"),
+            gross_amount=gross,
+            commission_amount=commission,
+            net_before_tax=gross - commission,
+            tax_withheld=tax,
+            net_payment=gross - commission - tax,
+            super_amount=(gross * Decimal("0.12")).quantize(Decimal("0.01")),
+        )
+        record_payslip_issued(payslip)
+        return payslip
+
+    def test_balance_is_snapshot_plus_delta(self):
+        record_hours_approved([(self.timesheet, self.offer, Decimal("10"))])
+        first = self._issue_payslip(Decimal("300.00"))
+        record_payslips_paid([first])
+
+        created = take_earnings_snapshots(settle=timedelta(0))
+        self.assertEqual(created, {"traveller": 1, "employer": 1})
+        self._issue_payslip(Decimal("600.00"))
+        self.assertEqual(take_earnings_snapshots(settle=timedelta(hours=1)), {"traveller": 0, "employer": 0})
+
+        with self.assertNumQueries(2):
+            balance = earnings_balance("traveller", self.traveller.id, self.year)
+
+        self.assertIsNotNone(balance["snapshot_through_entry_id"])
+        self.assertEqual(balance["hours_approved"], Decimal("10"))
+        self.assertEqual(balance["gross"], Decimal("900.00"))
+        self.assertEqual(balance["net_paid"], first.net_payment)
+        self.assertEqual(balance["outstanding"], balance["net_earned"] - first.net_payment)
+        self.assertEqual(earnings_balance("employer", self.employer.id, self.year)["gross"], Decimal("900.00"))
+
+        take_earnings_snapshots(settle=timedelta(0))
+        latest = EarningsSnapshot.objects.filter(scope="traveller").order_by("-through_entry_id").first()
+        self.assertEqual(latest.gross, Decimal("900.00"))
+        self.assertEqual(earnings_balance("traveller", self.traveller.id, self.year)["gross"], Decimal("900.00"))
+
+    def test_reversal_cancels_a_voided_payslip(self):
+        payslip = self._issue_payslip(Decimal("300.00"))
+        record_payslip_issued(payslip, sign=-1)
+
+        balance = earnings_balance("traveller", self.traveller.id, self.year)
+
+        self.assertEqual((balance["gross"], balance["tax_withheld"]), (Decimal("0"), Decimal("0")))
+
+    def test_income_statement_endpoint(self):
+        self._issue_payslip(Decimal("300.00"))
+        url = reverse("applications-income-statement")
+
+        authenticate(self.client, self.traveller)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["scope"], "traveller")
+        self.assertEqual(response.data["gross"], "300.00")
+        self.assertEqual(response.data["outstanding"], "252.45")
+
+        authenticate(self.client, self.employer.user)
+        response = self.client.get(url, {"financial_year": self.year - 1})
+        self.assertEqual(response.data["scope"], "employer")
+        self.assertEqual(response.data["gross"], "0.00")
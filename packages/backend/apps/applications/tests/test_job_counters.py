@@ -0,0 +1,87 @@
+"""Tests for the application counters maintained on jobs."""
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application, JobOffer
+from apps.jobs.counters import rebuild_job_counters
+
+from .fixtures import authenticate, create_employer, create_job, create_traveller
+
+
+class JobCounterTests(APITestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.job = create_job(self.employer, status="active")
+        self.travellers = [create_traveller(f"traveller{index}@example.com") for index in range(3)]
+        authenticate(self.client, self.employer.user)
+
+    def _counters(self):
+        self.job.refresh_from_db()
+        return (
+            self.job.application_count,
+            self.job.new_application_count,
+            self.job.unread_application_count,
+            self.job.pending_offer_count,
+        )
+
+    def test_counters_follow_application_and_offer_changes(self):
+        applications = [Application.objects.create(job=self.job, applicant=user) for user in self.travellers]
+        self.assertEqual(self._counters(), (3, 3, 3, 0))
+
+        self.client.get(reverse("applications-detail", args=[applications[0].id]))
+        self.assertEqual(self._counters(), (3, 3, 2, 0))
+
+        self.client.post(
+            reverse("applications-job-pipeline-transition", args=[self.job.id]),
+            {"status": "review", "application_ids": [applications[0].id, applications[1].id]},
+            format="json",
+        )
+        self.assertEqual(self._counters(), (3, 1, 1, 0))
+
+        offer = JobOffer.objects.create(
+            application=applications[1],
+            job=self.job,
+            employer=self.employer,
+            traveller=self.travellers[1],
+            start_date=date(2025, 1, 1),
+            rate_amount=Decimal("30.00"),
+        )
+        self.assertEqual(self._counters(), (3, 1, 1, 1))
+
+        offer.status = "accepted"
+        offer.save(update_fields=["status", "updated_at"])
+        self.assertEqual(self._counters(), (3, 1, 1, 0))
+
+        self.assertEqual(rebuild_job_counters(dry_run=True), (1, 0))
+
+    def test_stale_copies_apply_a_transition_once(self):
+        application = Application.objects.create(job=self.job, applicant=self.travellers[0], status="review")
+        first, second = Application.objects.get(pk=application.pk), Application.objects.get(pk=application.pk)
+
+        for copy in (first, second):
+            copy.status = "submitted"
+            copy.save(update_fields=["status", "updated_at"])
+
+        self.assertEqual(self._counters(), (1, 1, 1, 0))
+        self.assertEqual(rebuild_job_counters(dry_run=True), (1, 0))
+
+    def test_employer_job_list_is_one_query_with_counters(self):
+        for index in range(4):
+            create_job(self.employer, title=f"Job {index}", description="d", location="Perth")
+        Application.objects.create(job=self.job, applicant=self.travellers[0])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("jobs-mine"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = next(item for item in response.data if item["id"] == self.job.id)
+        self.assertEqual(row["application_count"], 1)
+        self.assertEqual(row["unread_application_count"], 1)
+        job_queries = [query for query in queries.captured_queries if 'FROM "jobs_job"' in query["sql"]]
+        self.assertEqual(len(job_queries), 1)
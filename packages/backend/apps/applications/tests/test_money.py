@@ -0,0 +1,57 @@
+"""Equivalence tests for the integer-cent payroll engine."""
+import random
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from apps.applications.money import (
+    PayrollRates,
+    PayslipComponents,
+    decimal_payslip_components,
+    from_cents,
+    payslip_components,
+    payslip_components_batch,
+    to_basis_points,
+    to_cents,
+)
+
+
+class MoneyTests(SimpleTestCase):
+    def test_gross_rounding_matches_decimal_quantize(self):
+        for hour_hundredths in range(1, 2000):
+            (row,) = payslip_components_batch([(1, hour_hundredths)])
+            self.assertEqual(row[0], to_cents(from_cents(hour_hundredths) / 100), hour_hundredths)
+
+    def test_cent_conversions(self):
+        self.assertEqual(to_cents(Decimal("1893.38")), 189338)
+        self.assertEqual(to_cents(Decimal("0.125")), 12)
+        self.assertEqual(to_cents(Decimal("0.135")), 14)
+        self.assertEqual(str(from_cents(5)), "0.05")
+        self.assertEqual(str(from_cents(0)), "0.00")
+        with self.assertRaises(ValueError):
+            to_basis_points(Decimal("0.00001"))
+
+    def test_components_match_decimal_reference(self):
+        rng = random.Random(38)
+        pairs = [(rng.randint(1, 10_000), rng.randint(1, 20_000)) for _ in range(5_000)]
+        # Half-cent ties on every intermediate step.
+        pairs += [(2500, 50), (3050, 150), (1, 50), (3000, 7500), (2345, 1)]
+
+        batch = payslip_components_batch(pairs)
+
+        for (rate_cents, hour_hundredths), row in zip(pairs, batch):
+            expected = decimal_payslip_components(from_cents(rate_cents), from_cents(hour_hundredths))
+            self.assertEqual(PayslipComponents._make(row).as_payslip_fields(), expected, (rate_cents, hour_hundredths))
+            self.assertEqual(row, tuple(payslip_components(rate_cents, hour_hundredths)))
+
+    def test_custom_rates_match_decimal_reference(self):
+        rates = PayrollRates.from_decimals(Decimal("0.025"), Decimal("0.325"), Decimal("0.115"))
+        for rate_cents, hour_hundredths in ((3333, 777), (2999, 4025), (4150, 12)):
+            expected = decimal_payslip_components(
+                from_cents(rate_cents),
+                from_cents(hour_hundredths),
+                Decimal("0.025"),
+                Decimal("0.325"),
+                Decimal("0.115"),
+            )
+            self.assertEqual(payslip_components(rate_cents, hour_hundredths, rates).as_payslip_fields(), expected)
@@ -0,0 +1,114 @@
+"""Tests for the overdue payslip monitor."""
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.applications.models import Payslip, Timesheet
+from apps.applications.tasks import MONITOR_OVERDUE_TASK, monitor_overdue_payslips
+from apps.tasks.models import Task, TaskStatus
+from apps.users.models import Employer
+
+from .fixtures import accept_offer, create_employer, create_job, create_traveller
+
+
+class OverdueMonitorTests(TestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.traveller = create_traveller()
+        self.offer = accept_offer(create_job(self.employer), self.traveller)
+        self.timesheet = Timesheet.objects.create(offer=self.offer, status="approved")
+
+    def _payslip(self, ended_days_ago, *, issued_days_ago=0):
+        payslip = Payslip.objects.create(
+            timesheet=self.timesheet,
+            offer=self.offer,
+            employer=self.employer,
+            traveller=self.traveller,
+            hour_count=Decimal("10"),
+            rate_amount=Decimal("30.00"),
+            gross_amount=Decimal("300.00"),
+            commission_amount=Decimal("3.00"),
+            net_before_tax=Decimal("297.00"),
+            tax_withheld=Decimal("44.55"),
+            net_payment=Decimal("252.45"),
+            pay_period_end=timezone.localdate() - timedelta(days=ended_days_ago),
+            instructions_status="instructions_generated",
+        )
+        issued_at = timezone.now() - timedelta(days=issued_days_ago)
+        Payslip.objects.filter(pk=payslip.pk).update(created_at=issued_at, updated_at=issued_at)
+        return payslip
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("monitor_overdue_payslips", *args, stdout=out)
+        return out.getvalue()
+
+    def test_marks_in_chunks_and_suspends(self):
+        payslips = [self._payslip(30) for _ in range(3)]
+        self._payslip(2)
+
+        output = self._run("--chunk-size", "1")
+
+        self.assertIn("Identified 3 overdue payslips across 1 employers, marked in 3 chunk(s)", output)
+        overdue = set(Payslip.objects.filter(status="overdue").values_list("pk", flat=True))
+        self.assertEqual(overdue, {payslip.pk for payslip in payslips})
+        self.employer.refresh_from_db()
+        self.assertEqual((self.employer.overdue_payslip_count, self.employer.is_suspended), (3, True))
+        self.assertIn("Next watermark: --since ", output)
+
+    def test_reports_only_newly_suspended_employers(self):
+        self._payslip(30)
+        already = create_employer("other@example.com", company_name="Other")
+        Employer.objects.filter(pk=already.pk).update(is_suspended=True)
+        Payslip.objects.filter(pk=self._payslip(30).pk).update(employer=already)
+
+        output = self._run()
+
+        self.assertIn("across 2 employers", output)
+        self.assertIn(f"Suspended employers: {self.employer.pk}\n", output)
+
+    def test_since_keeps_late_payouts_for_old_periods(self):
+        previous_run = timezone.now() - timedelta(days=2)
+        self._payslip(30, issued_days_ago=20)
+        late_payout = self._payslip(30, issued_days_ago=1)
+        crossed_cutoff = self._payslip(8, issued_days_ago=20)
+
+        output = self._run("--since", previous_run.isoformat())
+
+        self.assertIn("Identified 2 overdue payslips", output)
+        self.assertEqual(
+            set(Payslip.objects.filter(status="overdue").values_list("pk", flat=True)),
+            {late_payout.pk, crossed_cutoff.pk},
+        )
+
+    def test_dry_run_changes_nothing(self):
+        self._payslip(30)
+
+        output = self._run("--dry-run")
+
+        self.assertIn("(dry-run: no changes applied)", output)
+        self.assertFalse(Payslip.objects.filter(status="overdue").exists())
+        self.employer.refresh_from_db()
+        self.assertFalse(self.employer.is_suspended)
+
+    def test_periodic_task_resumes_from_the_previous_run(self):
+        self._payslip(30, issued_days_ago=20)
+        late_payout = self._payslip(30, issued_days_ago=1)
+        Task.objects.create(
+            name=MONITOR_OVERDUE_TASK,
+            status=TaskStatus.SUCCEEDED,
+            run_at=timezone.now() - timedelta(days=2),
+            finished_at=timezone.now() - timedelta(days=2),
+        )
+
+        monitor_overdue_payslips()
+
+        self.assertEqual(list(Payslip.objects.filter(status="overdue").values_list("pk", flat=True)), [late_payout.pk])
+
+        Task.objects.all().delete()
+        monitor_overdue_payslips()
+        self.assertEqual(Payslip.objects.filter(status="overdue").count(), 2)
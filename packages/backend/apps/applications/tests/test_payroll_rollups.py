@@ -0,0 +1,111 @@
+"""Tests for the materialised payroll rollups and their dashboard."""
+from datetime import date
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import PayrollRollup, Payslip, Timesheet
+from apps.applications.rollups import (
+    rebuild_payroll_rollups,
+    rollup_month,
+    rollup_payslips_completed,
+    rollup_payslips_issued,
+)
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class PayrollRollupTests(APITestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.job = create_job(self.employer)
+        self.traveller = create_traveller()
+        self.offer = accept_offer(self.job, self.traveller)
+        self.timesheet = Timesheet.objects.create(offer=self.offer, status="approved")
+
+    def _issue_payslip(self, hours):
+        gross = hours * 30
+        payslip = Payslip.objects.create(
+            timesheet=self.timesheet,
+            offer=self.offer,
+            employer=self.employer,
+            traveller=self.traveller,
+            hour_count=hours,
+            rate_amount=Decimal("30.00"),
+            gross_amount=gross,
+            commission_amount=gross / 100,
+            net_before_tax=gross - gross / 100,
+            tax_withheld=Decimal("10.00"),
+            net_payment=gross - gross / 100 - 10,
+            super_amount=Decimal("12.00"),
+        )
+        rollup_payslips_issued([payslip])
+        return payslip
+
+    def _rollup(self):
+        return PayrollRollup.objects.get(employer=self.employer, job=self.job)
+
+    def test_issue_complete_and_void_adjust_the_month_row(self):
+        first = self._issue_payslip(Decimal("10.00"))
+        second = self._issue_payslip(Decimal("5.50"))
+        first.status = "completed"
+        first.save(update_fields=["status"])
+        with self.assertNumQueries(3):
+            rollup_payslips_completed([first])
+
+        rollup = self._rollup()
+        self.assertEqual(rollup.month, rollup_month(first.created_at))
+        self.assertEqual(rollup.payslip_count, 2)
+        self.assertEqual(rollup.completed_count, 1)
+        self.assertEqual(rollup.hour_count, Decimal("15.50"))
+        self.assertEqual(rollup.gross_amount, Decimal("465.00"))
+        self.assertEqual(rollup.paid_amount, first.net_payment)
+
+        rollup_payslips_issued([second], sign=-1)
+        second.delete()
+        rollup = self._rollup()
+        self.assertEqual(rollup.payslip_count, 1)
+        self.assertEqual(rollup.gross_amount, Decimal("300.00"))
+        self.assertEqual(rebuild_payroll_rollups(dry_run=True), (1, 0))
+
+    def test_rebuild_repairs_drift(self):
+        payslip = self._issue_payslip(Decimal("8.00"))
+        PayrollRollup.objects.update(payslip_count=7, gross_amount=Decimal("1.00"))
+        stray_job = create_job(self.employer, title="Packer", description="Pack")
+        PayrollRollup.objects.create(employer=self.employer, job=stray_job, month=date(2024, 1, 1), payslip_count=1)
+
+        self.assertEqual(rebuild_payroll_rollups(dry_run=True), (2, 2))
+        self.assertEqual(PayrollRollup.objects.count(), 2)
+        self.assertEqual(rebuild_payroll_rollups(), (2, 2))
+
+        rollup = self._rollup()
+        self.assertEqual(PayrollRollup.objects.count(), 1)
+        self.assertEqual(rollup.payslip_count, 1)
+        self.assertEqual(rollup.gross_amount, payslip.gross_amount)
+        self.assertEqual(rebuild_payroll_rollups(), (1, 0))
+
+    def test_dashboard_reads_rollups_for_the_employer(self):
+        self._issue_payslip(Decimal("10.00"))
+        PayrollRollup.objects.create(
+            employer=self.employer, job=self.job, month=date(2020, 3, 1), payslip_count=2, gross_amount=Decimal("50.00")
+        )
+        other = create_employer("other@example.com", company_name="Other")
+        other_job = create_job(other, location="Renmark")
+        PayrollRollup.objects.create(employer=other, job=other_job, month=date(2020, 3, 1), payslip_count=9)
+
+        authenticate(self.client, self.employer.user)
+        url = reverse("applications-payroll-rollups")
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["payslip_count"] for row in response.data["rows"]], [2, 1])
+        self.assertEqual(response.data["totals"]["payslip_count"], 3)
+        self.assertEqual(response.data["totals"]["gross_amount"], Decimal("350.00"))
+
+        response = self.client.get(url, {"group_by": "job", "end_month": "2020-03"})
+        self.assertEqual(response.data["rows"][0]["job__title"], "Picker")
+        self.assertEqual(response.data["totals"]["payslip_count"], 2)
+        self.assertEqual(self.client.get(url, {"start_month": "2020-13"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {"group_by": "traveller"}).status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,78 @@
+"""Tests for the streaming payslip archive export."""
+import tempfile
+import zipfile
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Payslip, Timesheet
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class PayslipExportTests(APITestCase):
+    def setUp(self):
+        employer = create_employer()
+        self.employer_user = employer.user
+        self.traveller = create_traveller()
+        offer = accept_offer(create_job(employer), self.traveller)
+        timesheet = Timesheet.objects.create(offer=offer, status="approved")
+        self.payslips = []
+        for index in range(3):
+            payslip = Payslip.objects.create(
+                timesheet=timesheet,
+                offer=offer,
+                employer=employer,
+                traveller=self.traveller,
+                hour_count=Decimal("10"),
+                rate_amount=Decimal("30.00"),
+                gross_amount=Decimal("300.00"),
+                commission_amount=Decimal("3.00"),
+                net_before_tax=Decimal("297.00"),
+                tax_withheld=Decimal("44.55"),
+                net_payment=Decimal("252.45"),
+            )
+            payslip.pdf_file.save("payslip.pdf", ContentFile(b"%PDF-" + bytes([index]) * 200_000), save=False)
+            payslip.aba_file.save("payslip.aba", ContentFile(f"0 ABA {index}\n".encode()), save=False)
+            payslip.save(update_fields=["pdf_file", "aba_file"])
+            self.payslips.append(payslip)
+        # An older payslip outside the exported range.
+        Payslip.objects.filter(pk=self.payslips[0].pk).update(created_at=timezone.now().replace(year=2020))
+
+    def _export(self, user, **params):
+        authenticate(self.client, user)
+        response = self.client.get(reverse("applications-payslips-export"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        # Files are copied chunk by chunk rather than buffered into one payload.
+        self.assertGreater(len(chunks), len(self.payslips))
+        return zipfile.ZipFile(BytesIO(b"".join(chunks)))
+
+    def test_employer_archive_streams_pdf_and_aba_files(self):
+        archive = self._export(self.employer_user, start_date="2021-01-01")
+
+        self.assertIsNone(archive.testzip())
+        names = archive.namelist()
+        self.assertEqual(len(names), 4)
+        payslip = self.payslips[2]
+        pdf_name = next(name for name in names if name.endswith(f"payslip-{payslip.id}.pdf"))
+        self.assertEqual(archive.read(pdf_name), b"%PDF-" + bytes([2]) * 200_000)
+        self.assertTrue(any(name.endswith(f"payslip-{payslip.id}.aba") for name in names))
+
+    def test_traveller_archive_only_contains_pdfs(self):
+        archive = self._export(self.traveller)
+
+        self.assertEqual(len(archive.namelist()), 3)
+        self.assertTrue(all(name.endswith(".pdf") for name in archive.namelist()))
+
+        authenticate(self.client, self.traveller)
+        response = self.client.get(reverse("applications-payslips-export"), {"include": "aba"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
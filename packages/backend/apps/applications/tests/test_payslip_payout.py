@@ -0,0 +1,108 @@
+"""Tests for payslip generation from approved timesheet hours."""
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import (
+    EarningsEntry,
+    PayrollRollup,
+    Payslip,
+    Timesheet,
+    TimesheetEntry,
+    TravellerTaxYear,
+)
+from apps.applications.timesheets import rebuild_timesheet_totals
+from apps.users.models import TravellerDocument
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+BANK_DETAILS = {"bank_name": "Bank", "bank_bsb": "123-456", "bank_account_number": "1234567"}
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class PayslipPayoutTests(APITestCase):
+    def setUp(self):
+        employer = create_employer(abn="1", **BANK_DETAILS)
+        offer = accept_offer(create_job(employer), create_traveller(tfn="1", **BANK_DETAILS))
+        self.application = offer.application
+        self.timesheet = Timesheet.objects.create(offer=offer, status="approved")
+        TimesheetEntry.objects.bulk_create(
+            [
+                TimesheetEntry(
+                    timesheet=self.timesheet, entry_date=date(2025, 1, day), hours_worked=Decimal("8"), is_locked=True
+                )
+                for day in range(1, 4)
+            ]
+        )
+        rebuild_timesheet_totals()
+        self.timesheet.refresh_from_db()
+        authenticate(self.client, employer.user)
+        self.url = reverse("applications-payslip", args=[self.application.id])
+
+    def test_payout_claims_hours_and_generates_instructions(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("lock-wait;dur=", response["Server-Timing"])
+        self.assertIn("critical-section;dur=", response["Server-Timing"])
+        payslip = Payslip.objects.get()
+        self.assertEqual(payslip.hour_count, Decimal("24"))
+        self.assertEqual(payslip.instructions_status, "instructions_generated")
+        self.assertTrue(payslip.pdf_file and payslip.aba_file)
+        self.assertEqual(TravellerDocument.objects.filter(source_type="payslip").count(), 2)
+        self.assertEqual(
+            set(TimesheetEntry.objects.values_list("is_paid", "payment_status")), {(True, "instructions_generated")}
+        )
+        self.timesheet.refresh_from_db()
+        self.assertEqual((self.timesheet.paid_hours, self.timesheet.unpaid_hours), (Decimal("24"), Decimal("0")))
+        tax_year = TravellerTaxYear.objects.get(traveller=payslip.traveller)
+        self.assertEqual(tax_year.taxable_income, payslip.net_before_tax)
+        self.assertEqual(tax_year.tax_withheld, payslip.tax_withheld)
+        self.assertEqual(payslip.metadata["financial_year"], tax_year.financial_year)
+
+        again = self.client.post(self.url)
+        self.assertEqual(again.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_failed_document_generation_releases_the_claim(self):
+        with mock.patch("apps.applications.views.render_payslip_pdf", side_effect=RuntimeError("renderer down")):
+            with self.assertRaises(RuntimeError):
+                self.client.post(self.url)
+
+        self.assertFalse(Payslip.objects.exists())
+        self.assertFalse(TimesheetEntry.objects.filter(is_paid=True).exists())
+        self.timesheet.refresh_from_db()
+        self.assertEqual((self.timesheet.paid_hours, self.timesheet.unpaid_hours), (Decimal("0"), Decimal("24")))
+        self.assertEqual(TravellerTaxYear.objects.get().payslip_count, 0)
+        self.assertEqual(EarningsEntry.objects.count(), 8)
+        self.assertEqual(sum(EarningsEntry.objects.values_list("amount", flat=True)), Decimal("0"))
+
+    def test_failed_rollup_releases_the_claim_without_reversing_it(self):
+        with mock.patch("apps.applications.views.rollup_payslips_issued", side_effect=RuntimeError("rollup down")):
+            with self.assertRaises(RuntimeError):
+                self.client.post(self.url)
+
+        self.assertFalse(Payslip.objects.exists())
+        self.assertFalse(PayrollRollup.objects.exists())
+        self.assertFalse(EarningsEntry.objects.exists())
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        rollup = PayrollRollup.objects.get()
+        self.assertEqual((rollup.payslip_count, rollup.hour_count), (1, Decimal("24.00")))
+
+    def test_replayed_payout_keeps_the_view_headers(self):
+        first = self.client.post(self.url, HTTP_IDEMPOTENCY_KEY="payout-1")
+        replay = self.client.post(self.url, HTTP_IDEMPOTENCY_KEY="payout-1")
+
+        self.assertEqual(replay.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(replay["Idempotent-Replayed"], "true")
+        self.assertEqual(replay["Server-Timing"], first["Server-Timing"])
+        self.assertEqual(replay["Content-Type"], "application/json")
+        self.assertEqual(Payslip.objects.count(), 1)
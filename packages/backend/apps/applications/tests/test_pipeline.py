@@ -0,0 +1,73 @@
+"""Tests for the per-job applicant pipeline."""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application
+from apps.messaging.models import Message
+
+from .fixtures import authenticate, create_employer, create_job, create_traveller
+
+
+class JobPipelineTests(APITestCase):
+    def setUp(self):
+        employer = create_employer()
+        self.job = create_job(employer)
+        self.applications = []
+        for index in range(7):
+            traveller = create_traveller(f"traveller{index}@example.com")
+            self.applications.append(
+                Application.objects.create(
+                    job=self.job, applicant=traveller, status="submitted" if index < 5 else "offer_sent"
+                )
+            )
+        authenticate(self.client, employer.user)
+
+    def test_board_counts_and_first_pages(self):
+        url = reverse("applications-job-pipeline", args=[self.job.id])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["counts"]["submitted"], 5)
+        self.assertEqual(response.data["counts"]["offer_sent"], 2)
+        self.assertEqual(response.data["total"], 7)
+        # Auth user, job, suspension check, grouped counts and the windowed first pages.
+        self.assertLessEqual(len(queries), 5)
+
+        column = next(item for item in response.data["columns"] if item["status"] == "submitted")
+        self.assertEqual([card["id"] for card in column["results"]], [self.applications[4].id, self.applications[3].id])
+        self.assertIsNotNone(column["next"])
+
+        seen = [card["id"] for card in column["results"]]
+        next_url = column["next"]
+        while next_url:
+            page = self.client.get(next_url)
+            seen.extend(card["id"] for card in page.data["results"])
+            next_url = page.data["next"]
+        self.assertEqual(seen, [application.id for application in reversed(self.applications[:5])])
+
+    def test_bulk_transition_updates_and_notifies(self):
+        url = reverse("applications-job-pipeline-transition", args=[self.job.id])
+        ids = [application.id for application in self.applications[:3]] + [self.applications[5].id, 999999]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {"status": "review", "application_ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], ids[:3])
+        self.assertEqual([item["application_id"] for item in response.data["skipped"]], ids[3:])
+        self.assertEqual(Application.objects.filter(status="review").count(), 3)
+        self.assertEqual(Message.objects.filter(message_type="application_status").count(), 3)
+
+    def test_bulk_transition_rejects_offer_statuses(self):
+        url = reverse("applications-job-pipeline-transition", args=[self.job.id])
+
+        response = self.client.post(
+            url, {"status": "hired", "application_ids": [self.applications[0].id]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
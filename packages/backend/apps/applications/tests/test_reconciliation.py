@@ -0,0 +1,143 @@
+"""Tests for bank statement reconciliation."""
+from datetime import date, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.applications.models import Application, Payslip, Timesheet, TimesheetEntry
+from apps.applications.reconciliation import apply_reconciliation, reconcile_statement
+from apps.messaging.models import Message
+
+from .fixtures import accept_offer, create_employer, create_job, create_traveller
+
+
+class ReconciliationTests(TestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.traveller = create_traveller()
+        self.offer = accept_offer(create_job(self.employer), self.traveller)
+        self.timesheet = Timesheet.objects.create(offer=self.offer, status="approved")
+        TimesheetEntry.objects.create(
+            timesheet=self.timesheet,
+            entry_date=date(2025, 1, 2),
+            hours_worked=Decimal("10"),
+            is_locked=True,
+            is_paid=True,
+            payment_status="instructions_generated",
+        )
+        self.payslip = self._create_payslip()
+
+    def _create_payslip(self):
+        return Payslip.objects.create(
+            timesheet=self.timesheet,
+            offer=self.offer,
+            employer=self.employer,
+            traveller=self.traveller,
+            hour_count=Decimal("10"),
+            rate_amount=Decimal("30.00"),
+            gross_amount=Decimal("300.00"),
+            commission_amount=Decimal("3.00"),
+            net_before_tax=Decimal("297.00"),
+            tax_withheld=Decimal("44.55"),
+            net_payment=Decimal("252.45"),
+            instructions_status="instructions_generated",
+        )
+
+    def _csv(self, *rows):
+        lines = ["Date,Description,Amount"] + [",".join(row) for row in rows]
+        return BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+
+    def test_csv_statement_completes_matching_payslip(self):
+        stream = self._csv(("2025-01-10", f"PAYS{self.payslip.id} batch", "-300.00"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = reconcile_statement(stream, statement_format="csv", employer=self.employer)
+
+        self.assertEqual(result.matched_payslip_ids, [self.payslip.id])
+        self.assertEqual(result.exceptions, [])
+        self.payslip.refresh_from_db()
+        self.assertEqual(self.payslip.status, "completed")
+        self.assertEqual(self.payslip.instructions_status, "completed")
+        self.assertEqual(self.timesheet.entries.get().payment_status, "paid")
+        self.assertIsNotNone(Application.objects.get().last_paid_at)
+        self.assertTrue(Message.objects.filter(metadata__payslip_id=self.payslip.id).exists())
+
+    def test_split_lines_are_summed_per_reference(self):
+        ref = f"PAYS{self.payslip.id}"
+        stream = self._csv(("d", f"{ref} COMM", "3.00"), ("d", f"{ref} NET PAY", "252.45"), ("d", f"{ref} WH TAX", "44.55"))
+
+        result = reconcile_statement(stream, statement_format="csv")
+
+        self.assertEqual(result.matched_payslip_ids, [self.payslip.id])
+
+    def test_mismatches_and_unknown_references_are_reported(self):
+        stream = self._csv(
+            ("d", f"PAYS{self.payslip.id}", "-299.99"),
+            ("d", "PAYS999999", "10.00"),
+            ("d", "Coffee", "4.50"),
+        )
+
+        result = reconcile_statement(stream, statement_format="csv", employer=self.employer)
+
+        reasons = sorted(item["reason"] for item in result.exceptions)
+        self.assertEqual(reasons, ["amount_mismatch", "missing_reference", "unknown_payslip"])
+        self.payslip.refresh_from_db()
+        self.assertEqual(self.payslip.status, "processing")
+
+    def test_payslips_completed_meanwhile_are_not_reported_as_settled(self):
+        other = self._create_payslip()
+        stream = self._csv(
+            ("d", f"PAYS{self.payslip.id}", "-300.00"),
+            ("d", f"PAYS{other.id}", "-300.00"),
+        )
+
+        def confirm_first(payslip_ids, **kwargs):
+            # An employer confirms the first payslip between the read and the lock.
+            Payslip.objects.filter(pk=self.payslip.pk).update(status="completed", instructions_status="completed")
+            return apply_reconciliation(payslip_ids, **kwargs)
+
+        with mock.patch("apps.applications.reconciliation.apply_reconciliation", side_effect=confirm_first):
+            result = reconcile_statement(stream, statement_format="csv", employer=self.employer)
+
+        self.assertEqual(result.matched_payslip_ids, [other.id])
+        self.assertEqual(
+            [(item["reason"], item["reference"]) for item in result.exceptions],
+            [("already_reconciled", f"PAYS{self.payslip.id}")],
+        )
+
+    def test_aba_return_records_are_matched_by_lodgement_reference(self):
+        ref = f"PAYS{self.payslip.id} NET PAY"
+        detail = (
+            "1" + "123-456" + f"{'12345678':<9}" + " " + "50" + f"{30000:010d}" + f"{'Traveller':<32}" + f"{ref:<18}"
+        ).ljust(120)
+        stream = BytesIO(("0" + " " * 119 + "\n" + detail + "\n").encode("ascii"))
+
+        result = reconcile_statement(stream, statement_format="aba", dry_run=True)
+
+        self.assertEqual(result.matched_payslip_ids, [self.payslip.id])
+        self.payslip.refresh_from_db()
+        self.assertEqual(self.payslip.status, "processing")
+
+    def test_overdue_counter_drives_suspension(self):
+        second = self._create_payslip()
+        Payslip.objects.update(pay_period_end=date.today() - timedelta(days=30))
+
+        call_command("monitor_overdue_payslips", stdout=StringIO())
+        self.employer.refresh_from_db()
+        self.assertEqual(self.employer.overdue_payslip_count, 2)
+        self.assertTrue(self.employer.is_suspended)
+
+        reconcile_statement(self._csv(("d", f"PAYS{self.payslip.id}", "300.00")), statement_format="csv")
+        self.employer.refresh_from_db()
+        self.assertEqual(self.employer.overdue_payslip_count, 1)
+        self.assertTrue(self.employer.is_suspended)
+
+        second.refresh_from_db()
+        second.status = "completed"
+        second.save(update_fields=["status"])
+        self.employer.refresh_from_db()
+        self.assertEqual(self.employer.overdue_payslip_count, 0)
+        self.assertFalse(self.employer.is_suspended)
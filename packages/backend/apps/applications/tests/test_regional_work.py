@@ -0,0 +1,140 @@
+"""Tests for regional work day tracking."""
+from datetime import date
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import RegionalWorkDay, RegionalWorkProgress, Timesheet, TimesheetEntry
+from apps.applications.regional import rebuild_regional_work, record_regional_days
+from apps.jobs.models import Job
+from apps.jobs.regions import (
+    classify_location,
+    postcode_index,
+    reclassify_job_locations,
+    regional_work_postcode,
+)
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class RegionalPostcodeTests(APITestCase):
+    def test_index_lookups(self):
+        index = postcode_index()
+        self.assertEqual((index.state(3500), index.location_class(3500)), ("VIC", "regional"))
+        self.assertEqual((index.state(870), index.location_class(870)), ("NT", "remote"))
+        self.assertEqual(index.location_class(2000), "major_city")
+        self.assertEqual(index.location_class(2618), "regional")
+        self.assertEqual(index.location_class(100), "unknown")
+        self.assertEqual(index.locality_postcode("wagga  wagga"), 2650)
+        self.assertIsNone(index.locality_postcode("Richmond"))
+        self.assertEqual(index.locality_postcode("Richmond", "TAS"), 7025)
+
+        self.assertEqual(classify_location(address="12 River Rd, Mildura VIC 3500"), ("3500", "regional"))
+        self.assertEqual(classify_location(location="Broome, WA"), ("6725", "remote"))
+        self.assertEqual(classify_location(city="Perth", state="Western Australia"), ("6000", "major_city"))
+        self.assertEqual(classify_location(location="Atlantis 0100"), ("", "unknown"))
+
+    def test_jobs_are_classified_on_save(self):
+        employer = create_employer("farm@example.com", company_name="Farm")
+        job = create_job(employer, location="Sydney NSW 2000", category="farming")
+        self.assertEqual((job.postcode, job.location_class), ("2000", "major_city"))
+        self.assertEqual(regional_work_postcode(job), "")
+
+        job.location_city = "Mildura"
+        job.location = "Mildura"
+        job.save(update_fields=["location", "location_city"])
+        job.refresh_from_db()
+        self.assertEqual((job.postcode, job.location_class), ("3500", "regional"))
+        self.assertEqual(regional_work_postcode(job), "3500")
+        job.category = "hospitality"
+        self.assertEqual(regional_work_postcode(job), "")
+
+        Job.objects.create(
+            employer=employer, title="Barista", description="Coffee", location="Alice Springs", category="hospitality"
+        )
+        Job.objects.update(is_live=True, status="active")
+        self.assertEqual(reclassify_job_locations(Job.objects.all(), dry_run=True), (2, 0))
+
+        response = self.client.get(reverse("jobs-list"), {"regional": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = response.data["results"] if isinstance(response.data, dict) else response.data
+        self.assertEqual(sorted(row["location_class"] for row in rows), ["regional", "remote"])
+        response = self.client.get(reverse("jobs-list"), {"location_class": "remote"})
+        rows = response.data["results"] if isinstance(response.data, dict) else response.data
+        self.assertEqual([row["title"] for row in rows], ["Barista"])
+        self.assertEqual(self.client.get(reverse("jobs-list"), {"location_class": "x"}).status_code, 400)
+
+
+class RegionalWorkTests(APITestCase):
+    def setUp(self):
+        self.traveller = create_traveller()
+        self.farm = self._timesheet("farm@example.com", "Mildura VIC 3500")
+        self.orchard = self._timesheet("orchard@example.com", "Shepparton VIC 3630")
+        self.cafe = self._timesheet("cafe@example.com", "Melbourne VIC 3000")
+
+    def _timesheet(self, email, location):
+        employer = create_employer(email, company_name=email.split("@")[0].title())
+        offer = accept_offer(create_job(employer, location=location, category="farming"), self.traveller)
+        return Timesheet.objects.create(offer=offer, status="submitted")
+
+    def _approve(self, timesheet, days):
+        TimesheetEntry.objects.bulk_create(
+            [
+                TimesheetEntry(timesheet=timesheet, entry_date=date(2025, 2, day), hours_worked=Decimal("8"))
+                for day in days
+            ]
+        )
+        Timesheet.objects.filter(pk=timesheet.pk).update(status="submitted")
+        authenticate(self.client, timesheet.offer.employer.user)
+        response = self.client.post(reverse("applications-timesheet-approve", args=[timesheet.offer.application_id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_approvals_count_distinct_regional_days(self):
+        self._approve(self.farm, [1, 2, 3])
+        self._approve(self.orchard, [3, 4])
+        self._approve(self.cafe, [5, 6])
+
+        progress = RegionalWorkProgress.objects.get(traveller=self.traveller)
+        self.assertEqual(progress.day_count, 4)
+        self.assertEqual(progress.hours, Decimal("40.00"))
+        self.assertEqual((progress.first_day, progress.last_day), (date(2025, 2, 1), date(2025, 2, 4)))
+        self.assertEqual(RegionalWorkDay.objects.filter(traveller=self.traveller).count(), 5)
+        self.assertEqual(rebuild_regional_work(dry_run=True), (1, 0))
+
+        authenticate(self.client, self.traveller)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("applications-regional-work"))
+        self.assertEqual(response.data["day_count"], 4)
+        self.assertEqual(response.data["remaining_days"], 84)
+        self.assertFalse(response.data["completed"])
+        response = self.client.get(reverse("applications-regional-work"), {"visa": "third"})
+        self.assertEqual(response.data["target_days"], 179)
+
+        response = self.client.get(reverse("applications-regional-work-evidence-csv"), {"end_date": "2025-02-03"})
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:4], ["work_date", "hours", "counted", "employer"])
+        self.assertEqual([line.split(",")[2] for line in lines[1:]], ["True", "True", "True", "False"])
+
+    def test_rebuild_recreates_lost_evidence(self):
+        self._approve(self.farm, [1, 2])
+        RegionalWorkDay.objects.filter(work_date=date(2025, 2, 2)).delete()
+        RegionalWorkProgress.objects.update(day_count=9)
+
+        self.assertEqual(rebuild_regional_work(), (1, 1))
+        progress = RegionalWorkProgress.objects.get(traveller=self.traveller)
+        self.assertEqual(progress.day_count, 2)
+        self.assertEqual(RegionalWorkDay.objects.count(), 2)
+        self.assertEqual(rebuild_regional_work(), (1, 0))
+
+    def test_replayed_approval_does_not_advance_the_counter(self):
+        self._approve(self.farm, [1, 2])
+        offer = self.farm.offer
+        entries = [(date(2025, 2, 2), Decimal("8")), (date(2025, 2, 3), Decimal("8"))]
+
+        self.assertEqual(record_regional_days([(offer, offer.job, entries)]), 1)
+
+        progress = RegionalWorkProgress.objects.get(traveller=self.traveller)
+        self.assertEqual((progress.day_count, progress.hours), (3, Decimal("24.00")))
+        self.assertEqual(RegionalWorkDay.objects.count(), 3)
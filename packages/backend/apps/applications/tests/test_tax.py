@@ -0,0 +1,61 @@
+"""Tests for table-driven PAYG withholding."""
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.applications.models import TravellerTaxYear
+from apps.applications.tax import PayrollItem, compute_payroll_batch, financial_year, table_for
+
+from .fixtures import create_traveller
+
+
+class TaxTableTests(TestCase):
+    def test_table_versions_follow_pay_date(self):
+        self.assertEqual(table_for(date(2024, 6, 30)).version, "whm-2023-24")
+        self.assertEqual(table_for(date(2024, 7, 1)).version, "whm-2024-25")
+        self.assertEqual(table_for(date(2030, 1, 1)).version, "whm-2025-26")
+        self.assertEqual(financial_year(date(2025, 6, 30)), 2024)
+        self.assertEqual(financial_year(date(2025, 7, 1)), 2025)
+
+    def test_withholding_splits_across_brackets(self):
+        table = table_for(date(2025, 8, 1))
+        # $44,000 already earned; $2,000 more: $1,000 at 15% and $1,000 at 30%.
+        self.assertEqual(table.withholding(4_400_000, 200_000), 45_000)
+        self.assertEqual(table.withholding(0, 100_000), 15_000)
+        self.assertEqual(table.withholding(20_000_000, 100_000), 45_000)
+
+
+class PayrollBatchTests(TestCase):
+    def setUp(self):
+        self.traveller = create_traveller()
+        self.other = create_traveller("other@example.com")
+
+    def test_batch_accumulates_year_to_date_per_traveller(self):
+        pay_date = date(2025, 9, 1)
+        TravellerTaxYear.objects.create(
+            traveller=self.traveller, financial_year=2025, taxable_income=Decimal("44000.00"), payslip_count=3
+        )
+        # $50/h for 40.4h: gross 2020.00, commission 20.20, taxable 1999.80.
+        items = [
+            PayrollItem(self.traveller.id, pay_date, 5000, 4040),
+            PayrollItem(self.other.id, pay_date, 5000, 4040),
+            PayrollItem(self.traveller.id, pay_date, 5000, 4040),
+        ]
+
+        # Lock, create the missing tax year, lock again, then one bulk update.
+        with self.assertNumQueries(4):
+            first, other, second = compute_payroll_batch(items)
+
+        self.assertEqual(first.components.net_before_tax, 199_980)
+        self.assertEqual(first.components.tax_withheld, 15_000 + 29_994)
+        self.assertEqual(other.components.tax_withheld, 29_997)
+        self.assertEqual(second.components.tax_withheld, 59_994)
+        self.assertEqual(first.components.super_amount, 24_240)
+        self.assertEqual(first.table_version, "whm-2025-26")
+
+        tax_year = TravellerTaxYear.objects.get(traveller=self.traveller, financial_year=2025)
+        self.assertEqual(tax_year.taxable_income, Decimal("47999.60"))
+        self.assertEqual(tax_year.tax_withheld, Decimal("1049.88"))
+        self.assertEqual(tax_year.payslip_count, 5)
+        self.assertTrue(TravellerTaxYear.objects.filter(traveller=self.other, payslip_count=1).exists())
@@ -0,0 +1,158 @@
+"""Tests for diff-based timesheet synchronisation."""
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Timesheet, TimesheetEntry
+from apps.applications.timesheets import rebuild_timesheet_totals
+from apps.messaging.models import Message
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class TimesheetSyncTests(APITestCase):
+    def setUp(self):
+        self.traveller = create_traveller()
+        offer = accept_offer(create_job(create_employer()), self.traveller)
+        self.application = offer.application
+        self.timesheet = Timesheet.objects.create(offer=offer)
+        TimesheetEntry.objects.bulk_create(
+            [
+                TimesheetEntry(timesheet=self.timesheet, entry_date=date(2025, 1, day), hours_worked=Decimal("8"))
+                for day in range(1, 31)
+            ]
+        )
+        rebuild_timesheet_totals()
+        self.url = reverse("applications-timesheet", args=[self.application.id])
+        authenticate(self.client, self.traveller)
+
+    def _full_payload(self, overrides=None):
+        overrides = overrides or {}
+        entries = []
+        for entry in self.timesheet.entries.all():
+            hours = overrides.get(entry.entry_date.day, entry.hours_worked)
+            if hours is not None:
+                entries.append({"entry_date": entry.entry_date.isoformat(), "hours_worked": str(hours)})
+        return {"entries": entries}
+
+    def test_unchanged_put_has_no_side_effects(self):
+        payload = self._full_payload()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.put(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(callbacks)
+        self.assertFalse(Message.objects.exists())
+
+    def test_put_query_count_does_not_grow_with_changed_rows(self):
+        self.client.put(self.url, self._full_payload({1: "7"}), format="json")
+        few = self._full_payload({1: "6", 2: None})
+        with CaptureQueriesContext(connection) as few_queries:
+            self.client.put(self.url, few, format="json")
+
+        many = self._full_payload({**{day: "6" for day in range(3, 20)}, **{day: None for day in range(20, 31)}})
+        with CaptureQueriesContext(connection) as many_queries:
+            response = self.client.put(self.url, many, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(few_queries), len(many_queries))
+        self.assertEqual(self.timesheet.entries.count(), 18)
+
+    def test_patch_only_touches_sent_days(self):
+        payload = {
+            "entries": [
+                {"entry_date": "2025-01-05", "hours_worked": "4.5"},
+                {"entry_date": "2025-01-06", "delete": True},
+                {"entry_date": "2025-02-01", "hours_worked": "8"},
+            ]
+        }
+
+        # The system message is posted once the write has committed.
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.timesheet.entries.count(), 30)
+        self.assertEqual(self.timesheet.entries.get(entry_date=date(2025, 1, 5)).hours_worked, Decimal("4.5"))
+        self.assertFalse(self.timesheet.entries.filter(entry_date=date(2025, 1, 6)).exists())
+        self.assertEqual(Message.objects.count(), 1)
+
+    def test_consecutive_updates_share_one_message(self):
+        for hours in ("4", "5", "6"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(
+                    self.url, {"entries": [{"entry_date": "2025-01-05", "hours_worked": hours}]}, format="json"
+                )
+
+        message = Message.objects.get()
+        self.assertEqual(message.metadata["coalesced_count"], 3)
+        self.assertEqual(message.metadata["total_hours"], "238.00")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("applications-timesheet-submit", args=[self.application.id]))
+        self.assertEqual(Message.objects.count(), 2)
+
+    def test_locked_entries_cannot_change(self):
+        self.timesheet.entries.filter(entry_date=date(2025, 1, 1)).update(is_locked=True)
+
+        response = self.client.patch(
+            self.url, {"entries": [{"entry_date": "2025-01-01", "hours_worked": "2"}]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_running_totals_follow_writes(self):
+        self.timesheet.entries.filter(entry_date__lte=date(2025, 1, 10)).update(is_locked=True)
+        rebuild_timesheet_totals()
+
+        self.client.put(self.url, self._full_payload({30: None, 29: "4"}), format="json")
+
+        self.timesheet.refresh_from_db()
+        self.assertEqual(self.timesheet.entry_count, 29)
+        self.assertEqual(self.timesheet.total_hours, Decimal("228"))
+        self.assertEqual(self.timesheet.approved_hours, Decimal("80"))
+        self.assertEqual(self.timesheet.unpaid_hours, Decimal("80"))
+        self.assertEqual(self.timesheet.first_entry_date, date(2025, 1, 1))
+        self.assertEqual(self.timesheet.last_entry_date, date(2025, 1, 29))
+        self.assertEqual(rebuild_timesheet_totals(dry_run=True), (1, 0))
+
+    def test_get_returns_only_the_requested_window(self):
+        response = self.client.get(self.url, {"start_date": "2025-01-10", "end_date": "2025-01-16"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["entries"]), 7)
+        self.assertEqual(response.data["entry_count"], 30)
+
+    def test_traveller_job_list_embeds_summary_only(self):
+        response = self.client.get(reverse("applications-my-jobs"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("entries", response.data[0]["timesheet"])
+        self.assertEqual(response.data[0]["timesheet"]["total_hours"], "240.00")
+
+    def test_bulk_approve_reports_per_application_outcomes(self):
+        self.timesheet.status = "submitted"
+        self.timesheet.save(update_fields=["status"])
+        authenticate(self.client, self.application.job.employer.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("applications-timesheets-bulk-approve"),
+                {"application_ids": [self.application.id, 999999]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["approved_count"], 1)
+        self.assertEqual([item["status"] for item in response.data["results"]], ["approved", "error"])
+        self.timesheet.refresh_from_db()
+        self.assertEqual(self.timesheet.status, "approved")
+        self.assertEqual(self.timesheet.unpaid_hours, Decimal("240"))
+        self.assertFalse(self.timesheet.entries.filter(is_locked=False).exists())
+        self.assertEqual(Message.objects.filter(message_type="timesheet").count(), 1)
@@ -0,0 +1,94 @@
+"""Tests for the maintained worker summaries and the employer roster."""
+from decimal import Decimal
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application, Payslip, WorkerSummary
+from apps.applications.roster import rebuild_worker_summaries, refresh_worker_summaries
+
+from .fixtures import accept_offer, authenticate, create_employer, create_job, create_traveller
+
+
+class WorkerRosterTests(APITestCase):
+    def setUp(self):
+        self.employer = create_employer()
+        self.job = create_job(self.employer)
+        self.offers = [
+            accept_offer(self.job, create_traveller(f"traveller{index}@example.com")) for index in range(3)
+        ]
+
+    def test_summary_follows_the_timesheet_and_payslip_flows(self):
+        offer = self.offers[0]
+        traveller = offer.traveller
+        authenticate(self.client, traveller)
+        entries = [{"entry_date": f"2025-01-0{day}", "hours_worked": "8"} for day in (1, 2, 3)]
+        self.client.put(reverse("applications-timesheet", args=[offer.application_id]), {"entries": entries}, format="json")
+        self.client.post(reverse("applications-timesheet-submit", args=[offer.application_id]))
+
+        summary = WorkerSummary.objects.get(offer=offer)
+        self.assertEqual(summary.timesheet_status, "submitted")
+        self.assertEqual(summary.total_hours, Decimal("24.00"))
+        self.assertEqual(summary.pending_hours, Decimal("24.00"))
+        self.assertEqual(summary.approved_unpaid_hours, Decimal("0.00"))
+
+        authenticate(self.client, self.employer.user)
+        self.client.post(reverse("applications-timesheet-approve", args=[offer.application_id]))
+        summary.refresh_from_db()
+        self.assertEqual(summary.timesheet_status, "approved")
+        self.assertEqual(summary.pending_hours, Decimal("0.00"))
+        self.assertEqual(summary.approved_unpaid_hours, Decimal("24.00"))
+
+        payslip = Payslip.objects.create(
+            timesheet=offer.timesheet,
+            offer=offer,
+            employer=self.employer,
+            traveller=traveller,
+            hour_count=Decimal("24.00"),
+            rate_amount=Decimal("30.00"),
+            gross_amount=Decimal("720.00"),
+            commission_amount=Decimal("7.20"),
+            net_before_tax=Decimal("712.80"),
+            tax_withheld=Decimal("106.92"),
+            net_payment=Decimal("605.88"),
+            super_amount=Decimal("86.40"),
+            status="completed",
+        )
+        Application.objects.filter(pk=offer.application_id).update(last_paid_at=timezone.now())
+        refresh_worker_summaries([offer.id], payslips=True)
+        summary.refresh_from_db()
+        self.assertEqual(summary.last_payslip_id, payslip.id)
+        self.assertEqual(summary.last_payslip_status, "completed")
+        self.assertIsNotNone(summary.last_paid_at)
+
+        offer.status = "cancelled"
+        offer.save(update_fields=["status", "updated_at"])
+        self.assertFalse(WorkerSummary.objects.filter(offer=offer).exists())
+
+    def test_roster_is_one_query_per_page(self):
+        authenticate(self.client, self.employer.user)
+        url = reverse("applications-my-workers-roster")
+        with self.assertNumQueries(2):  # the authenticating user, then the page
+            response = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["offer"] for row in response.data["results"]], [self.offers[2].id, self.offers[1].id])
+        self.assertEqual(response.data["results"][0]["traveller_name"], "traveller2@example.com")
+        self.assertEqual(response.data["results"][0]["job_title"], "Picker")
+        response = self.client.get(response.data["next"])
+        self.assertEqual([row["offer"] for row in response.data["results"]], [self.offers[0].id])
+
+        authenticate(self.client, self.offers[0].traveller)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_rebuild_repairs_drift(self):
+        WorkerSummary.objects.filter(offer=self.offers[0]).update(total_hours=Decimal("99"))
+        WorkerSummary.objects.filter(offer=self.offers[1]).delete()
+
+        self.assertEqual(rebuild_worker_summaries(dry_run=True), (3, 2))
+        self.assertEqual(rebuild_worker_summaries(), (3, 2))
+        self.assertEqual(WorkerSummary.objects.count(), 3)
+        self.assertEqual(WorkerSummary.objects.get(offer=self.offers[0]).total_hours, Decimal("0"))
+        self.assertEqual(rebuild_worker_summaries(), (3, 0))
@@ -0,0 +1,334 @@
+"""Diff-based synchronisation of timesheet entries."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from apps.messaging.events import queue_system_message
+
+from .ledger import record_hours_approved
+from .messages import timesheet_message
+from .models import Timesheet, TimesheetEntry
+from .regional import pending_regional_entries, record_regional_days
+from .roster import refresh_worker_summaries
+
+
+@dataclass
+class TimesheetDiff:
+    to_create: list[TimesheetEntry] = field(default_factory=list)
+    to_update: list[TimesheetEntry] = field(default_factory=list)
+    to_delete: list[TimesheetEntry] = field(default_factory=list)
+    result_entries: list[TimesheetEntry] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.to_create or self.to_update or self.to_delete)
+
+
+def _parse_entry(entry) -> tuple:
+    if not isinstance(entry, dict):
+        raise ValidationError({"detail": "Invalid entry payload."})
+    entry_date = parse_date(entry.get("entry_date") or "")
+    if not entry_date:
+        raise ValidationError({"detail": "Each entry requires a valid entry_date."})
+    if entry.get("delete"):
+        return entry_date, None, ""
+    try:
+        hours_value = Decimal(str(entry.get("hours_worked")))
+    except (InvalidOperation, TypeError):
+        raise ValidationError({"detail": "Hours must be a numeric value."})
+    if not hours_value.is_finite():
+        raise ValidationError({"detail": "Hours must be a numeric value."})
+    if hours_value <= 0:
+        raise ValidationError({"detail": "Hours must be greater than zero."})
+    return entry_date, hours_value, entry.get("notes") or ""
+
+
+def compute_timesheet_diff(timesheet: Timesheet, entries_payload: list, *, partial: bool = False) -> TimesheetDiff:
+    """Compare a payload with stored entries and return the minimal change set.
+
+    In full mode (PUT) the payload is the complete list of days and any
+    unlocked day missing from it is removed. In partial mode (PATCH) only the
+    days sent are touched; ``{"entry_date": ..., "delete": true}`` removes one.
+    """
+
+    existing_entries = {entry.entry_date: entry for entry in timesheet.entries.all()}
+    diff = TimesheetDiff()
+    seen_entry_dates = set()
+
+    for entry in entries_payload:
+        entry_date, hours_value, notes_value = _parse_entry(entry)
+        if entry_date in seen_entry_dates:
+            raise ValidationError({"detail": f"Duplicate entry for {entry_date.isoformat()}."})
+        seen_entry_dates.add(entry_date)
+        existing = existing_entries.get(entry_date)
+
+        if existing and existing.is_locked:
+            unchanged = hours_value is not None and (
+                existing.hours_worked == hours_value and (existing.notes or "") == notes_value
+            )
+            if not unchanged:
+                raise ValidationError(
+                    {"detail": f"Hours for {entry_date.isoformat()} have already been approved and cannot be changed."}
+                )
+            continue
+
+        if hours_value is None:
+            if existing:
+                diff.to_delete.append(existing)
+            continue
+
+        if existing:
+            if existing.hours_worked != hours_value or (existing.notes or "") != notes_value:
+                existing.hours_worked = hours_value
+                existing.notes = notes_value
+                diff.to_update.append(existing)
+        else:
+            diff.to_create.append(
+                TimesheetEntry(
+                    timesheet=timesheet,
+                    entry_date=entry_date,
+                    hours_worked=hours_value,
+                    notes=notes_value,
+                    is_locked=False,
+                )
+            )
+
+    if not partial:
+        diff.to_delete.extend(
+            entry
+            for entry_date, entry in existing_entries.items()
+            if not entry.is_locked and entry_date not in seen_entry_dates
+        )
+    deleted_ids = {entry.id for entry in diff.to_delete}
+    diff.result_entries = [
+        entry for entry in existing_entries.values() if entry.id not in deleted_ids
+    ] + diff.to_create
+    return diff
+
+
+def apply_timesheet_diff(timesheet: Timesheet, diff: TimesheetDiff) -> None:
+    """Write a diff with at most one insert, one update and one delete.
+
+    The running totals are refreshed on ``timesheet`` from the in-memory
+    result; the caller persists them with ``Timesheet.TOTAL_FIELDS``.
+    """
+
+    if diff.to_create:
+        TimesheetEntry.objects.bulk_create(diff.to_create)
+    if diff.to_update:
+        TimesheetEntry.objects.bulk_update(diff.to_update, ["hours_worked", "notes"])
+    if diff.to_delete:
+        TimesheetEntry.objects.filter(
+            timesheet=timesheet, id__in=[entry.id for entry in diff.to_delete], is_locked=False
+        ).delete()
+    timesheet.apply_totals(totals_from_entries(diff.result_entries))
+
+
+def window_entries(timesheet: Timesheet, *, start_date=None, end_date=None, payslip=None):
+    """Entries of ``timesheet`` restricted to a date window and/or a payslip's pay period."""
+
+    entries = timesheet.entries.all()
+    if payslip is not None:
+        paid_dates = [item.get("entry_date") for item in (payslip.metadata or {}).get("entries", [])]
+        if paid_dates:
+            entries = entries.filter(entry_date__in=paid_dates)
+        else:
+            if payslip.pay_period_start:
+                entries = entries.filter(entry_date__gte=payslip.pay_period_start)
+            if payslip.pay_period_end:
+                entries = entries.filter(entry_date__lte=payslip.pay_period_end)
+    if start_date:
+        entries = entries.filter(entry_date__gte=start_date)
+    if end_date:
+        entries = entries.filter(entry_date__lte=end_date)
+    return entries
+
+
+def totals_from_entries(entries) -> dict:
+    zero = Decimal("0")
+    totals = {
+        "total_hours": zero,
+        "approved_hours": zero,
+        "unpaid_hours": zero,
+        "paid_hours": zero,
+        "entry_count": 0,
+        "first_entry_date": None,
+        "last_entry_date": None,
+    }
+    for entry in entries:
+        hours = entry.hours_worked
+        totals["total_hours"] += hours
+        totals["entry_count"] += 1
+        if entry.is_locked:
+            totals["approved_hours"] += hours
+            if not entry.is_paid:
+                totals["unpaid_hours"] += hours
+        if entry.is_paid:
+            totals["paid_hours"] += hours
+        if totals["first_entry_date"] is None or entry.entry_date < totals["first_entry_date"]:
+            totals["first_entry_date"] = entry.entry_date
+        if totals["last_entry_date"] is None or entry.entry_date > totals["last_entry_date"]:
+            totals["last_entry_date"] = entry.entry_date
+    return totals
+
+
+def _aggregate_totals(timesheet_ids) -> dict[int, dict]:
+    rows = (
+        TimesheetEntry.objects.filter(timesheet_id__in=timesheet_ids)
+        .order_by()
+        .values("timesheet_id")
+        .annotate(
+            total_hours=Sum("hours_worked"),
+            approved_hours=Sum("hours_worked", filter=Q(is_locked=True)),
+            unpaid_hours=Sum("hours_worked", filter=Q(is_locked=True, is_paid=False)),
+            paid_hours=Sum("hours_worked", filter=Q(is_paid=True)),
+            entry_count=Count("id"),
+            first_entry_date=Min("entry_date"),
+            last_entry_date=Max("entry_date"),
+        )
+    )
+    empty = totals_from_entries([])
+    aggregated = {}
+    for row in rows:
+        timesheet_id = row.pop("timesheet_id")
+        aggregated[timesheet_id] = {key: row[key] if row[key] is not None else empty[key] for key in empty}
+    return aggregated
+
+
+def rebuild_timesheet_totals(queryset=None, *, chunk_size: int = 500, dry_run: bool = False) -> tuple[int, int]:
+    """Recompute totals from entries; returns ``(checked, drifted)`` counts.
+
+    Timesheets are processed in chunks with one grouped aggregate and one
+    ``bulk_update`` per chunk.
+    """
+
+    queryset = (queryset if queryset is not None else Timesheet.objects.all()).order_by("pk")
+    empty = totals_from_entries([])
+    checked = drifted = 0
+    last_pk = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk).only("pk", "offer_id", *Timesheet.TOTAL_FIELDS)[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        aggregated = _aggregate_totals([timesheet.pk for timesheet in chunk])
+        stale = []
+        for timesheet in chunk:
+            totals = aggregated.get(timesheet.pk, empty)
+            if any(getattr(timesheet, name) != totals[name] for name in Timesheet.TOTAL_FIELDS):
+                timesheet.apply_totals(totals)
+                stale.append(timesheet)
+        checked += len(chunk)
+        drifted += len(stale)
+        if stale and not dry_run:
+            Timesheet.objects.bulk_update(stale, Timesheet.TOTAL_FIELDS)
+            refresh_worker_summaries([timesheet.offer_id for timesheet in stale])
+    return checked, drifted
+
+
+@transaction.atomic
+def bulk_approve_timesheets(employer_user, application_ids, *, employer_notes: str | None = None) -> list[dict]:
+    """Approve the submitted timesheets of many applications at once.
+
+    Timesheets are locked with one query, pending entries are locked with a
+    single ``UPDATE`` and timesheets are written with ``bulk_update``; the
+    system messages are posted in one batch after commit. Returns one outcome per id.
+    """
+
+    timesheets = {
+        timesheet.offer.application_id: timesheet
+        for timesheet in Timesheet.objects.select_for_update(of=("self",))
+        .select_related("offer", "offer__job")
+        .filter(
+            offer__application_id__in=application_ids,
+            offer__job__employer__user=employer_user,
+            offer__status="accepted",
+        )
+    }
+    pending_counts = dict(
+        TimesheetEntry.objects.filter(
+            timesheet_id__in=[timesheet.id for timesheet in timesheets.values() if timesheet.status == "submitted"],
+            is_locked=False,
+        )
+        .order_by()
+        .values_list("timesheet_id")
+        .annotate(pending=Count("id"))
+    )
+
+    now = timezone.now()
+    outcomes = []
+    approved: list[Timesheet] = []
+    newly_approved_hours = {}
+    for application_id in application_ids:
+        timesheet = timesheets.get(application_id)
+        if timesheet is None:
+            outcomes.append({"application_id": application_id, "status": "error", "detail": "No accepted offer found."})
+        elif timesheet.status != "submitted":
+            outcomes.append(
+                {
+                    "application_id": application_id,
+                    "status": "error",
+                    "detail": "Only submitted timesheets can be approved.",
+                }
+            )
+        elif not pending_counts.get(timesheet.id):
+            outcomes.append(
+                {"application_id": application_id, "status": "error", "detail": "No pending entries to approve."}
+            )
+        else:
+            # Every entry is locked below, so all hours become approved.
+            timesheet.status = "approved"
+            timesheet.approved_at = now
+            timesheet.updated_at = now
+            newly_approved_hours[timesheet.id] = timesheet.total_hours - timesheet.approved_hours
+            timesheet.approved_hours = timesheet.total_hours
+            timesheet.unpaid_hours = timesheet.total_hours - timesheet.paid_hours
+            if employer_notes is not None:
+                timesheet.employer_notes = employer_notes
+            approved.append(timesheet)
+            outcomes.append(
+                {
+                    "application_id": application_id,
+                    "status": "approved",
+                    "approved_entries": pending_counts[timesheet.id],
+                    "approved_hours": str(timesheet.approved_hours),
+                }
+            )
+
+    if not approved:
+        return outcomes
+
+    regional_entries = pending_regional_entries((timesheet, timesheet.offer.job) for timesheet in approved)
+    TimesheetEntry.objects.filter(timesheet_id__in=[timesheet.id for timesheet in approved], is_locked=False).update(
+        is_locked=True
+    )
+    Timesheet.objects.bulk_update(
+        approved,
+        ["status", "approved_at", "employer_notes", "approved_hours", "unpaid_hours", "updated_at"],
+    )
+    record_hours_approved(
+        [(timesheet, timesheet.offer, newly_approved_hours[timesheet.id]) for timesheet in approved],
+        on=timezone.localdate(now),
+    )
+    record_regional_days(
+        (timesheet.offer, timesheet.offer.job, regional_entries.get(timesheet.id, [])) for timesheet in approved
+    )
+    refresh_worker_summaries([timesheet.offer_id for timesheet in approved])
+    for timesheet in approved:
+        queue_system_message(
+            timesheet_message(
+                timesheet.offer,
+                timesheet,
+                employer_user,
+                "Employer approved the submitted timesheet.",
+                employer_id=employer_user.id,
+            )
+        )
+    return outcomes
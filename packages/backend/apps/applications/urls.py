@@ -4,13 +4,26 @@ from .views import (
     ApplicationListCreateView,
     ApplicationDetailView,
     ApplicationOfferView,
+    JobPipelineView,
+    JobPipelineColumnView,
+    JobPipelineTransitionView,
     EmployerWorkersView,
+    EmployerRosterView,
     TravellerJobsView,
+    IncomeStatementView,
+    PayrollRollupDashboardView,
+    RegionalWorkProgressView,
+    RegionalWorkEvidenceCsvExportView,
     TimesheetView,
     TimesheetSubmitView,
     TimesheetApproveView,
+    TimesheetBulkApproveView,
     PayslipView,
     PayslipInstructionConfirmView,
+    PayslipReconciliationView,
+    PayslipExportView,
+    PayslipCsvExportView,
+    TimesheetEntryCsvExportView,
 )
 
 urlpatterns = [
@@ -18,7 +31,36 @@ urlpatterns = [
     path("<int:pk>/", ApplicationDetailView.as_view(), name="applications-detail"),
     path("<int:pk>/offer/", ApplicationOfferView.as_view(), name="applications-offer"),
     path("my-workers/", EmployerWorkersView.as_view(), name="applications-my-workers"),
+    path("my-workers/roster/", EmployerRosterView.as_view(), name="applications-my-workers-roster"),
     path("my-jobs/", TravellerJobsView.as_view(), name="applications-my-jobs"),
+    path("jobs/<int:job_id>/pipeline/", JobPipelineView.as_view(), name="applications-job-pipeline"),
+    path(
+        "jobs/<int:job_id>/pipeline/transition/",
+        JobPipelineTransitionView.as_view(),
+        name="applications-job-pipeline-transition",
+    ),
+    path(
+        "jobs/<int:job_id>/pipeline/<str:status>/",
+        JobPipelineColumnView.as_view(),
+        name="applications-job-pipeline-column",
+    ),
+    path("timesheets/approve/", TimesheetBulkApproveView.as_view(), name="applications-timesheets-bulk-approve"),
+    path("income-statement/", IncomeStatementView.as_view(), name="applications-income-statement"),
+    path("regional-work/", RegionalWorkProgressView.as_view(), name="applications-regional-work"),
+    path(
+        "regional-work/evidence/csv/",
+        RegionalWorkEvidenceCsvExportView.as_view(),
+        name="applications-regional-work-evidence-csv",
+    ),
+    path("payroll/rollups/", PayrollRollupDashboardView.as_view(), name="applications-payroll-rollups"),
+    path("payslips/export/", PayslipExportView.as_view(), name="applications-payslips-export"),
+    path("payslips/export/csv/", PayslipCsvExportView.as_view(), name="applications-payslips-export-csv"),
+    path(
+        "timesheets/entries/export/csv/",
+        TimesheetEntryCsvExportView.as_view(),
+        name="applications-timesheet-entries-export-csv",
+    ),
+    path("payslips/reconcile/", PayslipReconciliationView.as_view(), name="applications-payslips-reconcile"),
     path("<int:pk>/timesheet/", TimesheetView.as_view(), name="applications-timesheet"),
     path("<int:pk>/timesheet/submit/", TimesheetSubmitView.as_view(), name="applications-timesheet-submit"),
     path("<int:pk>/timesheet/approve/", TimesheetApproveView.as_view(), name="applications-timesheet-approve"),
@@ -1,11 +1,15 @@
 """Application API views."""
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from io import BytesIO
+import logging
 import re
+import time
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import F
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.dateparse import parse_date
 from django.core.files.base import ContentFile
@@ -13,29 +17,95 @@ from django.template.loader import render_to_string
 from django.conf import settings
 from rest_framework import generics, status
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 from xhtml2pdf import pisa
 
-from apps.messaging.models import Conversation, Message
+from apps.jobs.models import Job
+from apps.messaging.events import queue_system_message
+from apps.users.idempotency import idempotent
 from apps.users.models import TravellerDocument
 from apps.users.utils import (
     traveller_compliance_gaps,
     ensure_employer_not_suspended,
-    unsuspend_employer_if_settled,
     SUSPENSION_MESSAGE,
 )
 
-from .models import Application, JobOffer, Timesheet, TimesheetEntry, Payslip
-from .serializers import ApplicationSerializer, JobOfferSerializer, TimesheetSerializer, PayslipSerializer
+from .models import (
+    Application,
+    JobOffer,
+    PayrollRollup,
+    Payslip,
+    RegionalWorkDay,
+    Timesheet,
+    TimesheetEntry,
+    WorkerSummary,
+)
+from .messages import (
+    application_card_message,
+    offer_message,
+    payslip_message,
+    timesheet_message,
+)
+from .money import COMMISSION_RATE, to_cents, to_hundredths
+from .pipeline import (
+    STATUS_LABELS,
+    TRIAGE_STATUSES,
+    bulk_transition_applications,
+    pipeline_counts,
+    pipeline_first_pages,
+)
+from .exports import (
+    PAYSLIP_ARCHIVE_KINDS,
+    PAYSLIP_CSV_COLUMNS,
+    REGIONAL_WORK_CSV_COLUMNS,
+    TIMESHEET_ENTRY_CSV_COLUMNS,
+    csv_export_response,
+    stream_payslip_archive,
+)
+from .ledger import earnings_balance, record_hours_approved, record_payslip_issued, record_payslips_paid
+from .reconciliation import detect_format, reconcile_statement
+from .regional import (
+    SECOND_VISA_DAYS,
+    THIRD_VISA_DAYS,
+    pending_regional_entries,
+    record_regional_days,
+    regional_work_progress,
+)
+from .roster import refresh_worker_summaries
+from .rollups import DASHBOARD_GROUPS, payroll_dashboard, rollup_payslips_completed, rollup_payslips_issued
+from .tax import PayrollItem, compute_payroll_batch, financial_year, release_payslip_tax
+from .timesheets import (
+    apply_timesheet_diff,
+    bulk_approve_timesheets,
+    compute_timesheet_diff,
+    window_entries,
+)
+from .serializers import (
+    ApplicationPipelineCardSerializer,
+    ApplicationSerializer,
+    IncomeStatementSerializer,
+    JobOfferListSerializer,
+    JobOfferSerializer,
+    TimesheetSerializer,
+    PayslipSerializer,
+    RegionalWorkProgressSerializer,
+    WorkerSummarySerializer,
+)
 
 
 TWOPLACES = Decimal("0.01")
 
+logger = logging.getLogger(__name__)
 
-def ensure_timesheet_for_offer(offer: JobOffer) -> Timesheet:
-    timesheet, _created = Timesheet.objects.get_or_create(offer=offer)
+
+def ensure_timesheet_for_offer(offer: JobOffer, *, lock: bool = False) -> Timesheet:
+    queryset = Timesheet.objects.select_for_update() if lock else Timesheet.objects
+    timesheet, _created = queryset.get_or_create(offer=offer)
     return timesheet
 
 
@@ -53,68 +123,6 @@ def _format_user_address(user) -> str:
     return ", ".join(cleaned)
 
 
-def send_timesheet_message(offer: JobOffer, sender, body: str | None = None) -> None:
-    timesheet = ensure_timesheet_for_offer(offer)
-    employer_user = offer.job.employer.user
-    conversation, _ = Conversation.objects.get_or_create(
-        employer=employer_user,
-        traveller=offer.traveller,
-        job=offer.job,
-    )
-    totals = timesheet.entries.aggregate(total_hours=Sum("hours_worked"))
-    total_hours = totals.get("total_hours") or Decimal("0")
-    metadata = {
-        "kind": "timesheet",
-        "offer_id": offer.id,
-        "application_id": offer.application_id,
-        "status": timesheet.status,
-        "entry_count": timesheet.entries.count(),
-        "total_hours": str(total_hours),
-    }
-    message_body = body or "Timesheet activity recorded."
-    message = Message.objects.create(
-        conversation=conversation,
-        sender=sender,
-        body=message_body,
-        is_system=True,
-        message_type="timesheet",
-        metadata=metadata,
-    )
-    conversation.last_message_at = message.created_at
-    conversation.save(update_fields=["last_message_at", "updated_at"])
-
-
-def send_payslip_message(payslip: Payslip, sender, body: str | None = None) -> None:
-    employer_user = payslip.offer.job.employer.user
-    conversation, _ = Conversation.objects.get_or_create(
-        employer=employer_user,
-        traveller=payslip.traveller,
-        job=payslip.offer.job,
-    )
-    metadata = {
-        "kind": "payslip",
-        "payslip_id": payslip.id,
-        "hour_count": str(payslip.hour_count),
-        "gross_amount": str(payslip.gross_amount),
-        "commission_amount": str(payslip.commission_amount),
-        "tax_withheld": str(payslip.tax_withheld),
-        "net_payment": str(payslip.net_payment),
-        "rate_amount": str(payslip.rate_amount),
-        "rate_currency": payslip.rate_currency,
-    }
-    message_body = body or "Employer initiated a payout for approved hours."
-    message = Message.objects.create(
-        conversation=conversation,
-        sender=sender,
-        body=message_body,
-        is_system=True,
-        message_type="payslip",
-        metadata=metadata,
-    )
-    conversation.last_message_at = message.created_at
-    conversation.save(update_fields=["last_message_at", "updated_at"])
-
-
 def render_payslip_pdf(payslip: Payslip) -> bytes:
     html = render_to_string("payslips/payslip.html", {"payslip": payslip})
     pdf_io = BytesIO()
@@ -181,11 +189,6 @@ def _ozziework_bank_details() -> dict:
     }
 
 
-def _format_amount_cents(amount: Decimal) -> int:
-    cents = int((amount.quantize(TWOPLACES) * 100).to_integral_value())
-    return cents
-
-
 def _build_aba_file(
     *,
     payslip: Payslip,
@@ -219,7 +222,7 @@ def _build_aba_file(
         return line.ljust(120)
 
     def detail_record(recipient: dict, amount: Decimal, description: str) -> tuple[str, dict]:
-        amount_cents = _format_amount_cents(amount)
+        amount_cents = to_cents(amount)
         line = (
             "1"
             + f"{recipient['bsb_display']}"
@@ -252,10 +255,12 @@ def _build_aba_file(
         )
         return line.ljust(120)
 
+    # Each detail record carries the PAYS<id> reference so bank returns and
+    # statements can be reconciled back to the payslip.
     detail_specs = [
-        (ozzie_bank, commission_amount, "OZZIEWORK COMM"),
-        (traveller_bank, net_payment, "NET PAYMENT"),
-        (employer_bank, tax_withheld, "WH TAX"),
+        (ozzie_bank, commission_amount, f"{lodgement_reference} COMM"),
+        (traveller_bank, net_payment, f"{lodgement_reference} NET PAY"),
+        (employer_bank, tax_withheld, f"{lodgement_reference} WH TAX"),
     ]
 
     lines = [descriptive_record()]
@@ -267,7 +272,7 @@ def _build_aba_file(
         record_line, metadata = detail_record(recipient, amount, description)
         lines.append(record_line)
         metadata_entries.append(metadata)
-        total_cents += _format_amount_cents(amount)
+        total_cents += to_cents(amount)
     lines.append(file_total_record(total_cents, len(metadata_entries)))
     content = "\n".join(lines) + "\n"
     return {
@@ -280,37 +285,6 @@ def _build_aba_file(
     }
 
 
-def send_application_card_message(application: Application) -> None:
-    employer_user = application.job.employer.user
-    conversation, _ = Conversation.objects.get_or_create(
-        employer=employer_user,
-        traveller=application.applicant,
-        job=application.job,
-    )
-    applicant = application.applicant
-    metadata = {
-        "kind": "application_card",
-        "application_id": application.id,
-        "job_id": application.job_id,
-        "job_title": application.job.title,
-        "traveller_name": applicant.get_full_name() or applicant.email,
-        "status": application.status,
-        "cover_letter_preview": (application.cover_letter or "")[:200],
-        "submitted_at": application.submitted_at.isoformat() if application.submitted_at else None,
-    }
-    message_body = f"{metadata['traveller_name']} applied for {application.job.title}."
-    message = Message.objects.create(
-        conversation=conversation,
-        sender=applicant,
-        body=message_body,
-        is_system=True,
-        message_type="application_card",
-        metadata=metadata,
-    )
-    conversation.last_message_at = message.created_at
-    conversation.save(update_fields=["last_message_at", "updated_at"])
-
-
 class ApplicationAccessMixin:
     def _get_application(self, pk, user, require_employer=False):
         application = get_object_or_404(
@@ -324,13 +298,28 @@ class ApplicationAccessMixin:
         return application
 
 
+def application_queryset():
+    """Applications with everything ``ApplicationSerializer`` reads, in two queries for any number of rows."""
+
+    return Application.objects.select_related(
+        "job",
+        "job__employer__user",
+        "applicant",
+        "offer",
+        "offer__job",
+        "offer__employer__user",
+        "offer__traveller",
+        "offer__timesheet",
+    ).prefetch_related("offer__timesheet__entries")
+
+
 class ApplicationListCreateView(generics.ListCreateAPIView):
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Application.objects.select_related("job", "applicant", "job__employer__user")
+        queryset = application_queryset()
 
         if user.is_staff:
             pass
@@ -365,13 +354,125 @@ class ApplicationListCreateView(generics.ListCreateAPIView):
             )
 
         application = serializer.save(applicant=user)
-        send_application_card_message(application)
+        queue_system_message(application_card_message(application))
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
 
 
 class ApplicationDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticated]
-    queryset = Application.objects.select_related("job", "applicant")
+
+    def get_queryset(self):
+        return application_queryset()
+
+    def retrieve(self, request, *args, **kwargs):
+        application = self.get_object()
+        if application.employer_viewed_at is None and application.job.employer.user_id == request.user.id:
+            application.employer_viewed_at = timezone.now()
+            application.save(update_fields=["employer_viewed_at"])
+        return Response(self.get_serializer(application).data)
+
+
+def parse_application_ids(request, max_count: int, *, action: str) -> list[int]:
+    """Validate the ``application_ids`` list of a bulk request and drop duplicates."""
+
+    application_ids = request.data.get("application_ids")
+    if not isinstance(application_ids, list) or not application_ids:
+        raise ValidationError({"detail": "application_ids must be a non-empty list."})
+    if len(application_ids) > max_count:
+        raise ValidationError({"detail": f"At most {max_count} applications can be {action} at once."})
+    try:
+        return list(dict.fromkeys(int(value) for value in application_ids))
+    except (TypeError, ValueError):
+        raise ValidationError({"detail": "application_ids must contain integers."})
+
+
+class PipelineCursorPagination(CursorPagination):
+    ordering = "-id"
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+def _pipeline_column_next_url(request, job, status_value: str, last_application, page_size: int) -> str:
+    """Cursor link to the page after a board column's first page."""
+
+    paginator = PipelineCursorPagination()
+    column_url = request.build_absolute_uri(reverse("applications-job-pipeline-column", args=[job.id, status_value]))
+    paginator.base_url = replace_query_param(column_url, "page_size", page_size)
+    return paginator.encode_cursor(Cursor(offset=0, reverse=False, position=str(last_application.id)))
+
+
+class JobPipelineAccessMixin:
+    def _get_job(self, job_id, user):
+        job = get_object_or_404(Job.objects.select_related("employer__user"), pk=job_id)
+        if user.is_staff:
+            return job
+        if job.employer.user_id != user.id:
+            raise PermissionDenied("Only the job owner may manage its applicants.")
+        ensure_employer_not_suspended(user)
+        return job
+
+
+class JobPipelineView(JobPipelineAccessMixin, APIView):
+    """Applicant board of a job: per-status counts and the first page of every column."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = self._get_job(job_id, request.user)
+        page_size = PipelineCursorPagination().get_page_size(request)
+        counts = pipeline_counts(job)
+        first_pages = pipeline_first_pages(job, page_size)
+
+        columns = []
+        for status_value, label in Application.STATUS_CHOICES:
+            rows = first_pages.get(status_value, [])
+            next_url = None
+            if rows and counts[status_value] > len(rows):
+                next_url = _pipeline_column_next_url(request, job, status_value, rows[-1], page_size)
+            columns.append(
+                {
+                    "status": status_value,
+                    "label": label,
+                    "count": counts[status_value],
+                    "results": ApplicationPipelineCardSerializer(rows, many=True).data,
+                    "next": next_url,
+                }
+            )
+        return Response({"job_id": job.id, "total": sum(counts.values()), "counts": counts, "columns": columns})
+
+
+class JobPipelineColumnView(JobPipelineAccessMixin, generics.ListAPIView):
+    """One board column, cursor-paginated newest first."""
+
+    serializer_class = ApplicationPipelineCardSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = PipelineCursorPagination
+
+    def get_queryset(self):
+        status_value = self.kwargs["status"]
+        if status_value not in STATUS_LABELS:
+            raise NotFound("Unknown application status.")
+        job = self._get_job(self.kwargs["job_id"], self.request.user)
+        return Application.objects.filter(job=job, status=status_value).select_related("applicant")
+
+
+class JobPipelineTransitionView(JobPipelineAccessMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    MAX_APPLICATIONS = 500
+
+    def post(self, request, job_id):
+        job = self._get_job(job_id, request.user)
+        target_status = request.data.get("status")
+        if target_status not in TRIAGE_STATUSES:
+            raise ValidationError({"detail": f"status must be one of: {', '.join(TRIAGE_STATUSES)}."})
+        application_ids = parse_application_ids(request, self.MAX_APPLICATIONS, action="moved")
+        result = bulk_transition_applications(job, request.user, application_ids, target_status)
+        return Response(result, status=status.HTTP_200_OK)
 
 
 class ApplicationOfferView(ApplicationAccessMixin, APIView):
@@ -389,43 +490,6 @@ class ApplicationOfferView(ApplicationAccessMixin, APIView):
             offer.application.status = new_status
             offer.application.save(update_fields=["status", "updated_at"])
 
-    def _send_offer_message(self, offer: JobOffer, sender, body=None):
-        employer_user = offer.job.employer.user
-        conversation, _ = Conversation.objects.get_or_create(
-            employer=employer_user,
-            traveller=offer.traveller,
-            job=offer.job,
-        )
-        metadata = {
-            "kind": "job_offer",
-            "offer_id": offer.id,
-            "application_id": offer.application_id,
-            "job_id": offer.job_id,
-            "job_title": offer.job.title,
-            "employer_name": offer.employer.company_name
-            or employer_user.get_full_name()
-            or employer_user.email,
-            "status": offer.status,
-            "contract_type": offer.contract_type,
-            "rate_type": offer.rate_type,
-            "rate_amount": str(offer.rate_amount),
-            "rate_currency": offer.rate_currency,
-            "start_date": offer.start_date.isoformat(),
-            "end_date": offer.end_date.isoformat() if offer.end_date else None,
-            "accommodation_details": offer.accommodation_details,
-        }
-        message_body = body or f"{employer_user.get_full_name() or employer_user.email} sent a contract offer."
-        message = Message.objects.create(
-            conversation=conversation,
-            sender=sender,
-            body=message_body,
-            is_system=True,
-            message_type="job_offer",
-            metadata=metadata,
-        )
-        conversation.last_message_at = message.created_at
-        conversation.save(update_fields=["last_message_at", "updated_at"])
-
     def get(self, request, pk):
         application = self._get_application(pk, request.user)
         offer = getattr(application, "offer", None)
@@ -455,7 +519,7 @@ class ApplicationOfferView(ApplicationAccessMixin, APIView):
         offer = serializer.save()
         ensure_timesheet_for_offer(offer)
         self._sync_application_status(offer)
-        self._send_offer_message(offer, sender=application.job.employer.user)
+        queue_system_message(offer_message(offer, sender=application.job.employer.user))
         return Response(JobOfferSerializer(offer).data, status=status.HTTP_201_CREATED)
 
     def patch(self, request, pk):
@@ -507,7 +571,7 @@ class ApplicationOfferView(ApplicationAccessMixin, APIView):
         if "status" in payload:
             actor = "Employer" if user == application.job.employer.user else "Traveller"
             status_message = f"{actor} updated the contract status to {offer.status.replace('_', ' ').title()}."
-            self._send_offer_message(offer, body=status_message, sender=user)
+            queue_system_message(offer_message(offer, sender=user, body=status_message))
 
         return Response(JobOfferSerializer(offer).data)
 
@@ -530,7 +594,7 @@ class ApplicationOfferView(ApplicationAccessMixin, APIView):
 
 
 class EmployerWorkersView(generics.ListAPIView):
-    serializer_class = JobOfferSerializer
+    serializer_class = JobOfferListSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -538,14 +602,42 @@ class EmployerWorkersView(generics.ListAPIView):
         if not getattr(user, "is_employer", False):
             raise PermissionDenied("Only employers can view workers.")
         return (
-            JobOffer.objects.select_related("application", "job", "employer", "traveller")
-            .prefetch_related("timesheet__entries")
+            JobOffer.objects.select_related("application", "job", "employer__user", "traveller", "timesheet")
             .filter(status="accepted", job__employer__user=user)
         )
 
 
+class RosterCursorPagination(CursorPagination):
+    ordering = "-offer_id"
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class EmployerRosterView(generics.ListAPIView):
+    """Accepted workers with hours to date and unpaid balances, one page of ``WorkerSummary`` rows per query."""
+
+    serializer_class = WorkerSummarySerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = RosterCursorPagination
+
+    def get_queryset(self):
+        user = self.request.user
+        if not getattr(user, "is_employer", False):
+            raise PermissionDenied("Only employers can view workers.")
+        queryset = WorkerSummary.objects.select_related("offer__traveller", "job").filter(employer__user=user)
+        job_id = self.request.query_params.get("job")
+        if job_id:
+            if not job_id.isdigit():
+                raise ValidationError({"job": "Must be a job id."})
+            queryset = queryset.filter(job_id=job_id)
+        if self.request.query_params.get("unpaid") in {"1", "true"}:
+            queryset = queryset.filter(approved_unpaid_hours__gt=0)
+        return queryset
+
+
 class TravellerJobsView(generics.ListAPIView):
-    serializer_class = JobOfferSerializer
+    serializer_class = JobOfferListSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -553,12 +645,113 @@ class TravellerJobsView(generics.ListAPIView):
         if not getattr(user, "is_traveller", False):
             raise PermissionDenied("Only travellers can view accepted jobs.")
         return (
-            JobOffer.objects.select_related("application", "job", "employer", "traveller")
-            .prefetch_related("timesheet__entries")
+            JobOffer.objects.select_related("application", "job", "employer__user", "traveller", "timesheet")
             .filter(status="accepted", traveller=user)
         )
 
 
+class IncomeStatementView(APIView):
+    """Earnings of the current traveller, or paid out by the current employer, for one financial year."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if getattr(user, "is_traveller", False):
+            scope, subject_id = "traveller", user.id
+        elif getattr(user, "is_employer", False) and hasattr(user, "employer_profile"):
+            scope, subject_id = "employer", user.employer_profile.id
+        else:
+            raise PermissionDenied("Only travellers and employers have an income statement.")
+
+        year = request.query_params.get("financial_year")
+        if year is None:
+            year = financial_year(timezone.localdate())
+        elif not year.isdigit():
+            raise ValidationError({"financial_year": "Use the calendar year the financial year starts in."})
+        year = int(year)
+
+        statement = {"scope": scope, "financial_year": year, **earnings_balance(scope, subject_id, year)}
+        return Response(IncomeStatementSerializer(statement).data)
+
+
+class RegionalWorkProgressView(APIView):
+    """The traveller's approved regional work days towards a second (88) or third (179) year visa."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not getattr(request.user, "is_traveller", False):
+            raise PermissionDenied("Only travellers track regional work days.")
+        visa = request.query_params.get("visa", "second")
+        targets = {"second": SECOND_VISA_DAYS, "third": THIRD_VISA_DAYS}
+        if visa not in targets:
+            raise ValidationError({"visa": "Choose second or third."})
+        progress = regional_work_progress(request.user, target_days=targets[visa])
+        return Response(RegionalWorkProgressSerializer(progress).data)
+
+
+class RegionalWorkEvidenceCsvExportView(APIView):
+    """Stream the traveller's regional work days, one row per job and date, as visa evidence."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not getattr(request.user, "is_traveller", False):
+            raise PermissionDenied("Only travellers track regional work days.")
+        return csv_export_response(
+            request,
+            RegionalWorkDay.objects.filter(traveller=request.user),
+            REGIONAL_WORK_CSV_COLUMNS,
+            date_lookup="work_date",
+            ordering=("work_date", "id"),
+            filename="regional-work-evidence",
+        )
+
+
+class PayrollRollupDashboardView(APIView):
+    """Payroll totals by month, job or employer, read from the maintained ``PayrollRollup`` rows."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        params = request.query_params
+        if user.is_staff:
+            rollups = PayrollRollup.objects.all()
+            employer_id = params.get("employer_id")
+            if employer_id:
+                if not employer_id.isdigit():
+                    raise ValidationError({"employer_id": "Must be an employer id."})
+                rollups = rollups.filter(employer_id=employer_id)
+        elif getattr(user, "is_employer", False) and hasattr(user, "employer_profile"):
+            rollups = PayrollRollup.objects.filter(employer=user.employer_profile)
+        else:
+            raise PermissionDenied("Only employers can view payroll totals.")
+
+        group_by = params.get("group_by", "month")
+        if group_by not in DASHBOARD_GROUPS:
+            raise ValidationError({"group_by": f"Choose from: {', '.join(DASHBOARD_GROUPS)}."})
+        for param, lookup in (("start_month", "month__gte"), ("end_month", "month__lte")):
+            raw_value = params.get(param)
+            if not raw_value:
+                continue
+            try:
+                parsed = parse_date(f"{raw_value}-01") if re.fullmatch(r"\d{4}-\d{2}", raw_value) else None
+            except ValueError:
+                parsed = None
+            if parsed is None:
+                raise ValidationError({param: "Use the YYYY-MM format."})
+            rollups = rollups.filter(**{lookup: parsed})
+        job_id = params.get("job_id")
+        if job_id:
+            if not job_id.isdigit():
+                raise ValidationError({"job_id": "Must be a job id."})
+            rollups = rollups.filter(job_id=job_id)
+
+        return Response(payroll_dashboard(rollups, group_by=group_by))
+
+
 class TimesheetView(ApplicationAccessMixin, APIView):
     permission_classes = [IsAuthenticated]
 
@@ -568,10 +761,39 @@ class TimesheetView(ApplicationAccessMixin, APIView):
         if not offer or offer.status != "accepted":
             raise NotFound("No accepted offer found for this application.")
         timesheet = ensure_timesheet_for_offer(offer)
-        return Response(TimesheetSerializer(timesheet).data)
 
-    @transaction.atomic
+        params = request.query_params
+        window = {}
+        for param in ("start_date", "end_date"):
+            raw_value = params.get(param)
+            if not raw_value:
+                continue
+            try:
+                window[param] = parse_date(raw_value)
+            except ValueError:
+                window[param] = None
+            if window[param] is None:
+                return Response({"detail": f"{param} must be a YYYY-MM-DD date."}, status=status.HTTP_400_BAD_REQUEST)
+        payslip_id = params.get("payslip")
+        if payslip_id:
+            payslip = offer.payslips.filter(pk=payslip_id).first() if payslip_id.isdigit() else None
+            if payslip is None:
+                raise NotFound("No payslip found for this application.")
+            window["payslip"] = payslip
+
+        if not window:
+            return Response(TimesheetSerializer(timesheet).data)
+        entries = window_entries(timesheet, **window)
+        return Response(TimesheetSerializer(timesheet, context={"entries": entries}).data)
+
     def put(self, request, pk):
+        return self._sync_entries(request, pk, partial=False)
+
+    def patch(self, request, pk):
+        return self._sync_entries(request, pk, partial=True)
+
+    @transaction.atomic
+    def _sync_entries(self, request, pk, *, partial):
         application = self._get_application(pk, request.user)
         offer = getattr(application, "offer", None)
         if not offer or offer.status != "accepted":
@@ -579,80 +801,49 @@ class TimesheetView(ApplicationAccessMixin, APIView):
         if request.user != application.applicant:
             raise PermissionDenied("Only the traveller may update the timesheet entries.")
 
-        timesheet = ensure_timesheet_for_offer(offer)
+        timesheet = ensure_timesheet_for_offer(offer, lock=True)
 
         payload = request.data or {}
         entries_payload = payload.get("entries")
+        if entries_payload is None and partial:
+            entries_payload = []
         if entries_payload is None or not isinstance(entries_payload, list):
             return Response({"detail": "Entries payload is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        existing_entries = {entry.entry_date: entry for entry in timesheet.entries.all()}
-        seen_entry_dates = set()
-        to_create: list[TimesheetEntry] = []
-        to_update: list[TimesheetEntry] = []
-        for entry in entries_payload:
-            if not isinstance(entry, dict):
-                return Response({"detail": "Invalid entry payload."}, status=status.HTTP_400_BAD_REQUEST)
-            entry_date = parse_date(entry.get("entry_date"))
-            if not entry_date:
-                return Response({"detail": "Each entry requires a valid entry_date."}, status=status.HTTP_400_BAD_REQUEST)
-            try:
-                hours_value = Decimal(str(entry.get("hours_worked")))
-            except (InvalidOperation, TypeError):
-                return Response({"detail": "Hours must be a numeric value."}, status=status.HTTP_400_BAD_REQUEST)
-            if hours_value <= 0:
-                return Response({"detail": "Hours must be greater than zero."}, status=status.HTTP_400_BAD_REQUEST)
-
-            notes_value = entry.get("notes", "")
-            existing = existing_entries.get(entry_date)
-            seen_entry_dates.add(entry_date)
-
-            if existing and existing.is_locked:
-                if existing.hours_worked != hours_value or (existing.notes or "") != notes_value:
-                    return Response(
-                        {"detail": f"Hours for {entry_date.isoformat()} have already been approved and cannot be changed."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                continue
-
-            if existing:
-                existing.hours_worked = hours_value
-                existing.notes = notes_value
-                existing.is_locked = False
-                to_update.append(existing)
-            else:
-                to_create.append(
-                    TimesheetEntry(
-                        timesheet=timesheet,
-                        entry_date=entry_date,
-                        hours_worked=hours_value,
-                        notes=notes_value,
-                        is_locked=False,
-                    )
-                )
-
-        if to_create:
-            TimesheetEntry.objects.bulk_create(to_create)
-        for entry in to_update:
-            entry.save(update_fields=["hours_worked", "notes", "is_locked"])
+        diff = compute_timesheet_diff(timesheet, entries_payload, partial=partial)
+        traveller_notes = payload.get("traveller_notes")
+        notes_changed = traveller_notes is not None and traveller_notes != timesheet.traveller_notes
+        if diff.is_empty and not notes_changed:
+            return Response(TimesheetSerializer(timesheet).data)
 
-        for entry_date, entry in existing_entries.items():
-            if entry.is_locked or entry_date in seen_entry_dates:
-                continue
-            entry.delete()
+        apply_timesheet_diff(timesheet, diff)
 
-        traveller_notes = payload.get("traveller_notes")
-        if traveller_notes is not None:
+        if notes_changed:
             timesheet.traveller_notes = traveller_notes
 
-        if timesheet.status in {"submitted", "approved"}:
+        if not diff.is_empty and timesheet.status in {"submitted", "approved"}:
             timesheet.status = "draft"
             timesheet.submitted_at = None
             timesheet.approved_at = None
 
-        timesheet.save(update_fields=["traveller_notes", "status", "submitted_at", "approved_at", "updated_at"])
+        timesheet.save(
+            update_fields=[
+                "traveller_notes",
+                "status",
+                "submitted_at",
+                "approved_at",
+                "updated_at",
+                *Timesheet.TOTAL_FIELDS,
+            ]
+        )
+        refresh_worker_summaries([offer.id])
 
-        send_timesheet_message(offer, sender=request.user, body="Traveller updated the timesheet entries.")
+        if not diff.is_empty:
+            queue_system_message(
+                timesheet_message(
+                    offer, timesheet, request.user, "Traveller updated the timesheet entries.", coalesce=True
+                )
+            )
         return Response(TimesheetSerializer(timesheet).data)
 
 
@@ -677,14 +868,18 @@ class TimesheetSubmitView(ApplicationAccessMixin, APIView):
         timesheet.status = "submitted"
         timesheet.submitted_at = timezone.now()
         timesheet.save(update_fields=["status", "submitted_at", "updated_at"])
+        refresh_worker_summaries([offer.id])
 
-        send_timesheet_message(offer, sender=request.user, body="Traveller submitted a timesheet for approval.")
+        queue_system_message(
+            timesheet_message(offer, timesheet, request.user, "Traveller submitted a timesheet for approval.")
+        )
         return Response(TimesheetSerializer(timesheet).data, status=status.HTTP_200_OK)
 
 
 class TimesheetApproveView(ApplicationAccessMixin, APIView):
     permission_classes = [IsAuthenticated]
 
+    @transaction.atomic
     def post(self, request, pk):
         application = self._get_application(pk, request.user)
         offer = getattr(application, "offer", None)
@@ -693,16 +888,19 @@ class TimesheetApproveView(ApplicationAccessMixin, APIView):
         if request.user != application.job.employer.user:
             raise PermissionDenied("Only the employer may approve the timesheet.")
 
-        timesheet = ensure_timesheet_for_offer(offer)
+        timesheet = ensure_timesheet_for_offer(offer, lock=True)
         if timesheet.status != "submitted":
             return Response({"detail": "Only submitted timesheets can be approved."}, status=status.HTTP_400_BAD_REQUEST)
 
+        regional_entries = pending_regional_entries([(timesheet, application.job)])
         pending_entries = timesheet.entries.filter(is_locked=False)
-        if not pending_entries.exists():
+        if not pending_entries.update(is_locked=True):
             return Response({"detail": "No pending entries to approve."}, status=status.HTTP_400_BAD_REQUEST)
 
-        pending_entries.update(is_locked=True)
-
+        # Every entry is locked now, so all hours are approved.
+        newly_approved_hours = timesheet.total_hours - timesheet.approved_hours
+        timesheet.approved_hours = timesheet.total_hours
+        timesheet.unpaid_hours = timesheet.total_hours - timesheet.paid_hours
         timesheet.status = "approved"
         timesheet.approved_at = timezone.now()
 
@@ -710,9 +908,16 @@ class TimesheetApproveView(ApplicationAccessMixin, APIView):
         if employer_notes is not None:
             timesheet.employer_notes = employer_notes
 
-        timesheet.save(update_fields=["status", "approved_at", "employer_notes", "updated_at"])
+        timesheet.save(
+            update_fields=["status", "approved_at", "employer_notes", "approved_hours", "unpaid_hours", "updated_at"]
+        )
+        record_hours_approved([(timesheet, offer, newly_approved_hours)])
+        record_regional_days([(offer, application.job, regional_entries.get(timesheet.id, []))])
+        refresh_worker_summaries([offer.id])
 
-        send_timesheet_message(offer, sender=request.user, body="Employer approved the submitted timesheet.")
+        queue_system_message(
+            timesheet_message(offer, timesheet, request.user, "Employer approved the submitted timesheet.")
+        )
         return Response(TimesheetSerializer(timesheet).data, status=status.HTTP_200_OK)
 
     def _sync_application_status(self, offer: JobOffer):
@@ -727,177 +932,250 @@ class TimesheetApproveView(ApplicationAccessMixin, APIView):
             offer.application.status = new_status
             offer.application.save(update_fields=["status", "updated_at"])
 
-    def _send_offer_message(self, offer: JobOffer, sender, body=None):
-        employer_user = offer.job.employer.user
-        conversation, _ = Conversation.objects.get_or_create(
-            employer=employer_user,
-            traveller=offer.traveller,
-            job=offer.job,
-        )
-        metadata = self._build_offer_metadata(offer)
-        message_body = body or f"{employer_user.get_full_name() or employer_user.email} sent a contract offer."
-        message = Message.objects.create(
-            conversation=conversation,
-            sender=sender,
-            body=message_body,
-            is_system=True,
-            message_type="job_offer",
-            metadata=metadata,
-        )
-        conversation.last_message_at = message.created_at
-        conversation.save(update_fields=["last_message_at", "updated_at"])
 
-    def _build_offer_metadata(self, offer: JobOffer):
-        employer_user = offer.job.employer.user
-        return {
-            "kind": "job_offer",
-            "offer_id": offer.id,
-            "application_id": offer.application_id,
-            "job_id": offer.job_id,
-            "job_title": offer.job.title,
-            "employer_name": offer.employer.company_name
-            or employer_user.get_full_name()
-            or employer_user.email,
-            "status": offer.status,
-            "contract_type": offer.contract_type,
-            "rate_type": offer.rate_type,
-            "rate_amount": str(offer.rate_amount),
-            "rate_currency": offer.rate_currency,
-            "start_date": offer.start_date.isoformat(),
-            "end_date": offer.end_date.isoformat() if offer.end_date else None,
-            "accommodation_details": offer.accommodation_details,
-        }
+class TimesheetBulkApproveView(APIView):
+    permission_classes = [IsAuthenticated]
+    MAX_APPLICATIONS = 500
+
+    def post(self, request):
+        if not getattr(request.user, "is_employer", False):
+            raise PermissionDenied("Only employers can approve timesheets.")
+
+        application_ids = parse_application_ids(request, self.MAX_APPLICATIONS, action="approved")
+
+        results = bulk_approve_timesheets(
+            request.user, application_ids, employer_notes=request.data.get("employer_notes")
+        )
+        approved_count = sum(1 for item in results if item["status"] == "approved")
+        return Response({"approved_count": approved_count, "results": results}, status=status.HTTP_200_OK)
 
 
 class PayslipView(ApplicationAccessMixin, APIView):
     permission_classes = [IsAuthenticated]
-    COMMISSION_RATE = Decimal("0.01")
-    TAX_RATE = Decimal("0.15")
+    COMMISSION_RATE = COMMISSION_RATE
 
-    @transaction.atomic
+    @idempotent
     def post(self, request, pk):
         application = self._get_application(pk, request.user, require_employer=True)
-        offer = getattr(application, "offer", None)
-        if not offer or offer.status != "accepted":
+        offer = (
+            JobOffer.objects.select_related("job__employer__user", "employer", "traveller")
+            .filter(application=application, status="accepted")
+            .first()
+        )
+        if not offer:
             return Response({"detail": "No accepted offer found for this application."}, status=status.HTTP_400_BAD_REQUEST)
 
-        timesheet = ensure_timesheet_for_offer(offer)
-        if timesheet.status != "approved":
-            return Response({"detail": "Only approved timesheets can be paid."}, status=status.HTTP_400_BAD_REQUEST)
+        # Validated before taking any lock; bank details are read-only here.
+        employer_user = offer.job.employer.user
+        banks = {
+            "employer_bank": _require_bank_details(employer_user, "Employer"),
+            "traveller_bank": _require_bank_details(offer.traveller, "Traveller"),
+            "ozzie_bank": _ozziework_bank_details(),
+        }
 
-        pending_entries = list(
-            TimesheetEntry.objects.select_for_update().filter(timesheet=timesheet, is_locked=True, is_paid=False)
+        payslip, claimed_entry_ids, timings = self._claim_unpaid_hours(offer, employer_user)
+        recorded = False
+        try:
+            self._record_issued(payslip)
+            recorded = True
+            self._generate_instructions(payslip, claimed_entry_ids, request.user, **banks)
+        except Exception:
+            self._release_claim(payslip, claimed_entry_ids, recorded=recorded)
+            raise
+
+        queue_system_message(
+            payslip_message(payslip, request.user, "Employer generated a payslip for the approved hours.")
         )
-        if not pending_entries:
-            return Response({"detail": "No approved unpaid hours available."}, status=status.HTTP_400_BAD_REQUEST)
 
-        total_hours = sum((entry.hours_worked for entry in pending_entries), Decimal("0"))
-        if total_hours <= 0:
-            return Response({"detail": "Invalid hour total for payment."}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = PayslipSerializer(payslip, context={"request": request})
+        response = Response(serializer.data, status=status.HTTP_201_CREATED)
+        response["Server-Timing"] = ", ".join(f"{name};dur={duration * 1000:.1f}" for name, duration in timings.items())
+        return response
+
+    def _claim_unpaid_hours(self, offer: JobOffer, employer_user) -> tuple[Payslip, list[int], dict]:
+        """Claim the approved unpaid entries and insert the payslip: the only locked part of a payout.
+
+        The timesheet row is locked (every entry writer takes that lock first)
+        and the entries are claimed with one conditional ``UPDATE``; the
+        traveller's tax year is locked too, as the withholding depends on the
+        year-to-date totals. Ledger, rollup and roster writes follow in
+        ``_record_issued``. Returns the payslip, the claimed entry ids and the
+        lock timings.
+        """
+
+        started = time.monotonic()
+        with transaction.atomic():
+            timesheet = Timesheet.objects.select_for_update().filter(offer=offer).first()
+            lock_wait = time.monotonic() - started
+            if timesheet is None or timesheet.status != "approved":
+                raise ValidationError({"detail": "Only approved timesheets can be paid."})
+
+            pending_entries = list(
+                TimesheetEntry.objects.filter(timesheet=timesheet, is_locked=True, is_paid=False).only(
+                    "id", "entry_date", "hours_worked"
+                )
+            )
+            if not pending_entries:
+                raise ValidationError({"detail": "No approved unpaid hours available."})
+            total_hours = sum((entry.hours_worked for entry in pending_entries), Decimal("0"))
+            if total_hours <= 0:
+                raise ValidationError({"detail": "Invalid hour total for payment."})
+
+            entry_ids = [entry.id for entry in pending_entries]
+            claimed = TimesheetEntry.objects.filter(id__in=entry_ids, is_paid=False).update(is_paid=True)
+            if claimed != len(entry_ids):
+                raise ValidationError({"detail": "Timesheet changed during payout, please retry."})
+            Timesheet.objects.filter(pk=timesheet.pk).update(
+                paid_hours=F("paid_hours") + total_hours,
+                unpaid_hours=F("unpaid_hours") - total_hours,
+                updated_at=timezone.now(),
+            )
 
-        rate_amount = offer.rate_amount
-        gross_amount = (rate_amount * total_hours).quantize(TWOPLACES)
-        commission_amount = (gross_amount * self.COMMISSION_RATE).quantize(TWOPLACES)
-        net_before_tax = (gross_amount - commission_amount).quantize(TWOPLACES)
-        tax_withheld = (net_before_tax * self.TAX_RATE).quantize(TWOPLACES)
-        net_payment = (net_before_tax - tax_withheld).quantize(TWOPLACES)
-        super_amount = (gross_amount * Decimal("0.11")).quantize(TWOPLACES)
+            (payroll,) = compute_payroll_batch(
+                [
+                    PayrollItem(
+                        offer.traveller_id, timezone.localdate(), to_cents(offer.rate_amount), to_hundredths(total_hours)
+                    )
+                ]
+            )
+            payslip = Payslip.objects.create(
+                timesheet=timesheet,
+                offer=offer,
+                employer=offer.employer,
+                traveller=offer.traveller,
+                hour_count=total_hours,
+                rate_currency=offer.rate_currency,
+                pay_period_start=timesheet.first_entry_date,
+                pay_period_end=timesheet.last_entry_date,
+                payment_method="bank_transfer",
+                employer_name=_format_user_name(employer_user),
+                employer_address=_format_user_address(employer_user),
+                employer_abn=offer.employer.abn,
+                traveller_name=_format_user_name(offer.traveller),
+                traveller_address=_format_user_address(offer.traveller),
+                traveller_tfn=offer.traveller.tfn,
+                rate_amount=offer.rate_amount,
+                metadata={
+                    "entries": [
+                        {"entry_date": entry.entry_date.isoformat(), "hours_worked": str(entry.hours_worked)}
+                        for entry in pending_entries
+                    ],
+                    "commission_rate": str(self.COMMISSION_RATE),
+                    **payroll.payslip_metadata(),
+                },
+                **payroll.components.as_payslip_fields(),
+            )
+        locked_for = time.monotonic() - started - lock_wait
+        logger.info(
+            "Payslip %s: waited %.1f ms for the timesheet lock and held it for %.1f ms.",
+            payslip.id,
+            lock_wait * 1000,
+            locked_for * 1000,
+        )
+        return payslip, entry_ids, {"lock-wait": lock_wait, "critical-section": locked_for}
 
-        employer_user = offer.job.employer.user
-        employer_bank = _require_bank_details(employer_user, "Employer")
-        traveller_bank = _require_bank_details(offer.traveller, "Traveller")
-        ozzie_bank = _ozziework_bank_details()
+    @staticmethod
+    def _record_issued(payslip: Payslip) -> None:
+        """Record the committed payslip in the earnings ledger, payroll rollup and worker roster.
 
-        metadata = {
-            "entries": [
-                {
-                    "entry_date": entry.entry_date.isoformat(),
-                    "hours_worked": str(entry.hours_worked),
-                }
-                for entry in pending_entries
-            ],
-            "commission_rate": str(self.COMMISSION_RATE),
-            "tax_rate": str(self.TAX_RATE),
-        }
+        Runs after the claim has committed, outside the timesheet and tax-year
+        locks: the rollup row is shared by every payout of the job that month,
+        so it is only locked for this short transaction. The rebuild commands
+        repair these rows if the process dies before it runs.
+        """
 
-        payslip = Payslip.objects.create(
-            timesheet=timesheet,
-            offer=offer,
-            employer=offer.employer,
-            traveller=offer.traveller,
-            hour_count=total_hours,
-            rate_amount=rate_amount,
-            rate_currency=offer.rate_currency,
-            gross_amount=gross_amount,
-            commission_amount=commission_amount,
-            net_before_tax=net_before_tax,
-            tax_withheld=tax_withheld,
-            net_payment=net_payment,
-            super_amount=super_amount,
-            pay_period_start=timesheet.entries.order_by("entry_date").first().entry_date if timesheet.entries.exists() else None,
-            pay_period_end=timesheet.entries.order_by("-entry_date").first().entry_date if timesheet.entries.exists() else None,
-            payment_method="bank_transfer",
-            employer_name=_format_user_name(employer_user),
-            employer_address=_format_user_address(employer_user),
-            employer_abn=offer.employer.abn,
-            traveller_name=_format_user_name(offer.traveller),
-            traveller_address=_format_user_address(offer.traveller),
-            traveller_tfn=offer.traveller.tfn,
-            metadata=metadata,
-        )
+        with transaction.atomic():
+            record_payslip_issued(payslip)
+            rollup_payslips_issued([payslip])
+            refresh_worker_summaries([payslip.offer_id], payslips=True)
 
-        pdf_bytes = render_payslip_pdf(payslip)
-        filename = f"payslip-{payslip.id}.pdf"
-        payslip.pdf_file.save(filename, ContentFile(pdf_bytes), save=True)
+    def _generate_instructions(
+        self, payslip: Payslip, entry_ids: list[int], sender, *, employer_bank, traveller_bank, ozzie_bank
+    ) -> None:
+        """Render the PDF and ABA files and file them as documents, after the claim has committed."""
 
+        pdf_bytes = render_payslip_pdf(payslip)
+        payslip.pdf_file.save(f"payslip-{payslip.id}.pdf", ContentFile(pdf_bytes), save=False)
         aba_payload = _build_aba_file(
             payslip=payslip,
             employer_bank=employer_bank,
             traveller_bank=traveller_bank,
             ozzie_bank=ozzie_bank,
-            commission_amount=commission_amount,
-            net_payment=net_payment,
-            tax_withheld=tax_withheld,
+            commission_amount=payslip.commission_amount,
+            net_payment=payslip.net_payment,
+            tax_withheld=payslip.tax_withheld,
         )
-        aba_filename = f"payslip-{payslip.id}.aba"
-        payslip.aba_file.save(aba_filename, ContentFile(aba_payload["content"].encode("ascii")), save=False)
+        aba_bytes = aba_payload["content"].encode("ascii")
+        payslip.aba_file.save(f"payslip-{payslip.id}.aba", ContentFile(aba_bytes), save=False)
         payslip.aba_metadata = aba_payload["metadata"]
         payslip.aba_generated_at = timezone.now()
         payslip.instructions_status = "instructions_generated"
-        payslip.save(update_fields=["aba_metadata", "aba_generated_at", "instructions_status", "aba_file"])
-
-        TravellerDocument.objects.create(
-            owner=offer.traveller,
-            uploaded_by=request.user,
-            title=f"Payslip {payslip.created_at.date().isoformat()}",
-            category="payslip_pdf",
-            file=payslip.pdf_file,
-            mime_type="application/pdf",
-            size_bytes=payslip.pdf_file.size if payslip.pdf_file else 0,
-            source_type="payslip",
-            source_id=payslip.id,
-        )
-
-        TravellerDocument.objects.create(
-            owner=employer_user,
-            uploaded_by=request.user,
-            title=f"Payslip ABA {payslip.created_at.date().isoformat()}",
-            category="payslip_aba",
-            file=payslip.aba_file,
-            mime_type="text/plain",
-            size_bytes=payslip.aba_file.size if payslip.aba_file else 0,
-            source_type="payslip",
-            source_id=payslip.id,
-        )
-
-        TimesheetEntry.objects.filter(id__in=[entry.id for entry in pending_entries]).update(
-            is_paid=True, payment_status="instructions_generated"
-        )
 
-        send_payslip_message(payslip, sender=request.user, body="Employer generated a payslip for the approved hours.")
-
-        serializer = PayslipSerializer(payslip, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        issued_on = payslip.created_at.date().isoformat()
+        with transaction.atomic():
+            payslip.save(
+                update_fields=[
+                    "pdf_file",
+                    "aba_file",
+                    "aba_metadata",
+                    "aba_generated_at",
+                    "instructions_status",
+                    "updated_at",
+                ]
+            )
+            TravellerDocument.objects.bulk_create(
+                [
+                    TravellerDocument(
+                        owner=payslip.traveller,
+                        uploaded_by=sender,
+                        title=f"Payslip {issued_on}",
+                        category="payslip_pdf",
+                        file=payslip.pdf_file.name,
+                        mime_type="application/pdf",
+                        size_bytes=len(pdf_bytes),
+                        source_type="payslip",
+                        source_id=payslip.id,
+                    ),
+                    TravellerDocument(
+                        owner=payslip.offer.job.employer.user,
+                        uploaded_by=sender,
+                        title=f"Payslip ABA {issued_on}",
+                        category="payslip_aba",
+                        file=payslip.aba_file.name,
+                        mime_type="text/plain",
+                        size_bytes=len(aba_bytes),
+                        source_type="payslip",
+                        source_id=payslip.id,
+                    ),
+                ]
+            )
+            TimesheetEntry.objects.filter(id__in=entry_ids).update(payment_status="instructions_generated")
+
+    @staticmethod
+    def _release_claim(payslip: Payslip, entry_ids: list[int], *, recorded: bool) -> None:
+        """Undo a claim whose instructions could not be generated, so the hours can be paid again.
+
+        ``recorded`` says whether ``_record_issued`` ran, i.e. whether the ledger and rollup must be taken back.
+        """
+
+        with transaction.atomic():
+            Timesheet.objects.select_for_update().filter(pk=payslip.timesheet_id).first()
+            TimesheetEntry.objects.filter(id__in=entry_ids).update(is_paid=False, payment_status="pending")
+            Timesheet.objects.filter(pk=payslip.timesheet_id).update(
+                paid_hours=F("paid_hours") - payslip.hour_count,
+                unpaid_hours=F("unpaid_hours") + payslip.hour_count,
+                updated_at=timezone.now(),
+            )
+            release_payslip_tax(payslip)
+            payslip.delete()
+        with transaction.atomic():
+            if recorded:
+                record_payslip_issued(payslip, sign=-1)
+                rollup_payslips_issued([payslip], sign=-1)
+            refresh_worker_summaries([payslip.offer_id], payslips=True)
+        for field_file in (payslip.pdf_file, payslip.aba_file):
+            if field_file:
+                field_file.delete(save=False)
 
     def get(self, request, pk):
         application = self._get_application(pk, request.user)
@@ -920,7 +1198,7 @@ class PayslipInstructionConfirmView(ApplicationAccessMixin, APIView):
         offer = getattr(application, "offer", None)
         if not offer:
             return Response({"detail": "No offer available for this application."}, status=status.HTTP_404_NOT_FOUND)
-        payslip = offer.payslips.order_by("-created_at").first()
+        payslip = offer.payslips.select_for_update().order_by("-created_at").first()
         if not payslip:
             return Response({"detail": "No payslip available."}, status=status.HTTP_404_NOT_FOUND)
         if payslip.instructions_status not in {"instructions_generated", "awaiting_bank_import"}:
@@ -931,19 +1209,152 @@ class PayslipInstructionConfirmView(ApplicationAccessMixin, APIView):
         payslip.offer.application.last_paid_at = timezone.now()
         payslip.offer.application.save(update_fields=["last_paid_at", "updated_at"])
         payslip.save(update_fields=["instructions_status", "status", "updated_at"])
+        record_payslips_paid([payslip])
+        rollup_payslips_completed([payslip])
+        refresh_worker_summaries([payslip.offer_id], payslips=True)
         payslip.timesheet.entries.filter(payment_status__in=["instructions_generated", "awaiting_bank_import"]).update(
             payment_status="paid"
         )
 
-        send_payslip_message(
-            payslip,
-            sender=request.user,
-            body=(
-                "✅ Votre paie pour la période "
-                f"{payslip.pay_period_start or ''} - {payslip.pay_period_end or ''} a été confirmée par "
-                f"{payslip.employer_name or 'votre employeur'}."
-            ),
+        queue_system_message(
+            payslip_message(
+                payslip,
+                request.user,
+                (
+                    "✅ Votre paie pour la période "
+                    f"{payslip.pay_period_start or ''} - {payslip.pay_period_end or ''} a été confirmée par "
+                    f"{payslip.employer_name or 'votre employeur'}."
+                ),
+            )
         )
 
         serializer = PayslipSerializer(payslip, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class PayslipReconciliationView(APIView):
+    """Import a bank statement (CSV or ABA return) and settle matched payslips."""
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        user = request.user
+        if not (getattr(user, "is_employer", False) or user.is_staff):
+            raise PermissionDenied("Only employers can import bank statements.")
+
+        upload = request.FILES.get("file")
+        if not upload:
+            raise ValidationError({"file": "A bank statement file is required."})
+
+        statement_format = (request.data.get("format") or detect_format(upload.name)).lower()
+        if statement_format not in {"csv", "aba"}:
+            return Response({"detail": "Supported formats are csv and aba."}, status=status.HTTP_400_BAD_REQUEST)
+        dry_run = str(request.data.get("dry_run", "")).lower() in {"1", "true", "yes"}
+
+        employer = None
+        if getattr(user, "is_employer", False):
+            employer = getattr(user, "employer_profile", None)
+            if employer is None:
+                raise PermissionDenied("Employer profile required to import bank statements.")
+
+        try:
+            result = reconcile_statement(
+                upload,
+                statement_format=statement_format,
+                employer=employer,
+                sender=user,
+                dry_run=dry_run,
+            )
+        except ValueError as exc:
+            raise ValidationError({"detail": str(exc)})
+
+        report = result.as_report()
+        report["dry_run"] = dry_run
+        return Response(report, status=status.HTTP_200_OK)
+
+
+class PayslipExportView(APIView):
+    """Stream a ZIP of the PDF (and, for employers, ABA) files of payslips issued in a date range."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if getattr(user, "is_employer", False):
+            payslips = Payslip.objects.filter(employer__user=user)
+            allowed_kinds = PAYSLIP_ARCHIVE_KINDS
+        elif getattr(user, "is_traveller", False):
+            payslips = Payslip.objects.filter(traveller=user)
+            allowed_kinds = ("pdf",)
+        else:
+            raise PermissionDenied("Only employers and travellers can export payslips.")
+
+        params = request.query_params
+        for param, lookup in (("start_date", "created_at__date__gte"), ("end_date", "created_at__date__lte")):
+            raw_value = params.get(param)
+            if raw_value:
+                parsed = parse_date(raw_value)
+                if parsed is None:
+                    raise ValidationError({param: "Use the YYYY-MM-DD format."})
+                payslips = payslips.filter(**{lookup: parsed})
+
+        kinds = tuple(kind for kind in params.get("include", ",".join(allowed_kinds)).split(",") if kind)
+        if not kinds or set(kinds) - set(allowed_kinds):
+            raise ValidationError({"include": f"Choose from: {', '.join(allowed_kinds)}."})
+
+        rows = (
+            payslips.only("id", "created_at", "traveller_id", *(f"{kind}_file" for kind in kinds))
+            .order_by("created_at", "id")
+            .iterator(chunk_size=500)
+        )
+        response = StreamingHttpResponse(stream_payslip_archive(rows, kinds=kinds), content_type="application/zip")
+        stamp = timezone.localdate().isoformat()
+        response["Content-Disposition"] = f'attachment; filename="payslips-{stamp}.zip"'
+        return response
+
+
+class PayslipCsvExportView(APIView):
+    """Stream the current employer's or traveller's payslips as CSV."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if getattr(user, "is_employer", False):
+            payslips = Payslip.objects.filter(employer__user=user)
+        elif getattr(user, "is_traveller", False):
+            payslips = Payslip.objects.filter(traveller=user)
+        else:
+            raise PermissionDenied("Only employers and travellers can export payslips.")
+        return csv_export_response(
+            request,
+            payslips,
+            PAYSLIP_CSV_COLUMNS,
+            date_lookup="created_at__date",
+            ordering=("created_at", "id"),
+            filename="payslips",
+        )
+
+
+class TimesheetEntryCsvExportView(APIView):
+    """Stream the timesheet entries of the current employer's workers, or the traveller's own, as CSV."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if getattr(user, "is_employer", False):
+            entries = TimesheetEntry.objects.filter(timesheet__offer__job__employer__user=user)
+        elif getattr(user, "is_traveller", False):
+            entries = TimesheetEntry.objects.filter(timesheet__offer__traveller=user)
+        else:
+            raise PermissionDenied("Only employers and travellers can export timesheets.")
+        return csv_export_response(
+            request,
+            entries,
+            TIMESHEET_ENTRY_CSV_COLUMNS,
+            date_lookup="entry_date",
+            ordering=("entry_date", "id"),
+            filename="timesheet-entries",
+        )
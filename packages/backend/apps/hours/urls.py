@@ -1,8 +1,9 @@
 """URL routes for hours tracking."""
 from django.urls import path
-from .views import HoursWorkedListCreateView, HoursWorkedDetailView
+from .views import HoursWorkedCsvExportView, HoursWorkedListCreateView, HoursWorkedDetailView
 
 urlpatterns = [
     path("", HoursWorkedListCreateView.as_view(), name="hours-list"),
     path("<int:pk>/", HoursWorkedDetailView.as_view(), name="hours-detail"),
+    path("export/csv/", HoursWorkedCsvExportView.as_view(), name="hours-export-csv"),
 ]
@@ -1,6 +1,11 @@
 """Views for logging hours."""
 from rest_framework import generics
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from apps.applications.exports import HOURS_WORKED_CSV_COLUMNS, csv_export_response
+
 from .models import HoursWorked
 from .serializers import HoursWorkedSerializer
 
@@ -23,3 +28,28 @@ class HoursWorkedDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = HoursWorkedSerializer
     permission_classes = [IsAuthenticated]
     queryset = HoursWorked.objects.select_related("application", "worker")
+
+
+class HoursWorkedCsvExportView(APIView):
+    """Stream logged hours as CSV: an employer's workers, a traveller's own, or everything for staff."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if user.is_staff:
+            hours = HoursWorked.objects.all()
+        elif getattr(user, "is_employer", False):
+            hours = HoursWorked.objects.filter(application__job__employer__user=user)
+        elif getattr(user, "is_traveller", False):
+            hours = HoursWorked.objects.filter(worker=user)
+        else:
+            raise PermissionDenied("Only employers and travellers can export hours.")
+        return csv_export_response(
+            request,
+            hours,
+            HOURS_WORKED_CSV_COLUMNS,
+            date_lookup="date",
+            ordering=("date", "id"),
+            filename="hours-worked",
+        )
@@ -0,0 +1,101 @@
+"""Maintained per-job application and offer counters."""
+from __future__ import annotations
+
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+
+from .models import Job
+
+
+JOB_COUNTER_FIELDS = (
+    "application_count",
+    "new_application_count",
+    "unread_application_count",
+    "pending_offer_count",
+)
+
+
+def counter_deltas(before: dict[int, dict[str, int]], after: dict[int, dict[str, int]]) -> dict[int, dict[str, int]]:
+    """``after - before`` per job and counter, without zero entries."""
+
+    deltas: dict[int, dict[str, int]] = {}
+    for sign, contribution in ((-1, before), (1, after)):
+        for job_id, counters in contribution.items():
+            job_deltas = deltas.setdefault(job_id, {})
+            for name, value in counters.items():
+                job_deltas[name] = job_deltas.get(name, 0) + sign * value
+    return {
+        job_id: {name: value for name, value in counters.items() if value}
+        for job_id, counters in deltas.items()
+        if any(counters.values())
+    }
+
+
+def adjust_job_counters(deltas: dict[int, dict[str, int]]) -> None:
+    """Apply per-job counter deltas with one ``UPDATE``; counters never drop below zero."""
+
+    if not deltas:
+        return
+    updates = {}
+    for name in JOB_COUNTER_FIELDS:
+        whens = [
+            When(pk=job_id, then=Value(counters[name])) for job_id, counters in deltas.items() if counters.get(name)
+        ]
+        if whens:
+            delta = Case(*whens, default=Value(0), output_field=IntegerField())
+            updates[name] = Greatest(F(name) + delta, Value(0))
+    if updates:
+        Job.objects.filter(pk__in=deltas.keys()).update(**updates)
+
+
+def _aggregate_counters(job_ids) -> dict[int, dict[str, int]]:
+    from apps.applications.models import Application, JobOffer  # avoid circular import
+
+    counters = {job_id: dict.fromkeys(JOB_COUNTER_FIELDS, 0) for job_id in job_ids}
+    application_rows = (
+        Application.objects.filter(job_id__in=job_ids)
+        .order_by()
+        .values("job_id")
+        .annotate(
+            application_count=Count("id"),
+            new_application_count=Count("id", filter=Q(status="submitted")),
+            unread_application_count=Count("id", filter=Q(employer_viewed_at__isnull=True)),
+        )
+    )
+    for row in application_rows:
+        counters[row.pop("job_id")].update(row)
+    offer_rows = (
+        JobOffer.objects.filter(job_id__in=job_ids, status="pending")
+        .order_by()
+        .values_list("job_id")
+        .annotate(pending=Count("id"))
+    )
+    for job_id, pending in offer_rows:
+        counters[job_id]["pending_offer_count"] = pending
+    return counters
+
+
+def rebuild_job_counters(queryset=None, *, chunk_size: int = 500, dry_run: bool = False) -> tuple[int, int]:
+    """Recompute counters from applications and offers; returns ``(checked, drifted)`` counts."""
+
+    queryset = (queryset if queryset is not None else Job.objects.all()).order_by("pk")
+    checked = drifted = 0
+    last_pk = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk).only("pk", *JOB_COUNTER_FIELDS)[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        aggregated = _aggregate_counters([job.pk for job in chunk])
+        stale = []
+        for job in chunk:
+            counters = aggregated[job.pk]
+            if any(getattr(job, name) != counters[name] for name in JOB_COUNTER_FIELDS):
+                for name in JOB_COUNTER_FIELDS:
+                    setattr(job, name, counters[name])
+                stale.append(job)
+        checked += len(chunk)
+        drifted += len(stale)
+        if stale and not dry_run:
+            Job.objects.bulk_update(stale, JOB_COUNTER_FIELDS)
+    return checked, drifted
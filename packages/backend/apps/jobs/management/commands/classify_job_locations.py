@@ -0,0 +1,35 @@
+"""Re-derive the postcode and regional/remote class stored on jobs."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.jobs.models import Job
+from apps.jobs.regions import reclassify_job_locations
+
+
+class Command(BaseCommand):
+    help = "Reclassify job locations against the bundled postcode dataset and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--job", type=int, action="append", help="Only reclassify the given job id(s).")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Jobs read and written per batch.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted jobs without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Job.objects.all()
+        if options.get("job"):
+            queryset = queryset.filter(pk__in=options["job"])
+        dry_run = options.get("dry_run", False)
+
+        checked, drifted = reclassify_job_locations(
+            queryset, chunk_size=max(1, options.get("chunk_size") or 500), dry_run=dry_run
+        )
+
+        msg = f"Checked {checked} jobs, {drifted} had a stale location class."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
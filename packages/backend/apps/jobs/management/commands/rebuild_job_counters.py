@@ -0,0 +1,35 @@
+"""Recompute the denormalised application counters stored on jobs."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.jobs.counters import rebuild_job_counters
+from apps.jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Rebuild Job application/offer counters and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--job", type=int, action="append", help="Only rebuild the given job id(s).")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Jobs aggregated per query.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted jobs without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Job.objects.all()
+        if options.get("job"):
+            queryset = queryset.filter(pk__in=options["job"])
+        dry_run = options.get("dry_run", False)
+
+        checked, drifted = rebuild_job_counters(
+            queryset, chunk_size=max(1, options.get("chunk_size") or 500), dry_run=dry_run
+        )
+
+        msg = f"Checked {checked} jobs, {drifted} had drifted counters."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
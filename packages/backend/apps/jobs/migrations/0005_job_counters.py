@@ -0,0 +1,62 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:43
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_job_counters(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Application = apps.get_model("applications", "Application")
+    JobOffer = apps.get_model("applications", "JobOffer")
+    application_rows = (
+        Application.objects.order_by()
+        .values("job_id")
+        .annotate(
+            application_count=Count("id"),
+            new_application_count=Count("id", filter=Q(status="submitted")),
+            unread_application_count=Count("id", filter=Q(employer_viewed_at__isnull=True)),
+        )
+    )
+    for row in application_rows:
+        Job.objects.filter(pk=row.pop("job_id")).update(**row)
+    offer_rows = (
+        JobOffer.objects.filter(status="pending").order_by().values_list("job_id").annotate(pending=Count("id"))
+    )
+    for job_id, pending in offer_rows:
+        Job.objects.filter(pk=job_id).update(pending_offer_count=pending)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_location_geo'),
+        ('applications', '0012_application_employer_viewed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='application_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='new_application_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='pending_offer_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='unread_application_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['employer', '-created_at'], name='job_employer_created_idx'),
+        ),
+        migrations.RunPython(backfill_job_counters, migrations.RunPython.noop),
+    ]
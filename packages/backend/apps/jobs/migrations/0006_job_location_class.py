@@ -0,0 +1,38 @@
+# Generated by Django 5.0.2 on 2026-10-19 07:21
+
+from django.db import migrations, models
+
+from apps.jobs.regions import classify_location
+
+
+def backfill_job_locations(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    jobs = Job.objects.only("location", "location_address", "location_city", "location_state")
+    changed = []
+    for job in jobs.iterator(chunk_size=500):
+        job.postcode, job.location_class = classify_location(
+            address=job.location_address, location=job.location, city=job.location_city, state=job.location_state
+        )
+        changed.append(job)
+    Job.objects.bulk_update(changed, ["postcode", "location_class"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='location_class',
+            field=models.CharField(choices=[('unknown', 'Unknown'), ('major_city', 'Major city'), ('regional', 'Regional'), ('remote', 'Remote')], db_index=True, default='unknown', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='postcode',
+            field=models.CharField(blank=True, default='', max_length=4),
+        ),
+        migrations.RunPython(backfill_job_locations, migrations.RunPython.noop),
+    ]
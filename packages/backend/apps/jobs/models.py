@@ -27,6 +27,17 @@ class EmploymentType(models.TextChoices):
     CONTRACT = "contract", "Contract"
 
 
+class LocationClass(models.TextChoices):
+    UNKNOWN = "unknown", "Unknown"
+    MAJOR_CITY = "major_city", "Major city"
+    REGIONAL = "regional", "Regional"
+    REMOTE = "remote", "Remote"
+
+
+# Saving any of these re-classifies the job's location.
+LOCATION_FIELDS = frozenset({"location", "location_address", "location_city", "location_state"})
+
+
 class Job(models.Model):
     """Represents an open job posted by an employer."""
 
@@ -48,6 +59,11 @@ class Job(models.Model):
     location_region = models.CharField(max_length=128, blank=True, default="")
     location_latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     location_longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    # Derived from the location fields on save (apps.jobs.regions); rebuild with classify_job_locations.
+    postcode = models.CharField(max_length=4, blank=True, default="")
+    location_class = models.CharField(
+        max_length=16, choices=LocationClass.choices, default=LocationClass.UNKNOWN, db_index=True
+    )
     is_live = models.BooleanField(default=False)
     hourly_rate = models.DecimalField(
         max_digits=8, decimal_places=2, null=True, blank=True, validators=[MinValueValidator(0)]
@@ -84,6 +100,24 @@ class Job(models.Model):
         on_delete=models.SET_NULL,
         related_name="created_jobs",
     )
+    # Maintained by Application / JobOffer saves (apps.jobs.counters); rebuild with rebuild_job_counters.
+    application_count = models.PositiveIntegerField(default=0)
+    new_application_count = models.PositiveIntegerField(default=0)
+    unread_application_count = models.PositiveIntegerField(default=0)
+    pending_offer_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["employer", "-created_at"], name="job_employer_created_idx")]
 
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return self.title
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or LOCATION_FIELDS.intersection(update_fields):
+            from .regions import classify_job_location  # avoid circular import
+
+            self.postcode, self.location_class = classify_job_location(self)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "postcode", "location_class"}
+        super().save(*args, **kwargs)
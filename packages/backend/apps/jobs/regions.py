@@ -0,0 +1,196 @@
+"""Postcode and locality index for regional and remote work classification.
+
+The bundled datasets in ``data/`` are compiled once, on first use, into flat
+arrays indexed by postcode (one byte each for the state and the
+``LocationClass``) and a dict from normalised locality name to a slot in an
+``array`` of postcodes, so classifying a location is a few constant-time
+lookups with no database access. ``Job.save`` stores the result in the
+indexed ``postcode`` and ``location_class`` columns; searches and visa-day
+tracking filter on those instead of re-parsing location text.
+"""
+from __future__ import annotations
+
+import csv
+import re
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+from django.db.models import Q
+
+from .models import JobCategory, LocationClass
+
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+POSTCODE_RANGES_FILE = DATA_DIR / "postcode_ranges.csv"
+LOCALITIES_FILE = DATA_DIR / "localities.csv"
+
+STATES = ("", "ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA")
+# Byte codes stored per postcode; 0 leaves a postcode unknown.
+CLASS_CODES = ("", LocationClass.MAJOR_CITY, LocationClass.REGIONAL, LocationClass.REMOTE)
+STATE_NAMES = {
+    "AUSTRALIAN CAPITAL TERRITORY": "ACT",
+    "NEW SOUTH WALES": "NSW",
+    "NORTHERN TERRITORY": "NT",
+    "QUEENSLAND": "QLD",
+    "SOUTH AUSTRALIA": "SA",
+    "TASMANIA": "TAS",
+    "VICTORIA": "VIC",
+    "WESTERN AUSTRALIA": "WA",
+}
+REGIONAL_CLASSES = frozenset({LocationClass.REGIONAL, LocationClass.REMOTE})
+
+# Job categories whose work counts as specified work in regional Australia,
+# plus those that only count in remote and very remote Australia.
+SPECIFIED_WORK_CATEGORIES = frozenset({JobCategory.FARMING, JobCategory.CONSTRUCTION})
+REMOTE_SPECIFIED_WORK_CATEGORIES = SPECIFIED_WORK_CATEGORIES | {JobCategory.TOURISM, JobCategory.HOSPITALITY}
+
+POSTCODE_PATTERN = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+
+
+def normalise_locality(name: str) -> str:
+    return " ".join(name.upper().replace(".", " ").split())
+
+
+def state_code(value: str) -> str:
+    """``"VIC"`` for ``"vic"`` or ``"Victoria"``; ``""`` for anything else."""
+
+    value = normalise_locality(value or "")
+    return value if value in STATES else STATE_NAMES.get(value, "")
+
+
+class PostcodeIndex:
+    """State and class per postcode, plus locality → postcode lookups."""
+
+    def __init__(self, ranges, localities):
+        self.states = bytearray(10000)
+        self.classes = bytearray(10000)
+        for start, end, state, location_class in ranges:
+            span = end - start + 1
+            if state:
+                self.states[start : end + 1] = bytes([STATES.index(state)]) * span
+            self.classes[start : end + 1] = bytes([CLASS_CODES.index(location_class)]) * span
+
+        self.postcodes = array("H")
+        self.by_locality: dict[tuple[str, str], int] = {}
+        # Names found in a single state resolve without one; ambiguous names map to -1.
+        self.by_name: dict[str, int] = {}
+        for locality, state, postcode in localities:
+            slot = len(self.postcodes)
+            self.postcodes.append(postcode)
+            name = normalise_locality(locality)
+            self.by_locality[(name, state)] = slot
+            self.by_name[name] = -1 if name in self.by_name else slot
+
+    def state(self, postcode: int) -> str:
+        return STATES[self.states[postcode]] if 0 <= postcode < 10000 else ""
+
+    def location_class(self, postcode: int) -> str:
+        code = self.classes[postcode] if 0 <= postcode < 10000 else 0
+        return CLASS_CODES[code] or LocationClass.UNKNOWN
+
+    def locality_postcode(self, locality: str, state: str = "") -> int | None:
+        """The postcode of ``locality``, within ``state`` (a ``STATES`` code) when given."""
+
+        name = normalise_locality(locality)
+        slot = self.by_locality.get((name, state)) if state else None
+        if slot is None:
+            slot = self.by_name.get(name, -1)
+        return self.postcodes[slot] if slot >= 0 else None
+
+
+def _read_rows(path: Path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        yield from csv.DictReader(line for line in handle if not line.startswith("#"))
+
+
+@lru_cache(maxsize=None)
+def postcode_index() -> PostcodeIndex:
+    ranges = [
+        (int(row["start"]), int(row["end"]), row["state"], row["class"]) for row in _read_rows(POSTCODE_RANGES_FILE)
+    ]
+    localities = [(row["locality"], row["state"], int(row["postcode"])) for row in _read_rows(LOCALITIES_FILE)]
+    return PostcodeIndex(ranges, localities)
+
+
+def format_postcode(postcode: int) -> str:
+    return f"{postcode:04d}"
+
+
+def _text_postcode(index: PostcodeIndex, text: str) -> int | None:
+    for match in reversed(POSTCODE_PATTERN.findall(text or "")):
+        if index.state(int(match)):
+            return int(match)
+    return None
+
+
+def classify_location(
+    *, address: str = "", location: str = "", city: str = "", state: str = ""
+) -> tuple[str, str]:
+    """``(postcode, location_class)`` for a location, ``("", "unknown")`` when it cannot be placed.
+
+    An explicit postcode in the address, location or city text wins; otherwise
+    the city, then the first part of the location text, is looked up as a
+    locality, narrowed by ``state`` when the name exists in several states.
+    """
+
+    index = postcode_index()
+    for text in (address, location, city):
+        postcode = _text_postcode(index, text)
+        if postcode is not None:
+            return format_postcode(postcode), index.location_class(postcode)
+    state = state_code(state)
+    for text in (city, (location or "").split(",")[0]):
+        if text and text.strip():
+            postcode = index.locality_postcode(text, state)
+            if postcode is not None:
+                return format_postcode(postcode), index.location_class(postcode)
+    return "", LocationClass.UNKNOWN
+
+
+def classify_job_location(job) -> tuple[str, str]:
+    return classify_location(
+        address=job.location_address, location=job.location, city=job.location_city, state=job.location_state
+    )
+
+
+def regional_work_postcode(job) -> str:
+    """The job's stored postcode when its work counts towards regional visa days, else ``""``."""
+
+    if job.location_class == LocationClass.REMOTE and job.category in REMOTE_SPECIFIED_WORK_CATEGORIES:
+        return job.postcode
+    if job.location_class in REGIONAL_CLASSES and job.category in SPECIFIED_WORK_CATEGORIES:
+        return job.postcode
+    return ""
+
+
+def regional_work_filter(prefix: str = ""):
+    """``Q`` over jobs (through ``prefix``) whose work counts towards regional visa days."""
+
+    return Q(
+        **{f"{prefix}location_class__in": REGIONAL_CLASSES, f"{prefix}category__in": SPECIFIED_WORK_CATEGORIES}
+    ) | Q(
+        **{
+            f"{prefix}location_class": LocationClass.REMOTE,
+            f"{prefix}category__in": REMOTE_SPECIFIED_WORK_CATEGORIES,
+        }
+    )
+
+
+def reclassify_job_locations(queryset, *, chunk_size: int = 500, dry_run: bool = False) -> tuple[int, int]:
+    """Re-derive stored postcodes and classes, e.g. after a dataset update; returns ``(checked, drifted)``."""
+
+    checked = 0
+    stale = []
+    jobs = queryset.order_by("pk").only(
+        "postcode", "location_class", "location", "location_address", "location_city", "location_state"
+    )
+    for job in jobs.iterator(chunk_size=chunk_size):
+        checked += 1
+        expected = classify_job_location(job)
+        if (job.postcode, job.location_class) != expected:
+            job.postcode, job.location_class = expected
+            stale.append(job)
+    if stale and not dry_run:
+        queryset.model.objects.bulk_update(stale, ["postcode", "location_class"], batch_size=chunk_size)
+    return checked, len(stale)
@@ -1,10 +1,8 @@
 """Serializers for job resources."""
-from decimal import Decimal
-
 from rest_framework import serializers
 
 from .models import Job, JobStatus
-from .utils import geocode_query
+from .tasks import enqueue_job_geocoding
 
 
 class JobSerializer(serializers.ModelSerializer):
@@ -27,6 +25,8 @@ class JobSerializer(serializers.ModelSerializer):
             "location_region",
             "location_latitude",
             "location_longitude",
+            "postcode",
+            "location_class",
             "is_live",
             "hourly_rate",
             "fixed_salary",
@@ -52,6 +52,8 @@ class JobSerializer(serializers.ModelSerializer):
             "distance_km",
         ]
         read_only_fields = (
+            "postcode",
+            "location_class",
             "created_at",
             "updated_at",
             "employer",
@@ -81,26 +83,6 @@ class JobSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Job description is required.")
         return value
 
-    def _maybe_attach_coordinates(self, data):
-        latitude = data.get("location_latitude")
-        longitude = data.get("location_longitude")
-
-        location_fields = [
-            data.get("location_address"),
-            data.get("location_city"),
-            data.get("location_state"),
-            data.get("location_region"),
-            data.get("location"),
-        ]
-
-        if (latitude is None or longitude is None) and any(location_fields):
-            query = ", ".join(filter(None, location_fields))
-            coords = geocode_query(query)
-            if coords:
-                data["location_latitude"] = Decimal(str(coords[0]))
-                data["location_longitude"] = Decimal(str(coords[1]))
-        return data
-
     def _apply_status_from_live_flag(self, data):
         if "is_live" not in data:
             return data
@@ -112,9 +94,11 @@ class JobSerializer(serializers.ModelSerializer):
         return data
 
     def create(self, validated_data):
-        validated_data = self._maybe_attach_coordinates(validated_data)
         validated_data = self._apply_status_from_live_flag(validated_data)
-        return super().create(validated_data)
+        job = super().create(validated_data)
+        # Geocoding calls an external service; a background task fills the coordinates in.
+        enqueue_job_geocoding(job)
+        return job
 
     def update(self, instance, validated_data):
         location_keys = {
@@ -126,7 +110,43 @@ class JobSerializer(serializers.ModelSerializer):
             "location_latitude",
             "location_longitude",
         }
-        if location_keys.intersection(validated_data.keys()):
-            validated_data = self._maybe_attach_coordinates(validated_data)
+        relocated = location_keys.intersection(validated_data.keys())
+        if relocated and "location_latitude" not in validated_data and "location_longitude" not in validated_data:
+            # Stale coordinates would stop the new location being geocoded.
+            validated_data.update(location_latitude=None, location_longitude=None)
         validated_data = self._apply_status_from_live_flag(validated_data)
-        return super().update(instance, validated_data)
+        job = super().update(instance, validated_data)
+        if relocated:
+            enqueue_job_geocoding(job)
+        return job
+
+
+class EmployerJobSummarySerializer(serializers.ModelSerializer):
+    """Compact job row with maintained applicant counters for the employer's own listings."""
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "title",
+            "status",
+            "is_live",
+            "category",
+            "employment_type",
+            "location",
+            "location_city",
+            "location_state",
+            "hourly_rate",
+            "fixed_salary",
+            "currency",
+            "is_remote_friendly",
+            "start_date",
+            "end_date",
+            "created_at",
+            "updated_at",
+            "application_count",
+            "new_application_count",
+            "unread_application_count",
+            "pending_offer_count",
+        ]
+        read_only_fields = fields
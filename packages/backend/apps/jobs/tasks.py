@@ -0,0 +1,34 @@
+"""Background tasks for jobs."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+from apps.tasks.queue import enqueue, task
+
+from .models import Job
+from .utils import geocode_query
+
+
+def job_geocode_query(job: Job) -> str:
+    fields = (job.location_address, job.location_city, job.location_state, job.location_region, job.location)
+    return ", ".join(filter(None, fields))
+
+
+def enqueue_job_geocoding(job: Job) -> None:
+    """Queue a lookup of the job's coordinates unless it already has them or has no location text."""
+
+    if (job.location_latitude is None or job.location_longitude is None) and job_geocode_query(job):
+        enqueue("jobs.geocode_job", {"job_id": job.pk}, unique_key=f"jobs.geocode_job:{job.pk}")
+
+
+@task("jobs.geocode_job", queue="geocoding", max_attempts=3, backoff=60)
+def geocode_job(job_id: int) -> None:
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None or (job.location_latitude is not None and job.location_longitude is not None):
+        return
+    coords = geocode_query(job_geocode_query(job), raise_errors=True)
+    if coords:
+        # Only fill coordinates nobody set in the meantime.
+        Job.objects.filter(pk=job_id, location_latitude__isnull=True).update(
+            location_latitude=Decimal(str(coords[0])), location_longitude=Decimal(str(coords[1]))
+        )
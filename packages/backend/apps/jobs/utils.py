@@ -10,8 +10,12 @@ from urllib import parse, request
 USER_AGENT = "WorkingHolidayJobs/1.0 (contact: support@workingholidayjobs.example)"
 
 
-def geocode_query(query: str, *, timeout: int = 5) -> Optional[Tuple[float, float]]:
-    """Resolve a textual location into latitude/longitude using Nominatim."""
+def geocode_query(query: str, *, timeout: int = 5, raise_errors: bool = False) -> Optional[Tuple[float, float]]:
+    """Resolve a textual location into latitude/longitude using Nominatim.
+
+    Network and decoding errors return ``None`` unless ``raise_errors`` is set,
+    which lets a background task retry them.
+    """
     if not query:
         return None
 
@@ -23,6 +27,8 @@ def geocode_query(query: str, *, timeout: int = 5) -> Optional[Tuple[float, floa
         with request.urlopen(req, timeout=timeout) as resp:
             payload = json.loads(resp.read().decode("utf-8"))
     except Exception:
+        if raise_errors:
+            raise
         return None
 
     if not payload:
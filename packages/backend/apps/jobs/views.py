@@ -6,8 +6,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 
-from .models import Job, JobStatus
-from .serializers import JobSerializer
+from .models import Job, JobStatus, LocationClass
+from .regions import REGIONAL_CLASSES
+from .serializers import EmployerJobSummarySerializer, JobSerializer
 from .utils import geocode_query, haversine_km
 from apps.users.utils import employer_compliance_gaps, ensure_employer_not_suspended
 
@@ -35,6 +36,15 @@ class JobListCreateView(generics.ListCreateAPIView):
             if city:
                 queryset = queryset.filter(location_city__icontains=city)
 
+            if params.get("regional") in {"1", "true"}:
+                queryset = queryset.filter(location_class__in=REGIONAL_CLASSES)
+
+            location_class = params.get("location_class")
+            if location_class:
+                if location_class not in LocationClass.values:
+                    raise ValidationError({"location_class": f"Choose from: {', '.join(LocationClass.values)}."})
+                queryset = queryset.filter(location_class=location_class)
+
         return queryset.order_by("-created_at")
 
     def perform_create(self, serializer):
@@ -142,8 +152,14 @@ class JobRetrieveUpdateView(generics.RetrieveUpdateAPIView):
         serializer.save()
 
 
+def employer_job_summaries(employer_profile):
+    """The employer's jobs with their counters: one query on the (employer, -created_at) index."""
+
+    return employer_profile.jobs.only("employer_id", *EmployerJobSummarySerializer.Meta.fields).order_by("-created_at")
+
+
 class EmployerJobListView(generics.ListAPIView):
-    serializer_class = JobSerializer
+    serializer_class = EmployerJobSummarySerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
@@ -152,7 +168,7 @@ class EmployerJobListView(generics.ListAPIView):
             raise PermissionDenied("Only employer accounts can view their job postings.")
 
         employer_profile, _ = user.employer_profile.__class__.objects.get_or_create(user=user)
-        return employer_profile.jobs.order_by("-created_at")
+        return employer_job_summaries(employer_profile)
 
 
 @api_view(["GET"])
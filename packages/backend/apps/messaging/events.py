@@ -0,0 +1,20 @@
+"""System messages posted after the write that caused them has committed."""
+from __future__ import annotations
+
+from apps.tasks.events import emit, handler
+
+from .service import SystemMessage, post_system_messages
+
+
+SYSTEM_MESSAGE_EVENT = "messaging.system_message"
+
+
+def queue_system_message(message: SystemMessage) -> None:
+    """Post ``message`` to its employer/traveller/job conversation once the current transaction commits."""
+
+    emit(SYSTEM_MESSAGE_EVENT, message._asdict())
+
+
+@handler(SYSTEM_MESSAGE_EVENT)
+def post_queued_system_messages(payloads: list[dict]) -> None:
+    post_system_messages(SystemMessage(**payload) for payload in payloads)
@@ -0,0 +1,83 @@
+"""The latest-message summary denormalised onto conversations for the inbox."""
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.db.models import BigIntegerField, Case, CharField, OuterRef, Q, Subquery, Value, When
+from django.utils import timezone
+
+from .models import Conversation, Message, message_preview
+
+SUMMARY_FIELDS = ["last_message_id", "last_message_preview", "last_message_sender_id", "last_message_type"]
+
+
+def advance_last_messages(messages: Iterable[Message], at) -> int:
+    """Make each message its conversation's latest at ``at``, unless a newer one is already stored.
+
+    One conditional ``UPDATE`` for all conversations, so a writer that lost a
+    race cannot move a preview or the inbox cursor key (``last_message_at``)
+    backwards. Returns the number of conversations updated.
+    """
+
+    latest = {message.conversation_id: message for message in messages}
+    if not latest:
+        return 0
+
+    def case(value, output_field):
+        whens = [When(pk=conversation_id, then=Value(value(message))) for conversation_id, message in latest.items()]
+        return Case(*whens, output_field=output_field)
+
+    return (
+        Conversation.objects.filter(pk__in=latest.keys())
+        .filter(Q(last_message__isnull=True) | Q(last_message_at__lte=at))
+        .update(
+            last_message=case(lambda message: message.id, BigIntegerField()),
+            last_message_preview=case(lambda message: message_preview(message.body), CharField()),
+            last_message_sender=case(lambda message: message.sender_id, BigIntegerField()),
+            last_message_type=case(lambda message: message.message_type, CharField()),
+            last_message_at=at,
+            updated_at=timezone.now(),
+        )
+    )
+
+
+def rebuild_last_messages(queryset=None, *, chunk_size: int = 500, dry_run: bool = False) -> tuple[int, int]:
+    """Point each conversation at its latest message again; returns ``(checked, drifted)`` counts.
+
+    Conversations are processed in chunks: one query finds the chunk's latest
+    message ids, one loads those messages and one ``bulk_update`` writes the
+    drifted rows.
+    """
+
+    queryset = (queryset if queryset is not None else Conversation.objects.all()).order_by("pk")
+    latest = Message.objects.filter(conversation=OuterRef("pk")).order_by("-created_at", "-id").values("id")[:1]
+    checked = drifted = 0
+    last_pk = 0
+    while True:
+        chunk = list(
+            queryset.filter(pk__gt=last_pk)
+            .annotate(latest_id=Subquery(latest))
+            .only("pk", "last_message_at", *SUMMARY_FIELDS)[:chunk_size]
+        )
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        messages = Message.objects.only("id", "sender_id", "body", "message_type", "created_at").in_bulk(
+            [conversation.latest_id for conversation in chunk if conversation.latest_id]
+        )
+        stale = []
+        for conversation in chunk:
+            before = [getattr(conversation, name) for name in SUMMARY_FIELDS]
+            message = messages.get(conversation.latest_id)
+            if message is None:
+                conversation.last_message = conversation.last_message_sender = None
+                conversation.last_message_preview = conversation.last_message_type = ""
+            else:
+                conversation.set_last_message(message, at=max(conversation.last_message_at, message.created_at))
+            if [getattr(conversation, name) for name in SUMMARY_FIELDS] != before:
+                stale.append(conversation)
+        checked += len(chunk)
+        drifted += len(stale)
+        if stale and not dry_run:
+            Conversation.objects.bulk_update(stale, Conversation.LAST_MESSAGE_FIELDS)
+    return checked, drifted
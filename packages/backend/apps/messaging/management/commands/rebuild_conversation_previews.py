@@ -0,0 +1,37 @@
+"""Recompute the latest-message summary stored on conversations."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.messaging.inbox import rebuild_last_messages
+from apps.messaging.models import Conversation
+
+
+class Command(BaseCommand):
+    help = "Rebuild Conversation last-message previews from their messages and report drift."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument(
+            "--conversation", type=int, action="append", help="Only rebuild the given conversation id(s)."
+        )
+        parser.add_argument("--chunk-size", type=int, default=500, help="Conversations read per query.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted conversations without writing to the database.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Conversation.objects.all()
+        if options.get("conversation"):
+            queryset = queryset.filter(pk__in=options["conversation"])
+        dry_run = options.get("dry_run", False)
+
+        checked, drifted = rebuild_last_messages(
+            queryset, chunk_size=max(1, options.get("chunk_size") or 500), dry_run=dry_run
+        )
+
+        msg = f"Checked {checked} conversations, {drifted} had drifted previews."
+        if dry_run:
+            msg += " (dry-run: no changes applied)"
+        self.stdout.write(self.style.WARNING(msg) if drifted else self.style.SUCCESS(msg))
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.2 on 2026-10-19 07:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+PREVIEW_LENGTH = 140
+
+
+def message_preview(body):
+    # Frozen copy of apps.messaging.models.message_preview as of this migration.
+    preview = (body or "").strip()
+    return preview[:PREVIEW_LENGTH] + ("…" if len(preview) > PREVIEW_LENGTH else "")
+
+
+def backfill_last_messages(apps, schema_editor):
+    Conversation = apps.get_model("messaging", "Conversation")
+    Message = apps.get_model("messaging", "Message")
+    latest = Message.objects.filter(conversation=OuterRef("pk")).order_by("-created_at", "-id").values("id")[:1]
+    conversations = Conversation.objects.annotate(latest_id=Subquery(latest)).filter(latest_id__isnull=False)
+    changed = []
+    for conversation in conversations.only("id").iterator(chunk_size=500):
+        conversation.last_message_id = conversation.latest_id
+        changed.append(conversation)
+    messages = Message.objects.only("id", "sender_id", "body", "message_type")
+    for start in range(0, len(changed), 500):
+        chunk = changed[start : start + 500]
+        by_id = messages.in_bulk([conversation.last_message_id for conversation in chunk])
+        for conversation in chunk:
+            message = by_id[conversation.last_message_id]
+            conversation.last_message_preview = message_preview(message.body)
+            conversation.last_message_sender_id = message.sender_id
+            conversation.last_message_type = message.message_type
+        Conversation.objects.bulk_update(
+            chunk, ["last_message", "last_message_preview", "last_message_sender", "last_message_type"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0002_message_metadata'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='messaging.message'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', max_length=141),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_sender',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_type',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['employer', '-last_message_at', '-id'], name='conversation_employer_inbox'),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['traveller', '-last_message_at', '-id'], name='conversation_traveller_inbox'),
+        ),
+        migrations.RunPython(backfill_last_messages, migrations.RunPython.noop),
+    ]
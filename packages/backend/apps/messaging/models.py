@@ -3,8 +3,29 @@ from django.conf import settings
 from django.db import models
 
 
+PREVIEW_LENGTH = 140
+
+
+def message_preview(body: str) -> str:
+    preview = (body or "").strip()
+    return preview[:PREVIEW_LENGTH] + ("…" if len(preview) > PREVIEW_LENGTH else "")
+
+
 class Conversation(models.Model):
-    """A conversation between a traveller and an employer, optionally tied to a job."""
+    """A conversation between a traveller and an employer, optionally tied to a job.
+
+    The latest message is denormalised onto the row (``last_message_*``) so
+    the inbox never reads message bodies; ``apps.messaging.inbox.advance_last_messages``
+    keeps it in step on every insert.
+    """
+
+    LAST_MESSAGE_FIELDS = [
+        "last_message",
+        "last_message_preview",
+        "last_message_sender",
+        "last_message_type",
+        "last_message_at",
+    ]
 
     employer = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="employer_conversations"
@@ -16,6 +37,14 @@ class Conversation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     last_message_at = models.DateTimeField(auto_now_add=True)
+    last_message = models.ForeignKey(
+        "Message", on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    last_message_preview = models.CharField(max_length=PREVIEW_LENGTH + 1, blank=True, default="")
+    last_message_sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    last_message_type = models.CharField(max_length=32, blank=True, default="")
 
     class Meta:
         ordering = ["-last_message_at", "-created_at"]
@@ -24,10 +53,21 @@ class Conversation(models.Model):
                 fields=["employer", "traveller", "job"], name="unique_job_conversation"
             )
         ]
+        indexes = [
+            models.Index(fields=["employer", "-last_message_at", "-id"], name="conversation_employer_inbox"),
+            models.Index(fields=["traveller", "-last_message_at", "-id"], name="conversation_traveller_inbox"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - admin helper
         return f"Conversation {self.pk}"
 
+    def set_last_message(self, message: "Message", at=None) -> None:
+        self.last_message = message
+        self.last_message_preview = message_preview(message.body)
+        self.last_message_sender_id = message.sender_id
+        self.last_message_type = message.message_type
+        self.last_message_at = at or message.created_at
+
 
 class Message(models.Model):
     """Individual messages exchanged within a conversation."""
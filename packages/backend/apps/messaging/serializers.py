@@ -43,7 +43,7 @@ class ConversationSerializer(serializers.ModelSerializer):
     employer_name = serializers.SerializerMethodField()
     traveller_name = serializers.SerializerMethodField()
     other_participant_name = serializers.SerializerMethodField()
-    last_message_preview = serializers.SerializerMethodField()
+    last_message_sender_name = serializers.SerializerMethodField()
 
     class Meta:
         model = Conversation
@@ -56,7 +56,11 @@ class ConversationSerializer(serializers.ModelSerializer):
             "traveller",
             "traveller_name",
             "last_message_at",
+            "last_message",
             "last_message_preview",
+            "last_message_sender",
+            "last_message_sender_name",
+            "last_message_type",
             "other_participant_name",
         ]
         read_only_fields = fields
@@ -82,9 +86,8 @@ class ConversationSerializer(serializers.ModelSerializer):
             return self.get_traveller_name(obj)
         return self.get_employer_name(obj)
 
-    def get_last_message_preview(self, obj: Conversation) -> str:
-        last_message = obj.messages.order_by("-created_at").first()
-        if last_message:
-            preview = last_message.body.strip()
-            return preview[:140] + ("…" if len(preview) > 140 else "")
-        return ""
+    def get_last_message_sender_name(self, obj: Conversation) -> str:
+        sender = obj.last_message_sender
+        if not sender:
+            return ""
+        return sender.get_full_name() or sender.email
@@ -0,0 +1,180 @@
+"""System message service: the one path automated messages take into conversations.
+
+Callers describe each message as a ``SystemMessage`` and hand it to
+``apps.messaging.events.queue_system_message``; once the write that caused it
+has committed, the request's (or task's) messages are posted together by
+``post_system_messages``:
+
+* conversations are resolved in a constant number of queries and cached for
+  the rest of the request or task;
+* a message with a ``coalesce_key`` replaces the conversation's latest message
+  when that one carries the same key and was posted less than
+  ``SYSTEM_MESSAGE_COALESCE_WINDOW`` ago, so a burst of timesheet edits reads
+  as one message instead of one per save;
+* new messages are written with one bulk insert, and the conversations they
+  touch get their denormalised latest message with one conditional update
+  that never replaces a newer one.
+"""
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.tasks.events import scope_cache
+
+from .inbox import advance_last_messages
+from .models import Conversation, Message
+
+
+CONVERSATION_CACHE = "messaging.conversations"
+
+
+class SystemMessage(NamedTuple):
+    employer_id: int
+    traveller_id: int
+    job_id: int | None
+    sender_id: int
+    body: str
+    message_type: str
+    metadata: dict
+    # Consecutive messages sharing this key within the coalescing window are merged into one.
+    coalesce_key: str = ""
+
+    @property
+    def conversation_key(self) -> tuple:
+        return (self.employer_id, self.traveller_id, self.job_id)
+
+
+def _fetch_conversations(keys: set[tuple]) -> dict[tuple, Conversation]:
+    job_ids = {key[2] for key in keys}
+    jobs = Q(job_id__in=job_ids - {None})
+    if None in job_ids:
+        jobs |= Q(job_id__isnull=True)
+    candidates = Conversation.objects.filter(
+        jobs,
+        employer_id__in={key[0] for key in keys},
+        traveller_id__in={key[1] for key in keys},
+    )
+    found = {}
+    for conversation in candidates:
+        key = (conversation.employer_id, conversation.traveller_id, conversation.job_id)
+        if key in keys:
+            found[key] = conversation
+    return found
+
+
+def get_or_create_conversations(keys: Iterable[tuple]) -> dict[tuple, Conversation]:
+    """Resolve many ``(employer_id, traveller_id, job_id)`` keys in a constant number of queries.
+
+    Conversations already resolved in the current request or task are served from its cache.
+    """
+
+    keys = set(keys)
+    cache = scope_cache(CONVERSATION_CACHE)
+    missing = keys - cache.keys()
+    if missing:
+        found = _fetch_conversations(missing)
+        if missing - found.keys():
+            Conversation.objects.bulk_create(
+                [
+                    Conversation(employer_id=employer_id, traveller_id=traveller_id, job_id=job_id)
+                    for employer_id, traveller_id, job_id in missing - found.keys()
+                ],
+                ignore_conflicts=True,
+            )
+            found = _fetch_conversations(missing)
+        cache.update(found)
+    return {key: cache[key] for key in keys}
+
+
+def _collapse(messages: Iterable[SystemMessage]) -> list[list]:
+    """Merge consecutive messages of a conversation that share a coalesce key; returns ``[message, count]`` pairs."""
+
+    pending: list[list] = []
+    latest: dict[tuple, list] = {}
+    for message in messages:
+        previous = latest.get(message.conversation_key)
+        if message.coalesce_key and previous and previous[0].coalesce_key == message.coalesce_key:
+            previous[0], previous[1] = message, previous[1] + 1
+            continue
+        item = [message, 1]
+        pending.append(item)
+        latest[message.conversation_key] = item
+    return pending
+
+
+def _latest_messages(conversation_ids: set[int], since) -> dict[int, Message]:
+    """The latest message of each conversation, for those with one posted after ``since``."""
+
+    latest: dict[int, Message] = {}
+    recent = Message.objects.filter(conversation_id__in=conversation_ids, created_at__gte=since).order_by(
+        "conversation_id", "-created_at", "-id"
+    )
+    for message in recent:
+        latest.setdefault(message.conversation_id, message)
+    return latest
+
+
+def _metadata(message: SystemMessage, count: int) -> dict:
+    metadata = dict(message.metadata or {})
+    if message.coalesce_key:
+        metadata["coalesce_key"] = message.coalesce_key
+    if count > 1:
+        metadata["coalesced_count"] = count
+    return metadata
+
+
+def post_system_messages(messages: Iterable[SystemMessage]) -> list[Message]:
+    """Post many system messages in one batch, coalescing repeats; returns the inserted or updated rows."""
+
+    pending = _collapse(messages)
+    if not pending:
+        return []
+
+    conversations = get_or_create_conversations(message.conversation_key for message, _count in pending)
+    now = timezone.now()
+    latest = {}
+    coalescing = {conversations[message.conversation_key].id for message, _count in pending if message.coalesce_key}
+    if coalescing:
+        latest = _latest_messages(coalescing, now - settings.SYSTEM_MESSAGE_COALESCE_WINDOW)
+
+    created, updated = [], []
+    last: dict[int, Message] = {}
+    for message, count in pending:
+        conversation = conversations[message.conversation_key]
+        # Only a conversation's first message in the batch directly follows its stored latest one.
+        previous = latest.pop(conversation.id, None)
+        if (
+            message.coalesce_key
+            and previous is not None
+            and previous.is_system
+            and previous.metadata.get("coalesce_key") == message.coalesce_key
+        ):
+            previous.sender_id = message.sender_id
+            previous.body = message.body
+            previous.metadata = _metadata(message, previous.metadata.get("coalesced_count", 1) + count)
+            updated.append(previous)
+            last[conversation.id] = previous
+            continue
+        row = Message(
+            conversation=conversation,
+            sender_id=message.sender_id,
+            body=message.body,
+            is_system=True,
+            message_type=message.message_type,
+            metadata=_metadata(message, count),
+        )
+        created.append(row)
+        last[conversation.id] = row
+
+    if updated:
+        Message.objects.bulk_update(updated, ["sender", "body", "metadata"])
+    if created:
+        Message.objects.bulk_create(created)
+    advance_last_messages(last.values(), now)
+    for conversation in conversations.values():
+        conversation.set_last_message(last[conversation.id], at=now)
+    return created + updated
@@ -0,0 +1,108 @@
+"""Tests for the conversation inbox and its denormalised latest message."""
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.jobs.models import Job
+from apps.messaging.inbox import rebuild_last_messages
+from apps.messaging.models import Conversation, Message
+from apps.messaging.service import SystemMessage, post_system_messages
+from apps.users.models import Employer
+
+
+class InboxTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.employer = user_model.objects.create_user(
+            email="boss@example.com", username="boss@example.com", password="pass", is_employer=True
+        )
+        employer = Employer.objects.create(user=self.employer, company_name="Farm")
+        self.jobs = [
+            Job.objects.create(employer=employer, title=f"Picker {index}", description="Pick", location="Mildura")
+            for index in range(5)
+        ]
+        self.traveller = user_model.objects.create_user(
+            email="t@example.com", username="t@example.com", password="pass", is_traveller=True
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.traveller).access_token}")
+
+    def _send(self, job, body):
+        return self.client.post(
+            reverse("messaging-send"),
+            {"traveller_id": self.traveller.id, "employer_id": self.employer.id, "job_id": job.id, "body": body},
+            format="json",
+        )
+
+    def test_inbox_reads_conversation_rows_only(self):
+        for job in self.jobs:
+            self._send(job, "Hello " + "x" * 200)
+        hired = SystemMessage(
+            self.employer.id, self.traveller.id, self.jobs[0].id, self.employer.id, "Hired", "job_offer", {}
+        )
+        post_system_messages([hired])
+
+        # Authenticated user and one page of conversations with their participants and senders.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("messaging-conversations"), {"page_size": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first = response.data["results"][0]
+        self.assertEqual(first["job"], self.jobs[0].id)
+        self.assertEqual((first["last_message_preview"], first["last_message_type"]), ("Hired", "job_offer"))
+        self.assertEqual(first["last_message_sender"], self.employer.id)
+        self.assertEqual(len(response.data["results"][1]["last_message_preview"]), 141)
+
+        next_page = self.client.get(response.data["next"])
+        seen = [row["id"] for row in response.data["results"] + next_page.data["results"]]
+        self.assertEqual(len(set(seen)), 5)
+        self.assertIsNone(next_page.data["next"])
+
+    def test_conversation_detail_for_deep_links(self):
+        for job in self.jobs:
+            self._send(job, "Hello")
+        oldest = Conversation.objects.get(job=self.jobs[0])
+
+        response = self.client.get(reverse("messaging-conversation-detail", args=[oldest.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["id"], response.data["last_message_preview"]), (oldest.id, "Hello"))
+
+        outsider = get_user_model().objects.create_user(email="o@example.com", username="o@example.com")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(outsider).access_token}")
+        response = self.client.get(reverse("messaging-conversation-detail", args=[oldest.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_an_older_message_never_replaces_a_newer_preview(self):
+        self._send(self.jobs[0], "First")
+        conversation = Conversation.objects.get()
+        newer = timezone.now() + timedelta(minutes=5)
+        Conversation.objects.update(last_message_at=newer)
+
+        # A writer whose message is older than the stored latest one lost the race.
+        self.client.post(reverse("messaging-messages", args=[conversation.id]), {"body": "Late"}, format="json")
+        late = SystemMessage(self.employer.id, self.traveller.id, self.jobs[0].id, self.employer.id, "Hi", "text", {})
+        post_system_messages([late])
+
+        conversation.refresh_from_db()
+        self.assertEqual((conversation.last_message_preview, conversation.last_message_at), ("First", newer))
+        self.assertEqual(Message.objects.count(), 3)
+
+    def test_rebuild_repairs_drifted_previews(self):
+        self._send(self.jobs[0], "First")
+        self._send(self.jobs[0], "Second")
+        conversation = Conversation.objects.get()
+        self.assertEqual(conversation.last_message, Message.objects.get(body="Second"))
+
+        Conversation.objects.update(last_message=None, last_message_preview="stale")
+        self.assertEqual(rebuild_last_messages(dry_run=True), (1, 1))
+        out = StringIO()
+        call_command("rebuild_conversation_previews", stdout=out)
+        self.assertIn("1 had drifted", out.getvalue())
+        conversation.refresh_from_db()
+        self.assertEqual(conversation.last_message_preview, "Second")
+        self.assertEqual(rebuild_last_messages(), (1, 0))
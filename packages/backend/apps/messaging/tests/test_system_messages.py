@@ -0,0 +1,54 @@
+"""Tests for the system message service."""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.messaging.models import Message
+from apps.messaging.service import SystemMessage, post_system_messages
+from apps.tasks.events import deferred_events
+from apps.users.models import Employer
+
+
+class SystemMessageServiceTests(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.employer = user_model.objects.create_user(
+            email="boss@example.com", username="boss@example.com", password="pass", is_employer=True
+        )
+        self.job = Job.objects.create(
+            employer=Employer.objects.create(user=self.employer, company_name="Farm"),
+            title="Picker",
+            description="Pick",
+            location="Mildura VIC 3500",
+        )
+        self.traveller = user_model.objects.create_user(email="t@example.com", username="t@example.com")
+
+    def _message(self, body, coalesce_key=""):
+        return SystemMessage(
+            self.employer.id, self.traveller.id, self.job.id, self.traveller.id, body, "timesheet", {}, coalesce_key
+        )
+
+    def test_consecutive_messages_with_a_key_are_coalesced(self):
+        post_system_messages([self._message("one", "edit"), self._message("two", "edit")])
+        post_system_messages([self._message("three", "edit")])
+        message = Message.objects.get()
+        self.assertEqual((message.body, message.metadata["coalesced_count"]), ("three", 3))
+
+        post_system_messages([self._message("submitted"), self._message("four", "edit")])
+        self.assertEqual(list(Message.objects.values_list("body", flat=True)), ["three", "submitted", "four"])
+
+        Message.objects.filter(body="four").update(created_at=timezone.now() - timedelta(hours=1))
+        post_system_messages([self._message("five", "edit")])
+        self.assertEqual(Message.objects.count(), 4)
+
+    def test_conversations_are_looked_up_once_per_scope(self):
+        with deferred_events():
+            post_system_messages([self._message("one")])
+            # Cached conversation: one message insert and one conversation update.
+            with self.assertNumQueries(2):
+                post_system_messages([self._message("two")])
+        with self.assertNumQueries(3):
+            post_system_messages([self._message("three")])
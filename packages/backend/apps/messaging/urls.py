@@ -1,10 +1,20 @@
 """URL routes for messaging API."""
 from django.urls import path
 
-from .views import ConversationCreateMessageView, ConversationListView, MessageListCreateView
+from .views import (
+    ConversationCreateMessageView,
+    ConversationDetailView,
+    ConversationListView,
+    MessageListCreateView,
+)
 
 urlpatterns = [
     path("conversations/", ConversationListView.as_view(), name="messaging-conversations"),
+    path(
+        "conversations/<int:conversation_id>/",
+        ConversationDetailView.as_view(),
+        name="messaging-conversation-detail",
+    ),
     path(
         "conversations/<int:conversation_id>/messages/",
         MessageListCreateView.as_view(),
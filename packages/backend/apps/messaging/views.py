@@ -3,25 +3,53 @@ from django.contrib.auth import get_user_model
 from django.db.models import Q
 from rest_framework import generics, permissions, status
 from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .inbox import advance_last_messages
 from .models import Conversation, Message
 from .serializers import ConversationSerializer, MessageSerializer
+from apps.users.idempotency import idempotent
 from apps.users.utils import ensure_employer_not_suspended, SUSPENSION_MESSAGE
 from apps.applications.models import JobOffer
 
 User = get_user_model()
 
 
+class InboxCursorPagination(CursorPagination):
+    ordering = ("-last_message_at", "-id")
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+def _inbox(user):
+    return Conversation.objects.select_related(
+        "job", "employer__employer_profile", "traveller__employer_profile", "last_message_sender"
+    ).filter(Q(employer=user) | Q(traveller=user))
+
+
 class ConversationListView(generics.ListAPIView):
+    """The user's inbox, newest activity first; reads conversation rows only (see ``Conversation.last_message``)."""
+
     serializer_class = ConversationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = InboxCursorPagination
 
     def get_queryset(self):
-        user = self.request.user
-        base_qs = Conversation.objects.prefetch_related("messages", "job", "employer", "traveller")
-        return base_qs.filter(Q(employer=user) | Q(traveller=user)).order_by("-last_message_at")
+        return _inbox(self.request.user)
+
+
+class ConversationDetailView(generics.RetrieveAPIView):
+    """One inbox conversation, for links to a conversation that is not on the loaded inbox pages."""
+
+    serializer_class = ConversationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_url_kwarg = "conversation_id"
+
+    def get_queryset(self):
+        return _inbox(self.request.user)
 
 
 class MessageListCreateView(APIView):
@@ -41,8 +69,8 @@ class MessageListCreateView(APIView):
             return Response({"body": "Message body is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         message = Message.objects.create(conversation=conversation, sender=request.user, body=body)
-        conversation.last_message_at = message.created_at
-        conversation.save(update_fields=["last_message_at", "updated_at"])
+        advance_last_messages([message], message.created_at)
+        conversation.set_last_message(message)
         return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
 
     def _get_conversation(self, conversation_id):
@@ -77,6 +105,7 @@ class MessageListCreateView(APIView):
 class ConversationCreateMessageView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    @idempotent
     def post(self, request):
         traveller_id = request.data.get("traveller_id")
         employer_id = request.data.get("employer_id")
@@ -111,8 +140,8 @@ class ConversationCreateMessageView(APIView):
             body=body,
         )
 
-        conversation.last_message_at = message.created_at
-        conversation.save(update_fields=["last_message_at", "updated_at"])
+        advance_last_messages([message], message.created_at)
+        conversation.set_last_message(message)
 
         return Response(
             {
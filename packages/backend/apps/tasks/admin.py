@@ -0,0 +1,12 @@
+"""Admin registration for the task queue."""
+from django.contrib import admin
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "queue", "status", "priority", "run_at", "attempts", "finished_at")
+    list_filter = ("status", "queue", "name")
+    search_fields = ("name", "unique_key", "last_error")
+    readonly_fields = ("created_at", "updated_at", "locked_by", "locked_at", "finished_at")
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.tasks"
+    verbose_name = "Background tasks"
+
+    def ready(self):
+        # Registers the @task functions and event handlers declared in each installed app's
+        # ``tasks`` and ``events`` modules.
+        autodiscover_modules("tasks", "events")
@@ -0,0 +1,125 @@
+"""Domain events: side effects recorded during a write and run after it commits.
+
+``emit`` registers the event with ``transaction.on_commit``, so an event
+raised inside a transaction that rolls back (or a savepoint that is rolled
+back) is dropped. Once committed, events are collected by the enclosing
+``deferred_events`` scope (one per request, see ``apps.tasks.middleware``,
+and one per background task) and dispatched when it closes, grouped by kind
+so each handler receives the whole batch; a request's batch waits until its
+response has been sent. Outside a scope a committed event
+is dispatched on its own straight away.
+
+Handler errors are logged, never raised: the write they follow has already
+committed.
+
+``scope_cache`` gives code running inside a scope (its handlers included) a
+dict that lives exactly as long as the scope, e.g. to look rows up once per
+request.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable
+
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+HANDLERS: dict[str, Callable[[list[dict]], None]] = {}
+
+_state = threading.local()
+
+
+def handler(kind: str):
+    """Register the decorated function as the batch handler of ``kind``; it receives a list of payloads."""
+
+    def register(func: Callable[[list[dict]], None]) -> Callable[[list[dict]], None]:
+        if kind in HANDLERS and HANDLERS[kind] is not func:
+            raise ValueError(f"A handler for {kind!r} events is already registered.")
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def emit(kind: str, payload: dict, *, using: str | None = None) -> None:
+    """Record a ``kind`` event to be handled once the current transaction (if any) commits."""
+
+    if kind not in HANDLERS:
+        raise ValueError(f"No handler registered for {kind!r} events.")
+    transaction.on_commit(partial(_collect, kind, payload), using=using)
+
+
+def _collect(kind: str, payload: dict) -> None:
+    batch = getattr(_state, "batch", None)
+    if batch is None:
+        dispatch([(kind, payload)])
+    else:
+        batch.append((kind, payload))
+
+
+@contextmanager
+def deferred_events(*, handoff: Callable[[Callable[[], None]], None] | None = None):
+    """Collect events committed inside the block and dispatch them in batches when it exits.
+
+    Nested scopes join the outermost one. With ``handoff``, a block that
+    exits normally passes its dispatch to ``handoff`` as a callable instead of
+    running it, so the caller decides when the handlers run.
+    """
+
+    if getattr(_state, "batch", None) is not None:
+        yield
+        return
+    _state.batch, _state.caches = [], {}
+    try:
+        yield
+    except BaseException:
+        handoff = None
+        raise
+    finally:
+        batch, caches = _state.batch, _state.caches
+        _state.batch = _state.caches = None
+        if batch:
+            flush = partial(_dispatch_scope, batch, caches)
+            if handoff is None:
+                flush()
+            else:
+                handoff(flush)
+
+
+def _dispatch_scope(batch: list[tuple[str, dict]], caches: dict) -> None:
+    """Dispatch a closed scope's batch with that scope's caches visible to the handlers."""
+
+    previous = getattr(_state, "caches", None)
+    _state.caches = caches
+    try:
+        dispatch(batch)
+    finally:
+        _state.caches = previous
+
+
+def scope_cache(name: str) -> dict:
+    """The ``name`` cache of the current ``deferred_events`` scope; a throwaway dict outside one."""
+
+    caches = getattr(_state, "caches", None)
+    if caches is None:
+        return {}
+    return caches.setdefault(name, {})
+
+
+def dispatch(events: list[tuple[str, dict]]) -> None:
+    """Run each kind's handler once with its payloads, kinds in order of first appearance."""
+
+    grouped: dict[str, list[dict]] = {}
+    for kind, payload in events:
+        grouped.setdefault(kind, []).append(payload)
+    for kind, payloads in grouped.items():
+        try:
+            HANDLERS[kind](payloads)
+        except Exception:
+            logger.exception("Handling %s %s event(s) failed.", len(payloads), kind)
+
@@ -0,0 +1,14 @@
+"""Delete finished background tasks past their retention."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.queue import purge_finished_tasks
+
+
+class Command(BaseCommand):
+    help = "Remove succeeded and failed tasks older than TASK_RETENTION."
+
+    def handle(self, *args, **options):
+        deleted = purge_finished_tasks()
+        self.stdout.write(self.style.SUCCESS(f"Removed {deleted} finished tasks."))
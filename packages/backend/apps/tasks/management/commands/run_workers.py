@@ -0,0 +1,56 @@
+"""Run background task workers against the database queue."""
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.worker import Worker, run_pool
+
+
+class Command(BaseCommand):
+    help = "Claim and run queued background tasks with a pool of worker threads or processes."
+
+    def add_arguments(self, parser):  # pragma: no cover - argument wiring
+        parser.add_argument("--concurrency", type=int, default=2, help="Number of workers in the pool.")
+        parser.add_argument(
+            "--mode",
+            choices=("thread", "process"),
+            default="thread",
+            help="Run workers as threads (I/O-bound tasks) or forked processes (CPU-bound tasks).",
+        )
+        parser.add_argument(
+            "--queue", action="append", dest="queues", help="Only claim tasks from the given queue(s)."
+        )
+        parser.add_argument("--batch-size", type=int, default=1, help="Tasks claimed per worker per round trip.")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds an idle worker waits.")
+        parser.add_argument(
+            "--until-empty",
+            action="store_true",
+            help="Run due tasks in this process and exit once none are left.",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options.get("concurrency") or 2
+        if concurrency < 1:
+            raise CommandError("--concurrency must be at least 1.")
+        worker_options = {
+            "queues": options.get("queues"),
+            "batch_size": options.get("batch_size") or 1,
+            "poll_interval": options.get("poll_interval") or 1.0,
+        }
+
+        if options.get("until_empty"):
+            processed = Worker("once", **worker_options).run(until_empty=True)
+            self.stdout.write(self.style.SUCCESS(f"Ran {processed} task(s); the queue has no due tasks left."))
+            return
+
+        mode = options.get("mode") or "thread"
+        stop_event = multiprocessing.Event() if mode == "process" else threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_args: stop_event.set())
+        self.stdout.write(self.style.SUCCESS(f"Starting {concurrency} {mode} worker(s)."))
+        run_pool(concurrency, mode=mode, stop_event=stop_event, **worker_options)
+        self.stdout.write(self.style.SUCCESS("Workers stopped."))
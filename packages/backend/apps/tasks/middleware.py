@@ -0,0 +1,17 @@
+"""Middleware for deferred domain events."""
+from .events import deferred_events
+
+
+class DomainEventMiddleware:
+    """Dispatch the events a request committed in batches once its response has been sent."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        flushes = []
+        with deferred_events(handoff=flushes.append):
+            response = self.get_response(request)
+        # The server calls ``close()`` after sending the response (streamed ones once fully consumed).
+        response._resource_closers.extend(flushes)
+        return response
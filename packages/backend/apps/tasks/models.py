@@ -0,0 +1,56 @@
+"""Rows of the database-backed background task queue."""
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class TaskStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
+
+
+ACTIVE_STATUSES = (TaskStatus.QUEUED, TaskStatus.RUNNING)
+
+
+class Task(models.Model):
+    """One invocation of a registered task (``apps.tasks.queue``), claimed by a worker when due."""
+
+    name = models.CharField(max_length=128)
+    queue = models.CharField(max_length=64, default="default")
+    payload = models.JSONField(default=dict, blank=True)
+    # Higher runs first; ties are broken by run_at, then id.
+    priority = models.SmallIntegerField(default=0)
+    status = models.CharField(max_length=16, choices=TaskStatus.choices, default=TaskStatus.QUEUED)
+    run_at = models.DateTimeField(default=timezone.now)
+    # At most one queued or running task per non-empty key (deduplication, periodic tasks).
+    unique_key = models.CharField(max_length=255, blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    last_error = models.TextField(blank=True, default="")
+    locked_by = models.CharField(max_length=128, blank=True, default="")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["queue", "-priority", "run_at"],
+                condition=Q(status="queued"),
+                name="task_ready_idx",
+            ),
+            models.Index(fields=["status", "finished_at"], name="task_status_finished_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["unique_key"],
+                condition=Q(status__in=["queued", "running"]) & ~Q(unique_key=""),
+                name="unique_active_task_key",
+            )
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.name} #{self.pk} ({self.status})"
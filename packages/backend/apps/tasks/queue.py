@@ -0,0 +1,264 @@
+"""Database-backed task queue: registration, enqueueing, claiming and execution.
+
+Tasks are rows of ``Task``. Workers claim due rows with
+``SELECT ... FOR UPDATE SKIP LOCKED`` ordered by priority and due time, so
+any number of workers share a queue without blocking on each other and
+without a separate broker. Enqueueing inside a transaction makes the task
+visible only if that transaction commits.
+
+Delivery is at-least-once: a worker that dies mid-task leaves the row
+``running`` until ``requeue_stale_tasks`` hands it out again, so task
+functions should be safe to run twice.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import traceback
+from datetime import timedelta
+from typing import Callable, NamedTuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from .events import deferred_events
+from .models import Task, TaskStatus
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE = "default"
+MAX_RETRY_DELAY = timedelta(hours=1)
+MAX_ERROR_LENGTH = 4000
+
+
+class TaskDefinition(NamedTuple):
+    name: str
+    func: Callable
+    queue: str = DEFAULT_QUEUE
+    priority: int = 0
+    max_attempts: int = 5
+    # Seconds before the first retry, doubled after every further failure.
+    backoff: int = 30
+    # Periodic tasks are re-enqueued this long after each run finishes.
+    every: timedelta | None = None
+
+
+REGISTRY: dict[str, TaskDefinition] = {}
+
+
+def task(
+    name: str,
+    *,
+    queue: str = DEFAULT_QUEUE,
+    priority: int = 0,
+    max_attempts: int = 5,
+    backoff: int = 30,
+    every: timedelta | None = None,
+):
+    """Register the decorated function as task ``name``; its keyword arguments come from the JSON payload."""
+
+    def register(func: Callable) -> Callable:
+        if name in REGISTRY and REGISTRY[name].func is not func:
+            raise ValueError(f"A task named {name!r} is already registered.")
+        REGISTRY[name] = TaskDefinition(name, func, queue, priority, max_attempts, backoff, every)
+        return func
+
+    return register
+
+
+def _definition(name: str) -> TaskDefinition:
+    try:
+        return REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"No task registered as {name!r}.") from None
+
+
+def enqueue(
+    name: str,
+    payload: dict | None = None,
+    *,
+    run_at=None,
+    delay: timedelta | None = None,
+    priority: int | None = None,
+    unique_key: str = "",
+) -> Task:
+    """Queue task ``name`` with ``payload`` as its keyword arguments, due now, after ``delay`` or at ``run_at``.
+
+    With a ``unique_key``, nothing is inserted while a queued or running task
+    holds the same key; the returned instance then has no primary key.
+    """
+
+    definition = _definition(name)
+    if run_at is None:
+        run_at = timezone.now() + (delay or timedelta())
+    row = Task(
+        name=name,
+        queue=definition.queue,
+        payload=payload or {},
+        priority=definition.priority if priority is None else priority,
+        run_at=run_at,
+        unique_key=unique_key,
+        max_attempts=definition.max_attempts,
+    )
+    if unique_key:
+        Task.objects.bulk_create([row], ignore_conflicts=True)
+        return row
+    row.save()
+    return row
+
+
+def dequeue(worker_id: str, *, queues=None, limit: int = 1) -> list[Task]:
+    """Claim up to ``limit`` due tasks for ``worker_id``, skipping rows other workers hold locked."""
+
+    now = timezone.now()
+    with transaction.atomic():
+        ready = Task.objects.select_for_update(skip_locked=True).filter(status=TaskStatus.QUEUED, run_at__lte=now)
+        if queues:
+            ready = ready.filter(queue__in=queues)
+        tasks = list(ready.order_by("-priority", "run_at", "id")[:limit])
+        if tasks:
+            Task.objects.filter(pk__in=[row.pk for row in tasks]).update(
+                status=TaskStatus.RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=F("attempts") + 1,
+                updated_at=now,
+            )
+    for row in tasks:
+        row.status, row.locked_by, row.locked_at, row.attempts = TaskStatus.RUNNING, worker_id, now, row.attempts + 1
+    return tasks
+
+
+def retry_delay(backoff: int, attempts: int) -> timedelta:
+    """Exponential backoff with up to 10% jitter, capped at ``MAX_RETRY_DELAY``."""
+
+    seconds = min(backoff * 2 ** max(attempts - 1, 0), MAX_RETRY_DELAY.total_seconds())
+    return timedelta(seconds=seconds * (1 + random.random() / 10))
+
+
+def run_task(row: Task) -> bool:
+    """Run a claimed task and record the outcome; returns whether it succeeded.
+
+    Domain events the task commits are dispatched in batches when it returns.
+    A failure is retried after ``retry_delay`` until ``max_attempts`` is
+    reached, then the task is marked failed. Periodic tasks get their next
+    run queued once the current one has finished either way.
+    """
+
+    definition = REGISTRY.get(row.name)
+    try:
+        if definition is None:
+            raise LookupError(f"No task registered as {row.name!r}.")
+        with deferred_events():
+            definition.func(**row.payload)
+    except Exception as exc:
+        error = "".join(traceback.format_exception(exc))[-MAX_ERROR_LENGTH:]
+        now = timezone.now()
+        released = {"locked_by": "", "locked_at": None, "last_error": error, "updated_at": now}
+        if definition is not None and row.attempts < row.max_attempts:
+            delay = retry_delay(definition.backoff, row.attempts)
+            Task.objects.filter(pk=row.pk).update(status=TaskStatus.QUEUED, run_at=now + delay, **released)
+            logger.warning("Task %s #%s failed (attempt %s), retrying in %s.", row.name, row.pk, row.attempts, delay)
+        else:
+            with transaction.atomic():
+                Task.objects.filter(pk=row.pk).update(status=TaskStatus.FAILED, finished_at=now, **released)
+                _schedule_next(definition, now)
+            logger.error("Task %s #%s failed after %s attempt(s).", row.name, row.pk, row.attempts)
+        return False
+
+    now = timezone.now()
+    with transaction.atomic():
+        Task.objects.filter(pk=row.pk).update(
+            status=TaskStatus.SUCCEEDED, finished_at=now, locked_by="", locked_at=None, last_error="", updated_at=now
+        )
+        _schedule_next(definition, now)
+    return True
+
+
+def periodic_key(definition: TaskDefinition) -> str:
+    return f"periodic:{definition.name}"
+
+
+def _periodic_task(definition: TaskDefinition, run_at) -> Task:
+    return Task(
+        name=definition.name,
+        queue=definition.queue,
+        priority=definition.priority,
+        run_at=run_at,
+        unique_key=periodic_key(definition),
+        max_attempts=definition.max_attempts,
+    )
+
+
+def _schedule_next(definition: TaskDefinition | None, finished_at) -> None:
+    if definition is not None and definition.every:
+        Task.objects.bulk_create([_periodic_task(definition, finished_at + definition.every)], ignore_conflicts=True)
+
+
+def schedule_periodic_tasks(queues=None) -> None:
+    """Queue a first run of each periodic task (in ``queues``) that has no queued or running one, in one ``INSERT``.
+
+    Safe to call from every worker: the unique key turns concurrent inserts into no-ops.
+    """
+
+    now = timezone.now()
+    rows = [
+        _periodic_task(definition, now)
+        for definition in REGISTRY.values()
+        if definition.every and (not queues or definition.queue in queues)
+    ]
+    if rows:
+        Task.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def requeue_stale_tasks() -> int:
+    """Release tasks left ``running`` by workers that died; returns how many were released.
+
+    Tasks that have used their last attempt are marked failed instead.
+    """
+
+    now = timezone.now()
+    stale = Task.objects.filter(status=TaskStatus.RUNNING, locked_at__lt=now - settings.TASK_LOCK_TIMEOUT)
+    released = {"locked_by": "", "locked_at": None, "last_error": "Worker lock expired.", "updated_at": now}
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(status=TaskStatus.FAILED, finished_at=now, **released)
+    requeued = stale.update(status=TaskStatus.QUEUED, run_at=now, **released)
+    return requeued + failed
+
+
+def purge_finished_tasks() -> int:
+    """Delete succeeded and failed tasks that finished longer than ``TASK_RETENTION`` ago."""
+
+    cutoff = timezone.now() - settings.TASK_RETENTION
+    deleted, _ = Task.objects.filter(
+        status__in=[TaskStatus.SUCCEEDED, TaskStatus.FAILED], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def queue_metrics() -> list[dict]:
+    """Depth per queue in one grouped query: ready, scheduled, running and failed counts and the oldest due task."""
+
+    now = timezone.now()
+    due = Q(status=TaskStatus.QUEUED, run_at__lte=now)
+    rows = (
+        Task.objects.exclude(status=TaskStatus.SUCCEEDED)
+        .order_by()
+        .values("queue")
+        .annotate(
+            ready=Count("id", filter=due),
+            scheduled=Count("id", filter=Q(status=TaskStatus.QUEUED, run_at__gt=now)),
+            running=Count("id", filter=Q(status=TaskStatus.RUNNING)),
+            failed=Count("id", filter=Q(status=TaskStatus.FAILED)),
+            oldest_ready_at=Min("run_at", filter=due),
+        )
+        .order_by("queue")
+    )
+    metrics = []
+    for row in rows:
+        oldest = row["oldest_ready_at"]
+        row["oldest_ready_age_seconds"] = round((now - oldest).total_seconds(), 1) if oldest else 0
+        metrics.append(row)
+    return metrics
@@ -0,0 +1,86 @@
+"""Tests for after-commit domain events."""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from apps.jobs.models import Job
+from apps.messaging.events import queue_system_message
+from apps.messaging.models import Conversation, Message
+from apps.messaging.service import SystemMessage
+from apps.tasks.events import deferred_events, emit, handler
+from apps.tasks.middleware import DomainEventMiddleware
+from apps.users.models import Employer
+
+
+BATCHES = []
+
+
+@handler("tests.recorded")
+def record_batch(payloads):
+    BATCHES.append([payload["value"] for payload in payloads])
+
+
+class DomainEventTests(TestCase):
+    def setUp(self):
+        BATCHES.clear()
+
+    def test_events_wait_for_commit_and_are_batched(self):
+        with deferred_events():
+            with self.captureOnCommitCallbacks(execute=True):
+                emit("tests.recorded", {"value": 1})
+                try:
+                    with transaction.atomic():
+                        emit("tests.recorded", {"value": "rolled back"})
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                emit("tests.recorded", {"value": 2})
+            self.assertEqual(BATCHES, [])
+        self.assertEqual(BATCHES, [[1, 2]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            emit("tests.recorded", {"value": 3})
+        self.assertEqual(BATCHES, [[1, 2], [3]])
+        with self.assertRaises(ValueError):
+            emit("tests.unknown", {})
+
+    def test_request_events_run_after_the_response_is_sent(self):
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                emit("tests.recorded", {"value": "request"})
+            return HttpResponse("ok")
+
+        response = DomainEventMiddleware(view)(RequestFactory().get("/"))
+        self.assertEqual((response.status_code, BATCHES), (200, []))
+        response.close()
+        self.assertEqual(BATCHES, [["request"]])
+
+    def test_system_messages_are_posted_in_one_batch(self):
+        user_model = get_user_model()
+        employer = user_model.objects.create_user(
+            email="boss@example.com", username="boss@example.com", password="pass", is_employer=True
+        )
+        job = Job.objects.create(
+            employer=Employer.objects.create(user=employer, company_name="Farm"),
+            title="Picker",
+            description="Pick",
+            location="Mildura VIC 3500",
+        )
+        travellers = [
+            user_model.objects.create_user(email=f"t{index}@example.com", username=f"t{index}@example.com")
+            for index in range(3)
+        ]
+        with self.captureOnCommitCallbacks() as callbacks:
+            for traveller in travellers:
+                queue_system_message(
+                    SystemMessage(employer.id, traveller.id, job.id, employer.id, "Hello", "text", {})
+                )
+        self.assertFalse(Message.objects.exists())
+
+        # Conversation lookup, insert and re-read, one message insert and one conversation update.
+        with self.assertNumQueries(5), deferred_events():
+            for callback in callbacks:
+                callback()
+        self.assertEqual(Message.objects.filter(is_system=True).count(), 3)
+        self.assertEqual(Conversation.objects.filter(last_message_at__isnull=False).count(), 3)
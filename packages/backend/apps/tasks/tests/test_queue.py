@@ -0,0 +1,136 @@
+"""Tests for the database-backed task queue."""
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.jobs.models import Job
+from apps.jobs.tasks import enqueue_job_geocoding
+from apps.tasks.models import Task, TaskStatus
+from apps.tasks.queue import (
+    dequeue,
+    enqueue,
+    queue_metrics,
+    requeue_stale_tasks,
+    run_task,
+    schedule_periodic_tasks,
+    task,
+)
+from apps.tasks.worker import Worker
+from apps.users.models import Employer
+
+
+CALLS = []
+
+
+@task("tests.record", queue="tests")
+def record(value):
+    CALLS.append(value)
+
+
+@task("tests.flaky", queue="tests", max_attempts=2, backoff=10)
+def flaky():
+    raise RuntimeError("boom")
+
+
+@task("tests.periodic", queue="tests-periodic", every=timedelta(minutes=5))
+def periodic():
+    CALLS.append("tick")
+
+
+class TaskQueueTests(APITestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_dequeue_orders_by_priority_then_due_time(self):
+        now = timezone.now()
+        enqueue("tests.record", {"value": "late"}, run_at=now - timedelta(minutes=1))
+        enqueue("tests.record", {"value": "early"}, run_at=now - timedelta(minutes=5))
+        enqueue("tests.record", {"value": "urgent"}, priority=10)
+        enqueue("tests.record", {"value": "scheduled"}, delay=timedelta(hours=1))
+
+        claimed = dequeue("w1", queues=["tests"], limit=10)
+        self.assertEqual([row.payload["value"] for row in claimed], ["urgent", "early", "late"])
+        self.assertEqual(Task.objects.filter(status=TaskStatus.RUNNING, locked_by="w1", attempts=1).count(), 3)
+        self.assertEqual(dequeue("w2", queues=["tests"]), [])
+
+        for row in claimed:
+            self.assertTrue(run_task(row))
+        self.assertEqual(CALLS, ["urgent", "early", "late"])
+        self.assertEqual(Task.objects.filter(status=TaskStatus.SUCCEEDED).count(), 3)
+
+    def test_failures_back_off_then_fail(self):
+        enqueue("tests.flaky")
+        (row,) = dequeue("w1", queues=["tests"])
+        self.assertFalse(run_task(row))
+        row.refresh_from_db()
+        self.assertEqual(row.status, TaskStatus.QUEUED)
+        self.assertGreaterEqual(row.run_at, timezone.now() + timedelta(seconds=9))
+        self.assertIn("RuntimeError: boom", row.last_error)
+
+        Task.objects.filter(pk=row.pk).update(run_at=timezone.now())
+        (row,) = dequeue("w1", queues=["tests"])
+        self.assertFalse(run_task(row))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), (TaskStatus.FAILED, 2))
+
+        stale = enqueue("tests.record", {"value": "x"})
+        dequeue("w1", queues=["tests"])
+        Task.objects.filter(pk=stale.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(requeue_stale_tasks(), 1)
+        self.assertEqual(Task.objects.get(pk=stale.pk).status, TaskStatus.QUEUED)
+
+    def test_unique_keys_and_periodic_tasks(self):
+        enqueue("tests.record", {"value": 1}, unique_key="dedupe")
+        enqueue("tests.record", {"value": 2}, unique_key="dedupe")
+        self.assertEqual(Task.objects.filter(unique_key="dedupe").count(), 1)
+
+        schedule_periodic_tasks()
+        schedule_periodic_tasks()
+        self.assertEqual(Task.objects.filter(name="tests.periodic").count(), 1)
+        processed = Worker("t", queues=["tests-periodic"]).run(until_empty=True)
+        self.assertEqual((processed, CALLS), (1, ["tick"]))
+        upcoming = Task.objects.get(name="tests.periodic", status=TaskStatus.QUEUED)
+        self.assertGreater(upcoming.run_at, timezone.now() + timedelta(minutes=4))
+
+        metrics = {row["queue"]: row for row in queue_metrics()}
+        self.assertEqual(metrics["tests"]["ready"], 1)
+        self.assertEqual(metrics["tests-periodic"]["scheduled"], 1)
+
+    @override_settings(TASK_RETENTION=timedelta(0))
+    def test_job_geocoding_runs_in_the_background(self):
+        employer_user = get_user_model().objects.create_user(
+            email="farm@example.com", username="farm@example.com", password="pass", is_employer=True
+        )
+        employer = Employer.objects.create(user=employer_user, company_name="Farm")
+        job = Job.objects.create(employer=employer, title="Picker", description="Pick", location="Mildura VIC 3500")
+        enqueue_job_geocoding(job)
+        enqueue_job_geocoding(job)
+        self.assertEqual(Task.objects.filter(name="jobs.geocode_job").count(), 1)
+
+        with mock.patch("apps.jobs.tasks.geocode_query", return_value=(-34.2, 142.16)) as geocode:
+            call_command("run_workers", "--until-empty", "--queue", "geocoding", stdout=StringIO())
+        geocode.assert_called_once()
+        job.refresh_from_db()
+        self.assertEqual(float(job.location_latitude), -34.2)
+
+        staff = get_user_model().objects.create_user(
+            email="ops@example.com", username="ops@example.com", password="pass", is_staff=True
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(employer_user).access_token}")
+        self.assertEqual(self.client.get(reverse("tasks-metrics")).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(staff).access_token}")
+        response = self.client.get(reverse("tasks-metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["totals"]["ready"], 0)
+
+        call_command("purge_tasks", stdout=StringIO())
+        self.assertFalse(Task.objects.filter(name="jobs.geocode_job").exists())
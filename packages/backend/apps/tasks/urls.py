@@ -0,0 +1,8 @@
+"""URL routes for the task queue API."""
+from django.urls import path
+
+from .views import QueueMetricsView
+
+urlpatterns = [
+    path("metrics/", QueueMetricsView.as_view(), name="tasks-metrics"),
+]
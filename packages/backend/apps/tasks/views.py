@@ -0,0 +1,17 @@
+"""Operational endpoints for the task queue."""
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .queue import queue_metrics
+
+
+class QueueMetricsView(APIView):
+    """Queue depth per queue for dashboards and alerting; staff only."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        queues = queue_metrics()
+        totals = {name: sum(row[name] for row in queues) for name in ("ready", "scheduled", "running", "failed")}
+        return Response({"queues": queues, "totals": totals})
@@ -0,0 +1,121 @@
+"""Worker loop and the thread or process pool behind ``run_workers``."""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+
+from django.db import close_old_connections, connections
+
+from .queue import dequeue, requeue_stale_tasks, run_task, schedule_periodic_tasks
+
+
+logger = logging.getLogger(__name__)
+
+# How often each worker seeds periodic tasks and releases stale locks.
+MAINTENANCE_INTERVAL = 60.0
+
+
+class Worker:
+    """Claims and runs due tasks until ``stop_event`` is set, sleeping ``poll_interval`` when idle.
+
+    Long-lived pool workers pass ``manage_connections`` to drop broken or
+    expired database connections between rounds and close their own on exit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        queues=None,
+        batch_size: int = 1,
+        poll_interval: float = 1.0,
+        stop_event=None,
+        manage_connections: bool = False,
+    ):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{name}"
+        self.queues = queues or None
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.stop_event = stop_event or threading.Event()
+        self.manage_connections = manage_connections
+        self._maintained_at = 0.0
+
+    def maintain(self) -> None:
+        if time.monotonic() - self._maintained_at < MAINTENANCE_INTERVAL:
+            return
+        self._maintained_at = time.monotonic()
+        schedule_periodic_tasks(self.queues)
+        released = requeue_stale_tasks()
+        if released:
+            logger.warning("Released %s task(s) held by workers that stopped responding.", released)
+
+    def run_once(self) -> int:
+        """Maintain, then claim and run one batch; returns the number of tasks run."""
+
+        if self.manage_connections:
+            close_old_connections()
+        self.maintain()
+        tasks = dequeue(self.worker_id, queues=self.queues, limit=self.batch_size)
+        for row in tasks:
+            run_task(row)
+        return len(tasks)
+
+    def run(self, *, until_empty: bool = False) -> int:
+        processed = 0
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    ran = self.run_once()
+                except Exception:
+                    logger.exception("Worker %s could not claim tasks.", self.worker_id)
+                    ran = 0
+                processed += ran
+                if not ran:
+                    if until_empty:
+                        break
+                    self.stop_event.wait(self.poll_interval)
+        finally:
+            if self.manage_connections:
+                connections.close_all()
+        return processed
+
+
+def _run_worker(name: str, options: dict, stop_event) -> int:
+    return Worker(name, stop_event=stop_event, manage_connections=True, **options).run()
+
+
+def run_pool(concurrency: int, *, mode: str = "thread", stop_event=None, **options) -> None:
+    """Run ``concurrency`` workers as threads or forked processes until ``stop_event`` is set.
+
+    Each worker opens its own database connection; connections are closed
+    before forking so no child inherits the parent's socket.
+    """
+
+    if mode == "process":
+        stop_event = stop_event or multiprocessing.Event()
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_run_worker, args=(f"p{index}", options, stop_event), daemon=True)
+            for index in range(concurrency)
+        ]
+    else:
+        stop_event = stop_event or threading.Event()
+        workers = [
+            threading.Thread(target=_run_worker, args=(f"t{index}", options, stop_event), daemon=True)
+            for index in range(concurrency)
+        ]
+    for worker in workers:
+        worker.start()
+    try:
+        while any(worker.is_alive() for worker in workers):
+            for worker in workers:
+                worker.join(timeout=1.0)
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
@@ -0,0 +1,186 @@
+"""``Idempotency-Key`` support for mutating API views.
+
+A client that retries a POST with the same key gets the stored response of
+the first attempt (status, body and the headers the view set) instead of
+running the view again. Keys are scoped per user
+and expire after ``IDEMPOTENCY_KEY_TTL``. While the first attempt is running,
+duplicates receive ``409`` so the expensive work only happens once.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.http.request import RawPostDataException
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import IdempotencyKey
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+# Set again by the renderer on every response, so never stored.
+RENDERED_HEADERS = frozenset({"content-type", "content-length"})
+
+
+def _ttl():
+    return settings.IDEMPOTENCY_KEY_TTL
+
+
+def _lock_timeout():
+    return settings.IDEMPOTENCY_LOCK_TIMEOUT
+
+
+def request_fingerprint(request) -> str:
+    """Hash of method, path and raw body, used to reject a key reused for another request."""
+
+    try:
+        body = request.body
+    except RawPostDataException:
+        body = json.dumps(request.data, sort_keys=True, cls=JSONEncoder).encode()
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\n")
+    digest.update(request.path.encode())
+    digest.update(b"\n")
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def claim_key(user, key: str, request, fingerprint: str) -> tuple[IdempotencyKey, bool]:
+    """Return ``(record, claimed)``; ``claimed`` means the caller must run the view.
+
+    The claim commits on its own so concurrent duplicates see it. An expired
+    key, or an in-progress key older than ``IDEMPOTENCY_LOCK_TIMEOUT``, is
+    taken over under a row lock.
+    """
+
+    now = timezone.now()
+    claim = {
+        "request_method": request.method,
+        "request_path": request.path[:255],
+        "request_fingerprint": fingerprint,
+        "status": "in_progress",
+        "response_status": None,
+        "response_body": None,
+        "response_headers": {},
+        "locked_at": now,
+        "expires_at": now + _ttl(),
+    }
+    with transaction.atomic():
+        record, created = IdempotencyKey.objects.select_for_update().get_or_create(
+            user=user, key=key, defaults=claim
+        )
+        if created:
+            return record, True
+        abandoned = record.status == "in_progress" and record.locked_at <= now - _lock_timeout()
+        if record.expires_at <= now or abandoned:
+            for name, value in claim.items():
+                setattr(record, name, value)
+            record.save()
+            return record, True
+    return record, False
+
+
+def release_key(record: IdempotencyKey) -> None:
+    """Drop a claim whose attempt failed so the client may retry it."""
+
+    IdempotencyKey.objects.filter(pk=record.pk, status="in_progress").delete()
+
+
+def store_response(record: IdempotencyKey, response) -> None:
+    """Store the status, body and view-set headers of the first response for replays."""
+
+    record.status = "completed"
+    record.response_status = response.status_code
+    record.response_body = json.loads(json.dumps(response.data, cls=JSONEncoder))
+    record.response_headers = {
+        name: value for name, value in response.items() if name.lower() not in RENDERED_HEADERS
+    }
+    IdempotencyKey.objects.filter(pk=record.pk).update(
+        status=record.status,
+        response_status=record.response_status,
+        response_body=record.response_body,
+        response_headers=record.response_headers,
+    )
+
+
+def replay_response(record: IdempotencyKey, request, fingerprint: str) -> Response:
+    if (
+        record.request_fingerprint != fingerprint
+        or record.request_method != request.method
+        or record.request_path != request.path[:255]
+    ):
+        return Response(
+            {
+                "detail": "This Idempotency-Key was already used for a different request.",
+                "code": "idempotency_key_reused",
+            },
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    if record.status != "completed":
+        return Response(
+            {
+                "detail": "A request with this Idempotency-Key is still being processed.",
+                "code": "idempotency_key_in_progress",
+            },
+            status=status.HTTP_409_CONFLICT,
+            headers={"Retry-After": "1"},
+        )
+    return Response(
+        record.response_body,
+        status=record.response_status,
+        headers={**record.response_headers, "Idempotent-Replayed": "true"},
+    )
+
+
+def idempotent(view_method):
+    """Decorate an ``APIView`` handler (``post``, ``create``...) with ``Idempotency-Key`` support.
+
+    Requests without the header, or from anonymous users, run unchanged. Only
+    successful responses are stored; errors release the key so a corrected
+    retry runs again. Place it above ``transaction.atomic`` so the claim is
+    visible to concurrent duplicates while the view is still running.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = (request.headers.get(IDEMPOTENCY_HEADER) or "").strip()
+        if not key or not request.user.is_authenticated:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = request_fingerprint(request)
+        record, claimed = claim_key(request.user, key, request, fingerprint)
+        if not claimed:
+            return replay_response(record, request, fingerprint)
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            release_key(record)
+            raise
+        if isinstance(response, Response) and status.is_success(response.status_code):
+            store_response(record, response)
+        else:
+            release_key(record)
+        return response
+
+    return wrapper
+
+
+def purge_expired_idempotency_keys(now=None) -> int:
+    """Delete expired keys; returns the number of rows removed."""
+
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=now or timezone.now()).delete()
+    return deleted
@@ -0,0 +1,14 @@
+"""Delete stored Idempotency-Key responses past their TTL."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.users.idempotency import purge_expired_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = "Remove expired Idempotency-Key records."
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_idempotency_keys()
+        self.stdout.write(self.style.SUCCESS(f"Removed {deleted} expired idempotency keys."))
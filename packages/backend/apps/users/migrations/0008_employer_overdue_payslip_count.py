@@ -0,0 +1,34 @@
+# Generated by Django 5.0.2 on 2026-10-19 06:34
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_overdue_payslip_counts(apps, schema_editor):
+    Employer = apps.get_model("users", "Employer")
+    Payslip = apps.get_model("applications", "Payslip")
+    counts = (
+        Payslip.objects.filter(status="overdue")
+        .order_by()
+        .values_list("employer_id")
+        .annotate(overdue=Count("id"))
+    )
+    for employer_id, overdue in counts:
+        Employer.objects.filter(pk=employer_id).update(overdue_payslip_count=overdue, is_suspended=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_employer_is_suspended'),
+        ('applications', '0011_timesheet_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employer',
+            name='overdue_payslip_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_overdue_payslip_counts, migrations.RunPython.noop),
+    ]
@@ -65,6 +65,8 @@ class Employer(models.Model):
     company_description = models.TextField(blank=True, default="")
     abn = models.CharField(max_length=32, blank=True, default="")
     is_suspended = models.BooleanField(default=False)
+    # Maintained with every Payslip status change; is_suspended follows it.
+    overdue_payslip_count = models.PositiveIntegerField(default=0)
     verified = models.BooleanField(default=False)
     business_category = models.CharField(max_length=128, blank=True, default="")
     contact_name = models.CharField(max_length=128, blank=True, default="")
@@ -189,3 +191,34 @@ class TravellerDocument(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - repr helper
         return f"{self.title} ({self.category})"
+
+
+class IdempotencyKey(models.Model):
+    """First response of a mutating request, replayed when the client retries it."""
+
+    STATUS_CHOICES = [
+        ("in_progress", "In progress"),
+        ("completed", "Completed"),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="idempotency_keys")
+    key = models.CharField(max_length=255)
+    request_method = models.CharField(max_length=10)
+    request_path = models.CharField(max_length=255)
+    request_fingerprint = models.CharField(max_length=64)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="in_progress")
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True)
+    # Headers the view set on the first response (e.g. ``Server-Timing``), replayed with the body.
+    response_headers = models.JSONField(blank=True, default=dict)
+    locked_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="unique_user_idempotency_key")
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.key} ({self.status})"
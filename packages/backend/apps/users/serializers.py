@@ -47,6 +47,7 @@ class EmployerSerializer(serializers.ModelSerializer):
             "company_description",
             "abn",
             "is_suspended",
+            "overdue_payslip_count",
             "verified",
             "business_category",
             "contact_name",
@@ -64,7 +65,14 @@ class EmployerSerializer(serializers.ModelSerializer):
             "rating_count",
             "user",
         ]
-        read_only_fields = ("verified", "average_rating", "rating_count", "user")
+        read_only_fields = (
+            "is_suspended",
+            "overdue_payslip_count",
+            "verified",
+            "average_rating",
+            "rating_count",
+            "user",
+        )
 
 
 class EmployerProfileSerializer(EmployerSerializer):
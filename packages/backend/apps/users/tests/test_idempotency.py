@@ -0,0 +1,76 @@
+"""Tests for Idempotency-Key handling on mutating endpoints."""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.messaging.models import Message
+from apps.users.models import IdempotencyKey
+
+
+class IdempotencyKeyTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.employer = user_model.objects.create_user(
+            email="boss@example.com", username="boss@example.com", password="pass", is_employer=True
+        )
+        self.traveller = user_model.objects.create_user(
+            email="traveller@example.com", username="traveller@example.com", password="pass", is_traveller=True
+        )
+        self.url = reverse("messaging-send")
+        self.payload = {"traveller_id": self.traveller.id, "employer_id": self.employer.id, "body": "Hello"}
+        access = RefreshToken.for_user(self.traveller).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def _send(self, key, payload=None):
+        return self.client.post(self.url, payload or self.payload, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_first_response(self):
+        first = self._send("retry-1")
+        second = self._send("retry-1")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(Message.objects.count(), 1)
+
+    def test_key_reused_for_other_payload_is_rejected(self):
+        self._send("retry-2")
+
+        response = self._send("retry-2", {**self.payload, "body": "Different"})
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Message.objects.count(), 1)
+
+    def test_in_progress_duplicate_gets_conflict(self):
+        now = timezone.now()
+        self._send("retry-3")
+        IdempotencyKey.objects.filter(key="retry-3").update(status="in_progress", locked_at=now)
+
+        response = self._send("retry-3")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Message.objects.count(), 1)
+
+    def test_failed_and_expired_keys_run_again(self):
+        invalid = self._send("retry-4", {"body": "Missing participants"})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(IdempotencyKey.objects.filter(key="retry-4").exists())
+
+        self._send("retry-4")
+        IdempotencyKey.objects.filter(key="retry-4").update(expires_at=timezone.now() - timedelta(seconds=1))
+        self._send("retry-4")
+
+        self.assertEqual(Message.objects.count(), 2)
+
+    def test_requests_without_key_are_not_recorded(self):
+        self.client.post(self.url, self.payload, format="json")
+        self.client.post(self.url, self.payload, format="json")
+
+        self.assertEqual(Message.objects.count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
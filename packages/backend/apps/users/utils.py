@@ -4,8 +4,13 @@ from __future__ import annotations
 from typing import List
 
 from django.contrib.auth import get_user_model
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Greatest
+from django.db.models.lookups import GreaterThan
 from rest_framework.exceptions import ValidationError
 
+from .models import Employer
+
 
 User = get_user_model()
 
@@ -90,15 +95,24 @@ def ensure_employer_not_suspended(user: User) -> None:
         )
 
 
-def unsuspend_employer_if_settled(employer) -> None:
-    if not employer or not getattr(employer, "is_suspended", False):
-        return
+def adjust_overdue_payslip_counts(deltas: dict[int, int]) -> None:
+    """Apply per-employer overdue payslip deltas and derive suspension in one UPDATE.
 
-    from apps.applications.models import Payslip  # avoid circular import
+    An employer is suspended while it has at least one overdue payslip and
+    unsuspended as soon as the count drops back to zero.
+    """
 
-    has_overdue = Payslip.objects.filter(employer=employer, status="overdue").exists()
-    if has_overdue:
+    deltas = {employer_id: delta for employer_id, delta in deltas.items() if delta}
+    if not deltas:
         return
 
-    employer.is_suspended = False
-    employer.save(update_fields=["is_suspended", "updated_at"] if hasattr(employer, "updated_at") else ["is_suspended"])
+    delta = Case(
+        *[When(pk=employer_id, then=Value(value)) for employer_id, value in deltas.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    new_count = Greatest(F("overdue_payslip_count") + delta, Value(0))
+    Employer.objects.filter(pk__in=deltas.keys()).update(
+        overdue_payslip_count=new_count,
+        is_suspended=Case(When(GreaterThan(new_count, 0), then=Value(True)), default=Value(False)),
+    )
@@ -22,8 +22,9 @@ from .serializers import (
     build_auth_response,
 )
 from .models import Employer, JobHistory, TravellerDocument
-from apps.jobs.models import Job, JobStatus
-from apps.jobs.serializers import JobSerializer
+from apps.jobs.models import JobStatus
+from apps.jobs.serializers import EmployerJobSummarySerializer
+from apps.jobs.views import employer_job_summaries
 
 User = get_user_model()
 
@@ -76,13 +77,10 @@ class EmployerStatsView(APIView):
             raise PermissionDenied("Only employers can access this resource.")
 
         employer_profile, _ = Employer.objects.get_or_create(user=user)
-        jobs = Job.objects.filter(employer=employer_profile).order_by("-created_at")
-        active_jobs = jobs.filter(status=JobStatus.ACTIVE)
-        draft_jobs = jobs.filter(status=JobStatus.DRAFT)
-        closed_jobs = jobs.filter(status=JobStatus.CLOSED)
-
-        def serialize_jobs(qs):
-            return JobSerializer(qs, many=True).data
+        jobs = EmployerJobSummarySerializer(employer_job_summaries(employer_profile), many=True).data
+        jobs_by_status = {value: [] for value in JobStatus.values}
+        for job in jobs:
+            jobs_by_status.setdefault(job["status"], []).append(job)
 
         recent_comments = []
         for history in employer_profile.worker_history.all()[:5]:
@@ -99,14 +97,18 @@ class EmployerStatsView(APIView):
 
         payload = {
             "counts": {
-                "total": jobs.count(),
-                "active": active_jobs.count(),
-                "draft": draft_jobs.count(),
-                "closed": closed_jobs.count(),
+                "total": len(jobs),
+                "active": len(jobs_by_status[JobStatus.ACTIVE]),
+                "draft": len(jobs_by_status[JobStatus.DRAFT]),
+                "closed": len(jobs_by_status[JobStatus.CLOSED]),
+                "applications": sum(job["application_count"] for job in jobs),
+                "new_applications": sum(job["new_application_count"] for job in jobs),
+                "unread_applications": sum(job["unread_application_count"] for job in jobs),
+                "pending_offers": sum(job["pending_offer_count"] for job in jobs),
             },
-            "active_jobs": serialize_jobs(active_jobs),
-            "draft_jobs": serialize_jobs(draft_jobs),
-            "closed_jobs": serialize_jobs(closed_jobs),
+            "active_jobs": jobs_by_status[JobStatus.ACTIVE],
+            "draft_jobs": jobs_by_status[JobStatus.DRAFT],
+            "closed_jobs": jobs_by_status[JobStatus.CLOSED],
             "average_rating": employer_profile.average_rating,
             "rating_count": employer_profile.rating_count,
             "recent_comments": recent_comments,
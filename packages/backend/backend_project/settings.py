@@ -3,6 +3,8 @@ from pathlib import Path
 import os
 from datetime import timedelta
 
+from corsheaders.defaults import default_headers
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 load_dotenv = False
@@ -34,6 +36,7 @@ INSTALLED_APPS = [
     "apps.hours",
     "apps.payments",
     "apps.messaging",
+    "apps.tasks",
 ]
 
 MIDDLEWARE = [
@@ -44,6 +47,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "apps.users.middleware.ProtectedAPIMiddleware",
+    "apps.tasks.middleware.DomainEventMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -117,6 +121,7 @@ SIMPLE_JWT = {
 
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, "idempotency-key")
 
 STRIPE_API_KEY = os.getenv("STRIPE_API_KEY", "sk_test_placeholder")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_placeholder")
@@ -133,4 +138,20 @@ AUTH_PROTECTED_PATH_PREFIXES = [
     "/api/users/me/",
     "/api/users/auth/logout/",
     "/api/messaging/",
+    "/api/tasks/",
 ]
+
+# Stored responses for the ``Idempotency-Key`` header (see apps.users.idempotency).
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24")))
+# An in-progress key older than this is assumed abandoned (e.g. a killed worker) and can be reclaimed.
+IDEMPOTENCY_LOCK_TIMEOUT = timedelta(minutes=5)
+
+# Background task queue (see apps.tasks.queue).
+# A task still running this long after it was claimed is assumed abandoned (e.g. a killed worker) and requeued.
+TASK_LOCK_TIMEOUT = timedelta(minutes=int(os.getenv("TASK_LOCK_TIMEOUT_MINUTES", "15")))
+# Finished tasks are kept this long for inspection, then removed by purge_tasks.
+TASK_RETENTION = timedelta(days=int(os.getenv("TASK_RETENTION_DAYS", "7")))
+
+# System messages (see apps.messaging.service).
+# Repeated updates of the same kind (e.g. timesheet edits) posted within this window are merged into one message.
+SYSTEM_MESSAGE_COALESCE_WINDOW = timedelta(minutes=int(os.getenv("SYSTEM_MESSAGE_COALESCE_MINUTES", "10")))
@@ -15,6 +15,7 @@ urlpatterns = [
     path("api/hours/", include("apps.hours.urls")),
     path("api/payments/", include("apps.payments.urls")),
     path("api/messaging/", include("apps.messaging.urls")),
+    path("api/tasks/", include("apps.tasks.urls")),
 ]
 
 if settings.DEBUG:
@@ -29,7 +29,17 @@ export interface ConversationSummary {
   traveller_name?: string;
   other_participant_name?: string;
   last_message_at: string;
+  last_message?: number | null;
   last_message_preview?: string;
+  last_message_sender?: number | null;
+  last_message_sender_name?: string;
+  last_message_type?: string;
+}
+
+export interface ConversationPage {
+  next: string | null;
+  previous: string | null;
+  results: ConversationSummary[];
 }
 
 export interface MessageEnvelope {
@@ -87,6 +97,10 @@ export interface JobOffer {
   timesheet?: Timesheet;
 }
 
+export interface JobOfferListItem extends Omit<JobOffer, 'timesheet'> {
+  timesheet?: TimesheetSummary | null;
+}
+
 export type TimesheetStatus = 'draft' | 'submitted' | 'approved';
 
 export interface TimesheetEntry {
@@ -97,15 +111,31 @@ export interface TimesheetEntry {
   is_paid?: boolean;
 }
 
-export interface Timesheet {
+export interface TimesheetSummary {
   status: TimesheetStatus;
   traveller_notes?: string;
   employer_notes?: string;
   submitted_at?: string | null;
   approved_at?: string | null;
+  total_hours?: string;
+  approved_hours?: string;
+  unpaid_hours?: string;
+  paid_hours?: string;
+  entry_count?: number;
+  first_entry_date?: string | null;
+  last_entry_date?: string | null;
+}
+
+export interface Timesheet extends TimesheetSummary {
   entries: TimesheetEntry[];
 }
 
+export interface TimesheetWindow {
+  start_date?: string;
+  end_date?: string;
+  payslip?: number;
+}
+
 export type TravellerDocumentCategory =
   | 'timesheet_pdf'
   | 'payslip_pdf'
@@ -193,10 +223,131 @@ export interface ApplicationRecord {
   cover_letter?: string;
   status: string;
   offer?: JobOffer | null;
+  employer_viewed_at?: string | null;
   submitted_at: string;
   updated_at: string;
 }
 
+export interface ApplicationPipelineCard {
+  id: number;
+  applicant: number;
+  applicant_name: string;
+  applicant_profile_picture_url?: string;
+  status: string;
+  employer_viewed_at: string | null;
+  submitted_at: string;
+  updated_at: string;
+}
+
+export interface ApplicationPipelineColumn {
+  status: string;
+  label: string;
+  count: number;
+  results: ApplicationPipelineCard[];
+  next: string | null;
+}
+
+export interface ApplicationPipeline {
+  job_id: number;
+  total: number;
+  counts: Record<string, number>;
+  columns: ApplicationPipelineColumn[];
+}
+
+export interface ApplicationPipelinePage {
+  next: string | null;
+  previous: string | null;
+  results: ApplicationPipelineCard[];
+}
+
+export interface WorkerRosterRow {
+  offer: number;
+  application: number;
+  traveller: number;
+  traveller_name: string;
+  job: number;
+  job_title: string;
+  start_date: string;
+  end_date: string | null;
+  timesheet_status: TimesheetStatus;
+  total_hours: string;
+  approved_unpaid_hours: string;
+  pending_hours: string;
+  paid_hours: string;
+  last_entry_date: string | null;
+  last_payslip: number | null;
+  last_payslip_status: string;
+  last_payslip_at: string | null;
+  last_paid_at: string | null;
+  updated_at: string;
+}
+
+export interface WorkerRosterPage {
+  next: string | null;
+  previous: string | null;
+  results: WorkerRosterRow[];
+}
+
+export interface ApplicationTransitionResult {
+  status: string;
+  updated: number[];
+  skipped: { application_id: number; detail: string }[];
+}
+
+export interface IncomeStatement {
+  scope: 'traveller' | 'employer';
+  financial_year: number;
+  hours_approved: string;
+  gross: string;
+  commission: string;
+  tax_withheld: string;
+  super_amount: string;
+  net_earned: string;
+  net_paid: string;
+  outstanding: string;
+  snapshot_through_entry_id: number | null;
+  snapshot_at: string | null;
+}
+
+export interface RegionalWorkProgress {
+  day_count: number;
+  target_days: number;
+  remaining_days: number;
+  completed: boolean;
+  hours: string;
+  first_day: string | null;
+  last_day: string | null;
+  updated_at: string | null;
+}
+
+export interface PayrollRollupTotals {
+  payslip_count: number;
+  completed_count: number;
+  hour_count: number;
+  gross_amount: number;
+  commission_amount: number;
+  tax_withheld: number;
+  super_amount: number;
+  net_payment: number;
+  paid_amount: number;
+}
+
+export type PayrollRollupGroup = 'month' | 'job' | 'employer';
+
+export interface PayrollRollupRow extends PayrollRollupTotals {
+  month?: string;
+  job_id?: number;
+  job__title?: string;
+  employer_id?: number;
+  employer__company_name?: string;
+}
+
+export interface PayrollRollupDashboard {
+  group_by: PayrollRollupGroup;
+  rows: PayrollRollupRow[];
+  totals: PayrollRollupTotals;
+}
+
 export interface CreateApplicationPayload {
   job: number;
   cover_letter?: string;
@@ -301,10 +452,14 @@ export interface EmployerStatsPayload {
     active: number;
     draft: number;
     closed: number;
+    applications: number;
+    new_applications: number;
+    unread_applications: number;
+    pending_offers: number;
   };
-  active_jobs: JobSummary[];
-  draft_jobs: JobSummary[];
-  closed_jobs: JobSummary[];
+  active_jobs: EmployerJobSummary[];
+  draft_jobs: EmployerJobSummary[];
+  closed_jobs: EmployerJobSummary[];
   average_rating?: number;
   rating_count?: number;
   recent_comments: Array<{
@@ -330,6 +485,31 @@ export interface JobSummary {
   updated_at: string;
 }
 
+// Compact row returned for the employer's own jobs, with maintained applicant counters.
+export interface EmployerJobSummary {
+  id: number;
+  title: string;
+  status: string;
+  is_live: boolean;
+  category: string;
+  employment_type: string;
+  location: string;
+  location_city: string;
+  location_state: string;
+  hourly_rate: string | null;
+  fixed_salary: string | null;
+  currency: string;
+  is_remote_friendly: boolean;
+  start_date?: string | null;
+  end_date?: string | null;
+  created_at: string;
+  updated_at: string;
+  application_count: number;
+  new_application_count: number;
+  unread_application_count: number;
+  pending_offer_count: number;
+}
+
 export interface Job extends JobSummary {
   category: string;
   employment_type: string;
@@ -339,6 +519,8 @@ export interface Job extends JobSummary {
   location_region: string;
   location_latitude?: string | null;
   location_longitude?: string | null;
+  postcode: string;
+  location_class: LocationClass;
   is_live: boolean;
   fixed_salary: string | null;
   work_hours_per_day: string | null;
@@ -385,10 +567,15 @@ export interface CreateJobPayload {
   certifications_required?: string;
 }
 
+export type LocationClass = 'unknown' | 'major_city' | 'regional' | 'remote';
+
 export interface JobListParams {
   state?: string;
   region?: string;
   city?: string;
+  // Regional and remote postcodes only, as classified server-side.
+  regional?: boolean;
+  location_class?: LocationClass;
   q?: string;
   radius_km?: number;
   limit?: number;
@@ -477,6 +664,18 @@ const api = axios.create({
   withCredentials: true,
 });
 
+export function newIdempotencyKey(): string {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+
+// Pass the same key when retrying an action so the server replays the first response.
+function idempotencyHeaders(idempotencyKey?: string) {
+  return { headers: { 'Idempotency-Key': idempotencyKey || newIdempotencyKey() } };
+}
+
 let inMemoryTokens: AuthTokens | null = null;
 let refreshPromise: Promise<AuthTokens> | null = null;
 
@@ -634,8 +833,8 @@ export async function deleteTravellerDocument(id: number): Promise<void> {
   await api.delete(`/users/documents/${id}/`);
 }
 
-export async function fetchEmployerJobs(): Promise<Job[]> {
-  const { data } = await api.get<Job[]>('/jobs/mine/');
+export async function fetchEmployerJobs(): Promise<EmployerJobSummary[]> {
+  const { data } = await api.get<EmployerJobSummary[]>('/jobs/mine/');
   return data;
 }
 
@@ -658,8 +857,115 @@ export async function fetchApplication(applicationId: number): Promise<Applicati
   return data;
 }
 
-export async function createApplication(payload: CreateApplicationPayload): Promise<ApplicationRecord> {
-  const { data } = await api.post<ApplicationRecord>('/applications/', payload);
+export async function createApplication(
+  payload: CreateApplicationPayload,
+  idempotencyKey?: string
+): Promise<ApplicationRecord> {
+  const { data } = await api.post<ApplicationRecord>('/applications/', payload, idempotencyHeaders(idempotencyKey));
+  return data;
+}
+
+export async function fetchJobPipeline(jobId: number, pageSize?: number): Promise<ApplicationPipeline> {
+  const params = pageSize ? { page_size: pageSize } : undefined;
+  const { data } = await api.get<ApplicationPipeline>(`/applications/jobs/${jobId}/pipeline/`, { params });
+  return data;
+}
+
+// ``nextUrl`` is the absolute cursor link returned in a column's ``next``.
+export async function fetchJobPipelinePage(nextUrl: string): Promise<ApplicationPipelinePage> {
+  const { data } = await api.get<ApplicationPipelinePage>(nextUrl);
+  return data;
+}
+
+export async function transitionApplications(
+  jobId: number,
+  applicationIds: number[],
+  status: string
+): Promise<ApplicationTransitionResult> {
+  const { data } = await api.post<ApplicationTransitionResult>(`/applications/jobs/${jobId}/pipeline/transition/`, {
+    application_ids: applicationIds,
+    status,
+  });
+  return data;
+}
+
+// Streams a ZIP of payslip files issued between the dates (inclusive, YYYY-MM-DD).
+export async function downloadPayslipArchive(
+  params: { startDate?: string; endDate?: string; include?: ('pdf' | 'aba')[] } = {}
+): Promise<Blob> {
+  const query: Record<string, string> = {};
+  if (params.startDate) {
+    query.start_date = params.startDate;
+  }
+  if (params.endDate) {
+    query.end_date = params.endDate;
+  }
+  if (params.include?.length) {
+    query.include = params.include.join(',');
+  }
+  const { data } = await api.get<Blob>('/applications/payslips/export/', { params: query, responseType: 'blob' });
+  return data;
+}
+
+const CSV_EXPORT_PATHS = {
+  payslips: '/applications/payslips/export/csv/',
+  timesheetEntries: '/applications/timesheets/entries/export/csv/',
+  hours: '/hours/export/csv/',
+  regionalWork: '/applications/regional-work/evidence/csv/',
+} as const;
+
+export async function downloadCsvExport(
+  kind: keyof typeof CSV_EXPORT_PATHS,
+  params: { startDate?: string; endDate?: string; columns?: string[] } = {}
+): Promise<Blob> {
+  const query: Record<string, string> = {};
+  if (params.startDate) {
+    query.start_date = params.startDate;
+  }
+  if (params.endDate) {
+    query.end_date = params.endDate;
+  }
+  if (params.columns?.length) {
+    query.columns = params.columns.join(',');
+  }
+  const { data } = await api.get<Blob>(CSV_EXPORT_PATHS[kind], { params: query, responseType: 'blob' });
+  return data;
+}
+
+// ``financialYear`` is the calendar year the financial year starts in; defaults to the current one.
+export async function fetchIncomeStatement(financialYear?: number): Promise<IncomeStatement> {
+  const params = financialYear ? { financial_year: financialYear } : undefined;
+  const { data } = await api.get<IncomeStatement>('/applications/income-statement/', { params });
+  return data;
+}
+
+// 88 approved regional days for a second-year visa, 179 for a third.
+export async function fetchRegionalWorkProgress(visa: 'second' | 'third' = 'second'): Promise<RegionalWorkProgress> {
+  const { data } = await api.get<RegionalWorkProgress>('/applications/regional-work/', { params: { visa } });
+  return data;
+}
+
+// Months are YYYY-MM and inclusive; staff may pass ``employerId``, employers only see their own totals.
+export async function fetchPayrollRollups(
+  params: { groupBy?: PayrollRollupGroup; startMonth?: string; endMonth?: string; jobId?: number; employerId?: number } = {}
+): Promise<PayrollRollupDashboard> {
+  const query: Record<string, string | number> = {};
+  if (params.groupBy) {
+    query.group_by = params.groupBy;
+  }
+  if (params.startMonth) {
+    query.start_month = params.startMonth;
+  }
+  if (params.endMonth) {
+    query.end_month = params.endMonth;
+  }
+  if (params.jobId) {
+    query.job_id = params.jobId;
+  }
+  if (params.employerId) {
+    query.employer_id = params.employerId;
+  }
+  const { data } = await api.get<PayrollRollupDashboard>('/applications/payroll/rollups/', { params: query });
   return data;
 }
 
@@ -684,13 +990,19 @@ export async function updateJobOffer(
   return data;
 }
 
-export async function fetchEmployerWorkers(): Promise<JobOffer[]> {
-  const { data } = await api.get<JobOffer[]>('/applications/my-workers/');
+export async function fetchEmployerWorkers(): Promise<JobOfferListItem[]> {
+  const { data } = await api.get<JobOfferListItem[]>('/applications/my-workers/');
+  return data;
+}
+
+// Pass the previous page's ``next`` URL to load the following page.
+export async function fetchEmployerRoster(nextUrl?: string): Promise<WorkerRosterPage> {
+  const { data } = await api.get<WorkerRosterPage>(nextUrl || '/applications/my-workers/roster/');
   return data;
 }
 
-export async function fetchTravellerJobs(): Promise<JobOffer[]> {
-  const { data } = await api.get<JobOffer[]>('/applications/my-jobs/');
+export async function fetchTravellerJobs(): Promise<JobOfferListItem[]> {
+  const { data } = await api.get<JobOfferListItem[]>('/applications/my-jobs/');
   return data;
 }
 
@@ -703,8 +1015,8 @@ export interface UpdateTimesheetPayload {
   traveller_notes?: string;
 }
 
-export async function fetchTimesheet(applicationId: number): Promise<Timesheet> {
-  const { data } = await api.get<Timesheet>(`/applications/${applicationId}/timesheet/`);
+export async function fetchTimesheet(applicationId: number, window?: TimesheetWindow): Promise<Timesheet> {
+  const { data } = await api.get<Timesheet>(`/applications/${applicationId}/timesheet/`, { params: window });
   return data;
 }
 
@@ -736,8 +1048,12 @@ export async function fetchPayslip(applicationId: number): Promise<Payslip | nul
   return response.data;
 }
 
-export async function createPayslip(applicationId: number): Promise<Payslip> {
-  const { data } = await api.post<Payslip>(`/applications/${applicationId}/payslip/`);
+export async function createPayslip(applicationId: number, idempotencyKey?: string): Promise<Payslip> {
+  const { data } = await api.post<Payslip>(
+    `/applications/${applicationId}/payslip/`,
+    undefined,
+    idempotencyHeaders(idempotencyKey)
+  );
   return data;
 }
 
@@ -749,8 +1065,8 @@ export async function confirmPayslipInstructions(applicationId: number): Promise
 export async function fetchJobs(params: JobListParams = {}) {
   const query: Record<string, string | number> = {};
   Object.entries(params).forEach(([key, value]) => {
-    if (value === undefined || value === null || value === '') return;
-    query[key] = value;
+    if (value === undefined || value === null || value === '' || value === false) return;
+    query[key] = value === true ? 'true' : value;
   });
   if (!query.limit) {
     query.limit = 24;
@@ -769,13 +1085,25 @@ export async function createJob(payload: CreateJobPayload): Promise<Job> {
   return data;
 }
 
-export async function sendConversationMessage(payload: SendConversationPayload): Promise<SendConversationResponse> {
-  const { data } = await api.post<SendConversationResponse>('/messaging/conversations/send/', payload);
+export async function sendConversationMessage(
+  payload: SendConversationPayload,
+  idempotencyKey?: string
+): Promise<SendConversationResponse> {
+  const { data } = await api.post<SendConversationResponse>(
+    '/messaging/conversations/send/',
+    payload,
+    idempotencyHeaders(idempotencyKey)
+  );
+  return data;
+}
+
+export async function fetchConversations(nextUrl?: string): Promise<ConversationPage> {
+  const { data } = await api.get<ConversationPage>(nextUrl || '/messaging/conversations/');
   return data;
 }
 
-export async function fetchConversations(): Promise<ConversationSummary[]> {
-  const { data } = await api.get<ConversationSummary[]>('/messaging/conversations/');
+export async function fetchConversation(conversationId: number): Promise<ConversationSummary> {
+  const { data } = await api.get<ConversationSummary>(`/messaging/conversations/${conversationId}/`);
   return data;
 }
 
@@ -5,14 +5,14 @@ import clsx from 'clsx';
 
 import { Layout } from '../../components/Layout';
 import { useAuthRedirect } from '../../hooks/useAuthRedirect';
-import { ApplicationRecord, Job, fetchApplications, fetchEmployerJobs } from '../../lib/api';
+import { ApplicationRecord, EmployerJobSummary, fetchApplications, fetchEmployerJobs } from '../../lib/api';
 
 function JobListItem({
   job,
   isActive,
   onSelect,
 }: {
-  job: Job;
+  job: EmployerJobSummary;
   isActive: boolean;
   onSelect: () => void;
 }) {
@@ -32,7 +32,10 @@ function JobListItem({
       <p className="mt-1 text-sm text-slate-500">
         {job.location_city || job.location_state ? `${job.location_city || ''} ${job.location_state || ''}`.trim() : job.location}
       </p>
-      <p className="text-xs text-slate-400">Posted {new Date(job.created_at).toLocaleDateString()}</p>
+      <p className="text-xs text-slate-400">
+        Posted {new Date(job.created_at).toLocaleDateString()} · {job.application_count} applicants
+        {job.unread_application_count ? ` · ${job.unread_application_count} unread` : ''}
+      </p>
     </button>
   );
 }
@@ -127,7 +130,7 @@ export default function EmployerApplicationsPage() {
     data: jobs,
     isLoading: loadingJobs,
     error: jobsError,
-  } = useSWR<Job[]>(user ? ['employer-jobs'] : null, fetchEmployerJobs);
+  } = useSWR<EmployerJobSummary[]>(user ? ['employer-jobs'] : null, fetchEmployerJobs);
 
   const activeJobs = useMemo(() => (jobs || []).filter((job) => job.status === 'active'), [jobs]);
 
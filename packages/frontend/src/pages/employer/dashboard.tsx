@@ -2,14 +2,14 @@ import Link from 'next/link';
 import { useEffect, useMemo, useState } from 'react';
 import { Layout } from '../../components/Layout';
 import { useAuthRedirect } from '../../hooks/useAuthRedirect';
-import { Job, fetchEmployerJobs } from '../../lib/api';
+import { EmployerJobSummary, fetchEmployerJobs } from '../../lib/api';
 
 export default function EmployerDashboard() {
   const { user, initializing, unauthorized } = useAuthRedirect('/auth/login', {
     requiredRole: 'employer',
     unauthorizedRedirectTo: '/',
   });
-  const [jobs, setJobs] = useState<Job[]>([]);
+  const [jobs, setJobs] = useState<EmployerJobSummary[]>([]);
   const [loadingJobs, setLoadingJobs] = useState(false);
   const [jobError, setJobError] = useState<string | null>(null);
 
@@ -146,7 +146,9 @@ export default function EmployerDashboard() {
                     </div>
                   </div>
                   <p className="mt-2 text-xs text-slate-400">
-                    Posted {new Date(job.created_at).toLocaleDateString()}
+                    Posted {new Date(job.created_at).toLocaleDateString()} · {job.application_count} applicants
+                    {job.new_application_count ? ` · ${job.new_application_count} new` : ''}
+                    {job.pending_offer_count ? ` · ${job.pending_offer_count} pending offers` : ''}
                   </p>
                 </article>
               ))}
@@ -401,8 +401,13 @@ export default function WorkerDetailPage() {
                   { label: 'Hours paid', value: `${Number(payslip.hour_count).toFixed(2)} h` },
                   { label: 'Gross', value: `${payslip.rate_currency} ${payslip.gross_amount}` },
                   { label: 'Commission (1%)', value: `${payslip.rate_currency} ${payslip.commission_amount}` },
-                  { label: 'Superannuation (11%)', value: `${payslip.rate_currency} ${payslip.super_amount}` },
-                  { label: 'Tax withheld (15%)', value: `${payslip.rate_currency} ${payslip.tax_withheld}` },
+                  { label: 'Superannuation', value: `${payslip.rate_currency} ${payslip.super_amount}` },
+                  {
+                    label: payslip.metadata?.tax_table
+                      ? `Tax withheld (PAYG ${payslip.metadata.tax_table})`
+                      : 'Tax withheld (PAYG)',
+                    value: `${payslip.rate_currency} ${payslip.tax_withheld}`,
+                  },
                   { label: 'Net payment', value: `${payslip.rate_currency} ${payslip.net_payment}` },
                   {
                     label: 'Pay period',
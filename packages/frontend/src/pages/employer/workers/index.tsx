@@ -1,10 +1,11 @@
+import { useState } from 'react';
 import Link from 'next/link';
 import useSWR from 'swr';
 import clsx from 'clsx';
 
 import { Layout } from '../../../components/Layout';
 import { useAuthRedirect } from '../../../hooks/useAuthRedirect';
-import { JobOffer, fetchEmployerWorkers } from '../../../lib/api';
+import { WorkerRosterPage, WorkerRosterRow, fetchEmployerRoster } from '../../../lib/api';
 
 const STATUS_BADGE: Record<string, string> = {
   draft: 'bg-slate-100 text-slate-700',
@@ -12,23 +13,44 @@ const STATUS_BADGE: Record<string, string> = {
   approved: 'bg-emerald-100 text-emerald-700',
 };
 
-const OFFER_STATUS_BADGE: Record<string, string> = {
-  accepted: 'bg-emerald-100 text-emerald-700',
-  pending: 'bg-amber-100 text-amber-700',
-  cancelled: 'bg-slate-100 text-slate-600',
-  declined: 'bg-rose-100 text-rose-700',
+const PAYSLIP_STATUS_BADGE: Record<string, string> = {
+  completed: 'bg-emerald-100 text-emerald-700',
+  processing: 'bg-amber-100 text-amber-700',
+  overdue: 'bg-rose-100 text-rose-700',
+  failed: 'bg-rose-100 text-rose-700',
 };
 
+function formatHours(value: string) {
+  return `${Number(value).toLocaleString(undefined, { maximumFractionDigits: 2 })} h`;
+}
+
 export default function EmployerWorkersPage() {
   const { user, initializing, unauthorized } = useAuthRedirect('/auth/login', {
     requiredRole: 'employer',
     unauthorizedRedirectTo: '/',
   });
 
-  const { data: workers, error, isLoading } = useSWR<JobOffer[]>(
-    user?.is_employer ? ['employer-workers'] : null,
-    fetchEmployerWorkers
+  const { data: firstPage, error, isLoading } = useSWR<WorkerRosterPage>(
+    user?.is_employer ? ['employer-roster'] : null,
+    () => fetchEmployerRoster()
   );
+  const [morePages, setMorePages] = useState<WorkerRosterPage[]>([]);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const workers: WorkerRosterRow[] = [firstPage, ...morePages].flatMap((page) => page?.results ?? []);
+  const nextUrl = morePages.length ? morePages[morePages.length - 1].next : firstPage?.next;
+
+  const loadMore = async () => {
+    if (!nextUrl) {
+      return;
+    }
+    setLoadingMore(true);
+    try {
+      const page = await fetchEmployerRoster(nextUrl);
+      setMorePages((pages) => [...pages, page]);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   if (initializing || !user) {
     return (
@@ -71,40 +93,42 @@ export default function EmployerWorkersPage() {
 
         {isLoading ? (
           <p className="text-slate-500">Loading workers…</p>
-        ) : !workers?.length ? (
+        ) : !workers.length ? (
           <div className="rounded-3xl border border-dashed border-slate-200 p-8 text-center text-slate-500">
             No accepted offers yet. Once a traveller accepts, they will appear here for ongoing management.
           </div>
         ) : (
           <div className="grid gap-4">
-            {workers.map((offer) => {
-              const timesheetStatus = offer.timesheet?.status || 'draft';
+            {workers.map((worker) => {
+              const timesheetStatus = worker.timesheet_status || 'draft';
               return (
                 <article
-                  key={offer.id}
+                  key={worker.offer}
                   className="rounded-3xl border border-slate-200 bg-white p-6 shadow-sm"
                 >
                   <div className="flex flex-col gap-4 md:flex-row md:items-center md:justify-between">
                     <div>
                       <p className="text-xs uppercase tracking-wide text-slate-400">Traveller</p>
                       <h2 className="text-xl font-semibold text-slate-900">
-                        {offer.traveller_name || 'Unnamed traveller'}
+                        {worker.traveller_name || 'Unnamed traveller'}
                       </h2>
-                      <p className="text-sm text-slate-500">{offer.job_title || 'Untitled job'}</p>
+                      <p className="text-sm text-slate-500">{worker.job_title || 'Untitled job'}</p>
                       <p className="text-sm text-slate-500">
-                        {new Date(offer.start_date).toLocaleDateString()} →{' '}
-                        {offer.end_date ? new Date(offer.end_date).toLocaleDateString() : 'Flexible'}
+                        {new Date(worker.start_date).toLocaleDateString()} →{' '}
+                        {worker.end_date ? new Date(worker.end_date).toLocaleDateString() : 'Flexible'}
                       </p>
                     </div>
                     <div className="flex flex-wrap gap-2">
-                      <span
-                        className={clsx(
-                          'rounded-full px-3 py-1 text-xs font-semibold',
-                          OFFER_STATUS_BADGE[offer.status] || 'bg-slate-100 text-slate-600'
-                        )}
-                      >
-                        {offer.status.replace('_', ' ').toUpperCase()}
-                      </span>
+                      {worker.last_payslip_status && (
+                        <span
+                          className={clsx(
+                            'rounded-full px-3 py-1 text-xs font-semibold',
+                            PAYSLIP_STATUS_BADGE[worker.last_payslip_status] || 'bg-slate-100 text-slate-600'
+                          )}
+                        >
+                          Last payslip: {worker.last_payslip_status.toUpperCase()}
+                        </span>
+                      )}
                       <span
                         className={clsx(
                           'rounded-full px-3 py-1 text-xs font-semibold',
@@ -115,15 +139,35 @@ export default function EmployerWorkersPage() {
                       </span>
                     </div>
                   </div>
+                  <dl className="mt-4 grid grid-cols-2 gap-3 text-sm sm:grid-cols-4">
+                    <div>
+                      <dt className="text-xs uppercase tracking-wide text-slate-400">Hours to date</dt>
+                      <dd className="font-semibold text-slate-900">{formatHours(worker.total_hours)}</dd>
+                    </div>
+                    <div>
+                      <dt className="text-xs uppercase tracking-wide text-slate-400">Awaiting approval</dt>
+                      <dd className="font-semibold text-slate-900">{formatHours(worker.pending_hours)}</dd>
+                    </div>
+                    <div>
+                      <dt className="text-xs uppercase tracking-wide text-slate-400">Approved, unpaid</dt>
+                      <dd className="font-semibold text-slate-900">{formatHours(worker.approved_unpaid_hours)}</dd>
+                    </div>
+                    <div>
+                      <dt className="text-xs uppercase tracking-wide text-slate-400">Last paid</dt>
+                      <dd className="font-semibold text-slate-900">
+                        {worker.last_paid_at ? new Date(worker.last_paid_at).toLocaleDateString() : 'Never'}
+                      </dd>
+                    </div>
+                  </dl>
                   <div className="mt-4 flex flex-wrap gap-3">
                     <Link
-                      href={`/employer/workers/${offer.application}`}
+                      href={`/employer/workers/${worker.application}`}
                       className="rounded-full border border-slate-200 px-4 py-2 text-sm font-semibold text-slate-700 hover:border-brand-300 hover:text-brand-600"
                     >
                       View details
                     </Link>
                     <Link
-                      href={`/messages?conversation=${offer.application}`}
+                      href={`/messages?conversation=${worker.application}`}
                       className="rounded-full border border-slate-200 px-4 py-2 text-sm text-slate-600 hover:border-slate-300"
                     >
                       Message traveller
@@ -132,6 +176,16 @@ export default function EmployerWorkersPage() {
                 </article>
               );
             })}
+            {nextUrl && (
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="justify-self-center rounded-full border border-slate-200 px-4 py-2 text-sm font-semibold text-slate-700 hover:border-brand-300 hover:text-brand-600 disabled:opacity-60"
+              >
+                {loadingMore ? 'Loading…' : 'Load more workers'}
+              </button>
+            )}
           </div>
         )}
       </div>
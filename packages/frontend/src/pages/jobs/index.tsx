@@ -139,6 +139,15 @@ export default function JobsPage() {
                 </select>
               </div>
             </label>
+            <label className="flex items-center gap-2 text-sm font-medium text-slate-600">
+              <input
+                type="checkbox"
+                checked={Boolean(formFilters.regional)}
+                onChange={(event) => setFormFilters((prev) => ({ ...prev, regional: event.target.checked || undefined }))}
+                className="rounded border-slate-300"
+              />
+              Regional jobs only
+            </label>
             <div className="flex items-end gap-3">
               <button
                 type="submit"
@@ -167,6 +176,7 @@ export default function JobsPage() {
               {filters.state ? `State: ${filters.state}` : 'All states'}
               {filters.region ? ` · Region: ${filters.region}` : ''}
               {filters.city ? ` · City: ${filters.city}` : ''}
+              {filters.regional ? ' · Regional only' : ''}
             </span>
           </div>
 
@@ -183,6 +193,11 @@ export default function JobsPage() {
                       <h2 className="text-xl font-semibold text-slate-900">{job.title}</h2>
                       <p className="text-sm text-slate-500">
                         {job.location_city || job.location} · {job.location_state || 'Australia'}
+                        {job.location_class === 'regional' || job.location_class === 'remote' ? (
+                          <span className="ml-2 rounded-full bg-emerald-50 px-2 py-0.5 text-xs font-medium text-emerald-700">
+                            {job.location_class === 'remote' ? 'Remote' : 'Regional'}
+                          </span>
+                        ) : null}
                       </p>
                     </div>
                     <div className="text-right">
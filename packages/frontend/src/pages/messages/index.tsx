@@ -7,9 +7,11 @@ import clsx from 'clsx';
 import { Layout } from '../../components/Layout';
 import {
   ApplicationCardMessageMetadata,
+  ConversationPage,
   ConversationSummary,
   JobOfferMessageMetadata,
   MessageEnvelope,
+  fetchConversation,
   fetchConversations,
   fetchConversationMessages,
   sendConversationReply,
@@ -224,11 +226,48 @@ export default function MessagesPage() {
   const scrollRef = useRef<HTMLDivElement | null>(null);
 
   const {
-    data: conversations,
+    data: firstPage,
     error: conversationsError,
     isLoading: loadingConversations,
     mutate: mutateConversations,
-  } = useSWR<ConversationSummary[]>(user ? ['conversations'] : null, fetchConversations);
+  } = useSWR<ConversationPage>(user ? ['conversations'] : null, () => fetchConversations());
+  const [morePages, setMorePages] = useState<ConversationPage[]>([]);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadedConversations = useMemo(() => {
+    const seen = new Set<number>();
+    return [firstPage, ...morePages]
+      .flatMap((page) => page?.results ?? [])
+      .filter((conversation) => !seen.has(conversation.id) && seen.add(conversation.id));
+  }, [firstPage, morePages]);
+  // A deep link may point at a conversation beyond the loaded pages; fetch that one on its own.
+  const needsLinkedConversation =
+    !!firstPage &&
+    !!selectedConversationId &&
+    !loadedConversations.some((conversation) => conversation.id === selectedConversationId);
+  const { data: linkedConversation } = useSWR<ConversationSummary>(
+    needsLinkedConversation ? ['conversation', selectedConversationId] : null,
+    () => fetchConversation(selectedConversationId as number)
+  );
+  const conversations = useMemo(() => {
+    if (!linkedConversation || loadedConversations.some((conversation) => conversation.id === linkedConversation.id)) {
+      return loadedConversations;
+    }
+    return [linkedConversation, ...loadedConversations];
+  }, [linkedConversation, loadedConversations]);
+  const nextUrl = morePages.length ? morePages[morePages.length - 1].next : firstPage?.next;
+
+  const loadMoreConversations = async () => {
+    if (!nextUrl) {
+      return;
+    }
+    setLoadingMore(true);
+    try {
+      const page = await fetchConversations(nextUrl);
+      setMorePages((pages) => [...pages, page]);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
   const {
     data: messages,
     error: messagesError,
@@ -240,7 +279,7 @@ export default function MessagesPage() {
   );
 
   useEffect(() => {
-    if (!selectedConversationId && conversations && conversations.length) {
+    if (!selectedConversationId && firstPage) {
       const queryConv = router.query.conversation;
       if (queryConv) {
         const numericId = Number(queryConv);
@@ -249,9 +288,11 @@ export default function MessagesPage() {
           return;
         }
       }
-      setSelectedConversationId(conversations[0].id);
+      if (conversations.length) {
+        setSelectedConversationId(conversations[0].id);
+      }
     }
-  }, [conversations, selectedConversationId, router.query.conversation]);
+  }, [firstPage, conversations, selectedConversationId, router.query.conversation]);
 
   const activeConversation = useMemo(() => {
     return conversations?.find((conv) => conv.id === selectedConversationId) ?? null;
@@ -333,6 +374,16 @@ export default function MessagesPage() {
             {!conversations?.length && !loadingConversations && (
               <p className="text-sm text-slate-500">No conversations yet.</p>
             )}
+            {nextUrl && (
+              <button
+                type="button"
+                onClick={loadMoreConversations}
+                disabled={loadingMore}
+                className="w-full rounded-full border border-slate-200 px-4 py-2 text-sm font-semibold text-slate-700 hover:border-brand-300 hover:text-brand-600 disabled:opacity-60"
+              >
+                {loadingMore ? 'Loading…' : 'Load more conversations'}
+              </button>
+            )}
           </div>
         </aside>
 
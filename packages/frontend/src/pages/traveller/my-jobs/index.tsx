@@ -4,7 +4,7 @@ import clsx from 'clsx';
 
 import { Layout } from '../../../components/Layout';
 import { useAuthRedirect } from '../../../hooks/useAuthRedirect';
-import { JobOffer, fetchTravellerJobs } from '../../../lib/api';
+import { JobOfferListItem, fetchTravellerJobs } from '../../../lib/api';
 
 const STATUS_BADGE: Record<string, string> = {
   accepted: 'bg-emerald-100 text-emerald-700',
@@ -25,7 +25,7 @@ export default function TravellerJobsPage() {
     unauthorizedRedirectTo: '/',
   });
 
-  const { data: jobs, error, isLoading } = useSWR<JobOffer[]>(
+  const { data: jobs, error, isLoading } = useSWR<JobOfferListItem[]>(
     user?.is_traveller ? ['traveller-jobs'] : null,
     fetchTravellerJobs
   );